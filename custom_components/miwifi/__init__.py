@@ -20,13 +20,17 @@ from .const import (
     CONF_ACTIVITY_DAYS,
     CONF_ENCRYPTION_ALGORITHM,
     CONF_IS_FORCE_LOAD,
+    CONF_MEDIUM_SCAN_INTERVAL,
+    CONF_SLOW_SCAN_INTERVAL,
     CONF_ENABLE_PANEL,
     CONF_WAN_SPEED_UNIT,
     CONF_LOG_LEVEL,
     DEFAULT_ACTIVITY_DAYS,
     DEFAULT_ENABLE_PANEL,
+    DEFAULT_MEDIUM_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_SLEEP,
+    DEFAULT_SLOW_SCAN_INTERVAL,
     DEFAULT_TIMEOUT,
     DOMAIN,
     OPTION_IS_FROM_FLOW,
@@ -34,7 +38,7 @@ from .const import (
     UPDATE_LISTENER,
     UPDATER,
 )
-from .logger import _LOGGER
+from .logger import _LOGGER, set_log_directory
 from .discovery import async_start_discovery
 from .enum import EncryptionAlgorithm
 from .helper import (
@@ -46,19 +50,23 @@ from .helper import (
     set_global_panel_state,
 )
 from .services import SERVICES
-from .updater import LuciUpdater
+from .updater import LuciUpdater, async_get_registry
 from .frontend import (
     async_download_panel_if_needed,
     async_register_panel,
+    async_get_panel_version_service,
+    async_load_manual_main_mac,
     async_remove_miwifi_panel,
-    read_local_version,
-    async_start_panel_monitor
+    async_start_panel_monitor,
+    async_stop_panel_monitor,
 )
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Initialize domain level services."""
 
+    set_log_directory(hass)
+
     async def handle_apply_config(service_call: ServiceCall) -> None:
         data = service_call.data
         log_level = data.get("log_level")
@@ -101,17 +109,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     log_level = await get_global_log_level(hass)
     _LOGGER.setLevel(getattr(logging, log_level.upper(), logging.WARNING))
 
+    # Manual main router selection, kept in memory for topology refreshes
+    await async_load_manual_main_mac(hass)
+
     # Config panel Frontend
     try:
         panel_enabled = await get_global_panel_state(hass)
         if panel_enabled:
-            local_version = await read_local_version(hass)
+            local_version = await async_get_panel_version_service(
+                hass
+            ).async_load_local_version()
             await async_register_panel(hass, local_version)
 
             # ⬇ Aquí colocamos el monitor
-            await async_start_panel_monitor(hass)
+            async_start_panel_monitor(hass)
 
         else:
+            async_stop_panel_monitor(hass)
             await async_remove_miwifi_panel(hass)
     except Exception as e:
         _LOGGER.warning(f"[MiWiFi] Error gestionando el panel: {e}")
@@ -133,6 +147,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         get_config_value(entry, CONF_ACTIVITY_DAYS, DEFAULT_ACTIVITY_DAYS),
         get_store(hass, _ip),
         entry_id=entry.entry_id,
+        medium_scan_interval=get_config_value(entry, CONF_MEDIUM_SCAN_INTERVAL, DEFAULT_MEDIUM_SCAN_INTERVAL),
+        slow_scan_interval=get_config_value(entry, CONF_SLOW_SCAN_INTERVAL, DEFAULT_SLOW_SCAN_INTERVAL),
     )
 
     hass.data.setdefault(DOMAIN, {})
@@ -143,6 +159,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data[DOMAIN][entry.entry_id][UPDATE_LISTENER] = entry.add_update_listener(
         async_update_options
     )
+    async_get_registry(hass).async_register(entry.entry_id, _ip, _updater)
 
     await _updater.async_config_entry_first_refresh()
     if not _updater.last_update_success:
@@ -176,13 +193,16 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     try:
         panel_enabled = await get_global_panel_state(hass)
         if panel_enabled:
-            local_version = await read_local_version(hass)
+            local_version = await async_get_panel_version_service(
+                hass
+            ).async_load_local_version()
             await async_register_panel(hass, local_version)
 
             # ⬇ Aquí colocamos el monitor
-            await async_start_panel_monitor(hass)
+            async_start_panel_monitor(hass)
 
         else:
+            async_stop_panel_monitor(hass)
             await async_remove_miwifi_panel(hass)
     except Exception as e:
         _LOGGER.warning(f"[MiWiFi] Error gestionando el panel: {e}")
@@ -200,6 +220,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _update_listener: CALLBACK_TYPE = hass.data[DOMAIN][entry.entry_id][UPDATE_LISTENER]
         _update_listener()
         hass.data[DOMAIN].pop(entry.entry_id)
+        async_get_registry(hass).async_unregister(entry.entry_id)
     return is_unload
 
 
@@ -99,6 +99,10 @@ class MiWifiButton(MiWifiEntity, ButtonEntity):
         except LuciError as _e:
             _LOGGER.debug("Reboot error: %r", _e)
 
+            return
+
+        self._updater.async_request_stage_refresh("status")
+
     async def async_press(self) -> None:
         """Async press action."""
 
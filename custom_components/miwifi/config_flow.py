@@ -19,9 +19,13 @@ from .const import (
     CONF_ENCRYPTION_ALGORITHM,
     CONF_IS_FORCE_LOAD,
     CONF_IS_TRACK_DEVICES,
+    CONF_MEDIUM_SCAN_INTERVAL,
+    CONF_SLOW_SCAN_INTERVAL,
     CONF_STAY_ONLINE,
     DEFAULT_ACTIVITY_DAYS,
+    DEFAULT_MEDIUM_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SLOW_SCAN_INTERVAL,
     DEFAULT_STAY_ONLINE,
     DEFAULT_TIMEOUT,
     DOMAIN,
@@ -200,6 +204,8 @@ class MiWifiOptionsFlow(config_entries.OptionsFlow):
                     vol.Required(CONF_IS_TRACK_DEVICES, default=get_config_value(self._config_entry, CONF_IS_TRACK_DEVICES, True)): cv.boolean,
                     vol.Required(CONF_STAY_ONLINE, default=get_config_value(self._config_entry, CONF_STAY_ONLINE, DEFAULT_STAY_ONLINE)): cv.positive_int,
                     vol.Required(CONF_SCAN_INTERVAL, default=get_config_value(self._config_entry, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)): vol.All(vol.Coerce(int), vol.Range(min=10)),
+                    vol.Optional(CONF_MEDIUM_SCAN_INTERVAL, default=get_config_value(self._config_entry, CONF_MEDIUM_SCAN_INTERVAL, DEFAULT_MEDIUM_SCAN_INTERVAL)): vol.All(vol.Coerce(int), vol.Range(min=10)),
+                    vol.Optional(CONF_SLOW_SCAN_INTERVAL, default=get_config_value(self._config_entry, CONF_SLOW_SCAN_INTERVAL, DEFAULT_SLOW_SCAN_INTERVAL)): vol.All(vol.Coerce(int), vol.Range(min=60)),
                     vol.Optional(CONF_ACTIVITY_DAYS, default=get_config_value(self._config_entry, CONF_ACTIVITY_DAYS, DEFAULT_ACTIVITY_DAYS)): cv.positive_int,
                     vol.Optional(CONF_TIMEOUT, default=get_config_value(self._config_entry, CONF_TIMEOUT, DEFAULT_TIMEOUT)): vol.All(vol.Coerce(int), vol.Range(min=10)),
                     vol.Optional(CONF_WAN_SPEED_UNIT, default=get_config_value(self._config_entry, CONF_WAN_SPEED_UNIT, DEFAULT_WAN_SPEED_UNIT)): vol.In(WAN_SPEED_UNIT_OPTIONS),
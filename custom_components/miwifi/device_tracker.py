@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from .logger import _LOGGER
-import socket
+import asyncio
+import contextlib
 import time
-from contextlib import closing
 from functools import cached_property
 from typing import Any, Final
 
@@ -16,15 +16,11 @@ SOURCE_TYPE_ROUTER = "router"
 
 from homeassistant.components.device_tracker.config_entry import ScannerEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.entity_platform import (
-    AddEntitiesCallback,
-    EntityPlatform,
-    async_get_current_platform,
-)
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
@@ -51,21 +47,31 @@ from .const import (
     ATTRIBUTION,
     CONF_IS_TRACK_DEVICES,
     CONF_STAY_ONLINE,
+    DATA_PORT_PROBER,
     DEFAULT_CALL_DELAY,
+    DEFAULT_CHECK_TIMEOUT,
+    DEFAULT_PORT_PROBE_CONCURRENCY,
+    DEFAULT_PORT_PROBE_TTL,
     DEFAULT_STAY_ONLINE,
     DOMAIN,
     SIGNAL_NEW_DEVICE,
-    UPDATER,
 )
 from .enum import Connection, DeviceClass
 from .helper import (
+    async_load_manufacturers,
     detect_manufacturer,
     generate_entity_id,
     get_config_value,
-    parse_last_activity,
     pretty_size,
 )
-from .updater import LuciUpdater, async_get_updater
+from .updater import (
+    DeviceChanges,
+    DeviceRecord,
+    LuciUpdater,
+    as_device_record,
+    async_get_registry,
+    async_get_updater,
+)
 
 PARALLEL_UPDATES = 0
 
@@ -84,6 +90,118 @@ ATTR_CHANGES: Final = (
 CONFIGURATION_PORTS: Final = [80, 443]
 
 
+def _last_activity(device: DeviceRecord) -> int:
+    """Last activity as epoch seconds.
+
+    :param device: DeviceRecord: Device record
+    :return int
+    """
+
+    value = device.raw(ATTR_TRACKER_LAST_ACTIVITY)
+
+    return value if isinstance(value, int) else 0
+
+
+class PortProber:
+    """Non-blocking TCP port prober shared by all device trackers."""
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_PORT_PROBE_CONCURRENCY,
+        timeout: int = DEFAULT_CHECK_TIMEOUT,
+        ttl: int = DEFAULT_PORT_PROBE_TTL,
+    ) -> None:
+        """Initialize prober.
+
+        :param concurrency: int: Maximum hosts probed at once
+        :param timeout: int: Connect timeout in seconds
+        :param ttl: int: Result cache lifetime in seconds
+        """
+
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._timeout: int = timeout
+        self._ttl: int = ttl
+        self._cache: dict[str, tuple[float, int | None]] = {}
+        self._pending: dict[str, asyncio.Future] = {}
+
+    async def async_probe(self, ip: str, ports: list[int]) -> int | None:
+        """Return the first open port, in order of preference.
+
+        :param ip: str: Host ip address
+        :param ports: list[int]: Ports to probe
+        :return int | None: Open port
+        """
+
+        if (cached := self._cache.get(ip)) is not None and (
+            time.monotonic() - cached[0] < self._ttl
+        ):
+            return cached[1]
+
+        if ip not in self._pending:
+            self._pending[ip] = asyncio.ensure_future(self._async_probe(ip, ports))
+
+        try:
+            port: int | None = await asyncio.shield(self._pending[ip])
+        finally:
+            if ip in self._pending and self._pending[ip].done():
+                del self._pending[ip]
+
+        self._cache[ip] = (time.monotonic(), port)
+
+        return port
+
+    async def _async_probe(self, ip: str, ports: list[int]) -> int | None:
+        """Probe all ports of a host concurrently.
+
+        :param ip: str: Host ip address
+        :param ports: list[int]: Ports to probe
+        :return int | None: Open port
+        """
+
+        async with self._semaphore:
+            results: list[bool] = await asyncio.gather(
+                *[self._async_is_open(ip, port) for port in ports]
+            )
+
+        return next((port for port, is_open in zip(ports, results) if is_open), None)
+
+    async def _async_is_open(self, ip: str, port: int) -> bool:
+        """Check if a port accepts connections.
+
+        :param ip: str: Host ip address
+        :param port: int: Port
+        :return bool: Is open
+        """
+
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(ip, port), self._timeout
+            )
+        except (OSError, asyncio.TimeoutError):
+            return False
+
+        writer.close()
+
+        with contextlib.suppress(OSError):
+            await writer.wait_closed()
+
+        return True
+
+
+@callback
+def async_get_port_prober(hass: HomeAssistant) -> PortProber:
+    """Return shared port prober.
+
+    :param hass: HomeAssistant: Home Assistant object
+    :return PortProber
+    """
+
+    if DATA_PORT_PROBER not in hass.data:
+        hass.data[DATA_PORT_PROBER] = PortProber()
+
+    return hass.data[DATA_PORT_PROBER]
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -98,6 +216,10 @@ async def async_setup_entry(
 
     updater: LuciUpdater = async_get_updater(hass, config_entry.entry_id)
 
+    await async_load_manufacturers(hass)
+
+    entities: dict[str, MiWifiDeviceTracker] = {}
+
     @callback
     def add_device(new_device: dict) -> None:
         """Add device.
@@ -120,29 +242,28 @@ async def async_setup_entry(
             _LOGGER.warning("Device without MAC found: %s", new_device)
             return
 
-        try:
-            platform: EntityPlatform = async_get_current_platform()
-        except RuntimeError as _e:  # pragma: no cover
-            return
-
         unique_id = f"{DOMAIN}-{config_entry.entry_id}-{mac}"
 
-        existing_entity = next((e for e in platform.entities.values() if e.unique_id == unique_id), None)
+        if existing_entity := entities.get(unique_id):
+            existing_entity._set_device(as_device_record(new_device))
+
+            if existing_entity.hass is not None:
+                existing_entity.async_write_ha_state()
 
-        if existing_entity:
-            existing_entity._device = dict(new_device)
-            existing_entity.async_write_ha_state()
             return
 
-        async_add_entities([
-            MiWifiDeviceTracker(
-                unique_id,
-                entity_id,
-                new_device,
-                updater,
-                get_config_value(config_entry, CONF_STAY_ONLINE, DEFAULT_STAY_ONLINE),
-            )
-        ])
+        entity = MiWifiDeviceTracker(
+            unique_id,
+            entity_id,
+            new_device,
+            updater,
+            get_config_value(config_entry, CONF_STAY_ONLINE, DEFAULT_STAY_ONLINE),
+        )
+
+        entities[unique_id] = entity
+        entity.async_on_remove(lambda: entities.pop(unique_id, None))
+
+        async_add_entities([entity])
 
     for device in updater.devices.values():
         add_device(device)
@@ -160,6 +281,9 @@ class MiWifiDeviceTracker(ScannerEntity, CoordinatorEntity):
     _attr_device_class: str = DeviceClass.DEVICE_TRACKER
 
     _configuration_port: int | None = None
+    _probed_ip: str | None = None
+    _registry_values: tuple | None = None
+    _registry_device_id: str | None = None
     _is_connected: bool = False
 
     def __init__(  # pylint: disable=too-many-arguments
@@ -181,7 +305,10 @@ class MiWifiDeviceTracker(ScannerEntity, CoordinatorEntity):
 
         CoordinatorEntity.__init__(self, coordinator=updater)
 
-        self._device: dict = dict(device)
+        self._device: DeviceRecord
+        self._last_activity: int = 0
+        self._compared_values: tuple = ()
+        self._set_device(as_device_record(device))
         self._updater: LuciUpdater = updater
 
         self._attr_name = device.get(ATTR_TRACKER_NAME, self.mac_address)
@@ -200,11 +327,27 @@ class MiWifiDeviceTracker(ScannerEntity, CoordinatorEntity):
 
         await CoordinatorEntity.async_added_to_hass(self)
 
+        self.async_on_remove(
+            self.hass.bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED, self._handle_registry_update
+            )
+        )
+
         self.hass.loop.call_later(
             DEFAULT_CALL_DELAY,
             lambda: self.hass.async_create_task(self.check_ports()),
         )
 
+    @callback
+    def _handle_registry_update(self, event: Event) -> None:
+        """Sync the device entry again after it was changed.
+
+        :param event: Event: Device registry event
+        """
+
+        if event.data.get("device_id") == self._registry_device_id:
+            self._registry_values = None
+
     @property
     def available(self) -> bool:
         """Is available
@@ -374,8 +517,6 @@ class MiWifiDeviceTracker(ScannerEntity, CoordinatorEntity):
     def _handle_coordinator_update(self) -> None:
         """Update state."""
 
-        is_available: bool = self._updater.data.get(ATTR_STATE, False)
-
         device = self._updater.devices.get(self.mac_address, None)
 
         if device is None or self._device is None:
@@ -386,52 +527,90 @@ class MiWifiDeviceTracker(ScannerEntity, CoordinatorEntity):
 
             return
 
+        updater: LuciUpdater = self._updater
         device = self._update_entry(device)
 
-        before: int = parse_last_activity(
-            str(self._device.get(ATTR_TRACKER_LAST_ACTIVITY))
-        )
-        current: int = parse_last_activity(str(device.get(ATTR_TRACKER_LAST_ACTIVITY)))
+        is_available: bool = self._updater.data.get(ATTR_STATE, False)
+
+        # Unchanged devices that were seen again, or are already disconnected,
+        # cannot change state in this poll.
+        changes: DeviceChanges | None = self._updater.device_changes
+
+        if (
+            changes is not None
+            and self._updater == updater
+            and self._attr_available == is_available
+            and self.mac_address not in changes
+            and (self.mac_address in changes.present or not self._is_connected)
+        ):
+            self._set_device(device)
+
+            return
+
+        before: int = self._last_activity
+        current: int = _last_activity(device)
 
         is_connected = current > before
 
         if before == current:
             is_connected = (int(time.time()) - current) <= (self._stay_online)
-            
-        attr_changed: list = [
-            attr
-            for attr in ATTR_CHANGES
-            if self._device.get(attr, None) != device.get(attr, None)
-        ]
 
-        if (
-            self._attr_available == is_available
-            and self._is_connected == is_connected
-            and not attr_changed
-        ):
+        is_changed: bool = (
+            self._attr_available != is_available
+            or self._is_connected != is_connected
+            or self._compared_values != device.snapshot(ATTR_CHANGES)
+        )
+
+        self._set_device(device)
+
+        if not is_changed:
             return
 
         self._attr_available = is_available
         self._is_connected = is_connected
-        self._device = dict(device)
 
         self.async_write_ha_state()
 
-    def _update_entry(self, track_device: dict) -> dict:
+        if self.ip_address != self._probed_ip:
+            self.hass.async_create_task(self.check_ports())
+
+    def _set_device(self, device: DeviceRecord) -> None:
+        """Share the updater record and remember the values compared on updates.
+
+        The record belongs to the updater and is never modified here.
+
+        :param device: DeviceRecord: Device record
+        """
+
+        self._device = device
+        self._last_activity = _last_activity(device)
+        self._compared_values = device.snapshot(ATTR_CHANGES)
+
+    def _update_entry(self, track_device: DeviceRecord) -> DeviceRecord:
         """Update device entry.
 
-        :param track_device: dict: Track device
-        :return dict
+        :param track_device: DeviceRecord: Track device
+        :return DeviceRecord
         """
 
         entry_id: str | None = track_device.get(ATTR_TRACKER_ENTRY_ID)
 
+        # The registry is only consulted again when a synced value changes
+        registry_values: tuple = (entry_id, self.configuration_url, self.manufacturer)
+
         device_registry: dr.DeviceRegistry = dr.async_get(self.hass)
-        device: dr.DeviceEntry | None = device_registry.async_get_device(
-            set(), {(dr.CONNECTION_NETWORK_MAC, self.mac_address)}
+        device: dr.DeviceEntry | None = (
+            device_registry.async_get_device(
+                set(), {(dr.CONNECTION_NETWORK_MAC, self.mac_address)}
+            )
+            if registry_values != self._registry_values
+            else None
         )
 
         if device is not None:
+            self._registry_values = registry_values
+            self._registry_device_id = device.id
+
             if len(device.config_entries) > 0 and entry_id not in device.config_entries:
                 device_registry.async_update_device(
                     device.id, add_config_entry_id=entry_id
@@ -448,11 +627,12 @@ class MiWifiDeviceTracker(ScannerEntity, CoordinatorEntity):
                 )
 
         if (
-            entry_id in self.hass.data[DOMAIN]
-            and self._updater != self.hass.data[DOMAIN][entry_id][UPDATER]
+            entry_id is not None
+            and (updater := async_get_registry(self.hass).get_by_entry_id(entry_id))
+            is not None
+            and self._updater != updater
         ):
-            self._updater = self.hass.data[DOMAIN][entry_id][UPDATER]
-            self._device[ATTR_TRACKER_ENTRY_ID] = entry_id
+            self._updater = updater
             track_device = self._updater.devices.get(self.mac_address, track_device)
 
         return track_device
@@ -460,17 +640,10 @@ class MiWifiDeviceTracker(ScannerEntity, CoordinatorEntity):
     async def check_ports(self) -> None:
         """Scan port to configuration url"""
 
-        if self.ip_address is None:
+        if self.ip_address is None or self.ip_address == self._probed_ip:
             return
 
-        with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as sock:
-            sock.settimeout(5)
-
-            for port in CONFIGURATION_PORTS:
-                result = sock.connect_ex((self.ip_address, port))
-                if result == 0:
-                    self._configuration_port = port
-
-                    #_LOGGER.debug("Found open port %s: %s", self.ip_address, port)
-
-                    break
\ No newline at end of file
+        self._probed_ip = self.ip_address
+        self._configuration_port = await async_get_port_prober(self.hass).async_probe(
+            self.ip_address, CONFIGURATION_PORTS
+        )
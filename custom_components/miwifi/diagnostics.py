@@ -44,9 +44,17 @@ async def async_get_config_entry_diagnostics(
             _data["data"] = async_redact_data(_updater.data, TO_REDACT)
 
         if hasattr(_updater, "devices"):
-            _data["devices"] = _updater.devices
+            _data["devices"] = {
+                mac: dict(device) for mac, device in _updater.devices.items()
+            }
 
         if len(_updater.luci.diagnostics) > 0:
             _data["requests"] = async_redact_data(_updater.luci.diagnostics, TO_REDACT)
 
+        if _updater.luci.metrics.count > 0:
+            _data["metrics"] = _updater.luci.metrics.as_dict()
+
+        if len(_updater.profiler.total) > 0:
+            _data["stages"] = _updater.profiler.as_dict()
+
     return _data
@@ -178,6 +178,14 @@ class EncryptionAlgorithm(StrEnum):
     SHA256 = "sha256"
 
 
+class Cadence(StrEnum):
+    """Cadence enum"""
+
+    FAST = "fast"
+    MEDIUM = "medium"
+    SLOW = "slow"
+
+
 class DeviceClass(StrEnum):
     """DeviceClass enum"""
 
@@ -1,29 +1,270 @@
 """Handle MiWiFi Frontend panel."""
 
+from __future__ import annotations
+
+import asyncio
+import hashlib
 import os
 import json
+import time
+from datetime import datetime, timedelta
 import aiohttp
+from aiohttp import hdrs
 
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.components.frontend import async_register_built_in_panel, async_remove_panel
 from homeassistant.components.frontend import DATA_PANELS, Panel
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
 from .const import (
+    DATA_MAIN_ROUTER,
+    DATA_PANEL_VERSION,
     PANEL_REPO_VERSION_URL,
     PANEL_REPO_FILES_URL,
     PANEL_REPO_BASE_URL,
     PANEL_LOCAL_PATH,
+    PANEL_DOWNLOAD_CHUNK_SIZE,
+    PANEL_DOWNLOAD_CONCURRENCY,
+    PANEL_MANIFEST_FILE,
     PANEL_STORAGE_FILE,
     DEFAULT_PANEL_VERSION,
+    MAIN_ROUTER_SAVE_DELAY,
+    MAIN_ROUTER_STORE,
     MAIN_ROUTER_STORE_FILE,
-    PANEL_MONITOR_INTERVAL,
+    MAIN_ROUTER_STORE_VERSION,
+    UPDATER,
+    PANEL_MONITOR_RETRY_INTERVAL,
+    PANEL_VERSION_CHECK_INTERVAL,
 )
 from .logger import _LOGGER
 
 
 DEFAULT_PANEL_VERSION = "1.2.3" # Minimum version required v 1.2.3
 
+ATTR_PANEL_LOCAL_VERSION = "panel_local_version"
+ATTR_PANEL_REMOTE_VERSION = "panel_remote_version"
+
+
+class PanelVersionService:
+    """Shared panel version state and the single panel monitor.
+
+    The local version is kept in memory and the remote one is refreshed on
+    its own interval, so router polls never touch disk or network for it.
+    """
+
+    local_version: str | None = None
+    remote_version: str | None = None
+
+    last_check: datetime | None = None
+    last_check_duration: float | None = None
+    failures: int = 0
+
+    _etag: str | None = None
+    _is_started: bool = False
+    _check_task: asyncio.Task | None = None
+    _unsub_check: CALLBACK_TYPE | None = None
+    _unsub_stop: CALLBACK_TYPE | None = None
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize service.
+
+        :param hass: HomeAssistant: Home Assistant object
+        """
+
+        self.hass: HomeAssistant = hass
+
+    @property
+    def versions(self) -> dict[str, str]:
+        """Known versions in updater data format.
+
+        :return dict[str, str]
+        """
+
+        versions: dict[str, str] = {}
+
+        if self.local_version is not None:
+            versions[ATTR_PANEL_LOCAL_VERSION] = self.local_version
+
+        if self.remote_version is not None:
+            versions[ATTR_PANEL_REMOTE_VERSION] = self.remote_version
+
+        return versions
+
+    async def async_load_local_version(self) -> str:
+        """Read the local version once and keep it in memory.
+
+        :return str: Local version
+        """
+
+        if self.local_version is None:
+            self.local_version = await read_local_version(self.hass)
+
+        return self.local_version
+
+    @callback
+    def async_set_local_version(self, version: str) -> None:
+        """Set local version after an install.
+
+        :param version: str: Installed version
+        """
+
+        if version != self.local_version:
+            self.local_version = version
+            self._async_publish()
+
+    async def async_check_remote_version(self) -> str | None:
+        """Fetch the remote version, revalidating with the last ETag.
+
+        :return str | None: Remote version
+        """
+
+        headers: dict[str, str] = {}
+        if self._etag is not None and self.remote_version is not None:
+            headers[hdrs.IF_NONE_MATCH] = self._etag
+
+        session: aiohttp.ClientSession = async_get_clientsession(self.hass)
+        async with session.get(PANEL_REPO_VERSION_URL, headers=headers) as resp:
+            if resp.status == 304:
+                return self.remote_version
+
+            resp.raise_for_status()
+            data: dict = json.loads(await resp.text())
+            self._etag = resp.headers.get(hdrs.ETAG)
+
+        version: str = data.get("version", "0.0")
+        if version != self.remote_version:
+            self.remote_version = version
+            self._async_publish()
+
+            if self.local_version is not None and version != self.local_version:
+                _LOGGER.warning(
+                    "[MiWiFi] New panel version available: %s (local: %s)",
+                    version,
+                    self.local_version,
+                )
+
+        return self.remote_version
+
+    @callback
+    def async_start(self) -> None:
+        """Start the panel monitor. Safe to call more than once."""
+
+        if self._is_started:
+            return
+
+        self._is_started = True
+        self._unsub_stop = self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_handle_stop
+        )
+        self._async_start_check()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop the panel monitor. Safe to call more than once."""
+
+        self._is_started = False
+
+        if self._unsub_check is not None:
+            self._unsub_check()
+            self._unsub_check = None
+
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+
+        if self._check_task is not None and not self._check_task.done():
+            self._check_task.cancel()
+
+        self._check_task = None
+
+    @callback
+    def _async_handle_stop(self, event: Event) -> None:
+        """Home Assistant is stopping.
+
+        :param event: Event: Stop event
+        """
+
+        self._unsub_stop = None
+        self.async_stop()
+
+    @callback
+    def _async_start_check(self, now: datetime | None = None) -> None:
+        """Run a check as the tracked check task, so stop can cancel it.
+
+        :param now: datetime | None: Fire time
+        """
+
+        self._unsub_check = None
+        self._check_task = self.hass.async_create_background_task(
+            self._async_scheduled_check(), "miwifi panel version check"
+        )
+
+    async def _async_scheduled_check(self) -> None:
+        """Check the remote version and schedule the next check.
+
+        Failed checks are retried with exponential backoff, starting at
+        PANEL_MONITOR_RETRY_INTERVAL and capped at the regular interval.
+        """
+
+        delay: timedelta = PANEL_VERSION_CHECK_INTERVAL
+
+        started: float = time.monotonic()
+        try:
+            await self.async_check_remote_version()
+        except Exception as e:
+            self.failures += 1
+            delay = min(
+                PANEL_MONITOR_RETRY_INTERVAL * 2 ** (self.failures - 1),
+                PANEL_VERSION_CHECK_INTERVAL,
+            )
+
+            _LOGGER.warning(
+                "[MiWiFi] Panel monitor error (retry in %s): %s", delay, e
+            )
+        else:
+            self.failures = 0
+        finally:
+            self.last_check = dt_util.utcnow()
+            self.last_check_duration = round(time.monotonic() - started, 3)
+
+        if self._is_started:
+            self._unsub_check = async_call_later(
+                self.hass, delay, self._async_start_check
+            )
+
+    @callback
+    def _async_publish(self) -> None:
+        """Push versions to every running updater."""
+
+        from .updater import async_get_registry
+
+        versions: dict[str, str] = self.versions
+        for integration in async_get_registry(self.hass).integrations.values():
+            updater = integration[UPDATER]
+            if updater.data is None:
+                continue
+
+            updater.data.update(versions)
+            updater.async_update_listeners()
+
+
+@callback
+def async_get_panel_version_service(hass: HomeAssistant) -> PanelVersionService:
+    """Return shared panel version service.
+
+    :param hass: HomeAssistant: Home Assistant object
+    :return PanelVersionService
+    """
+
+    if DATA_PANEL_VERSION not in hass.data:
+        hass.data[DATA_PANEL_VERSION] = PanelVersionService(hass)
+
+    return hass.data[DATA_PANEL_VERSION]
+
 
 async def async_download_panel_if_needed(hass: HomeAssistant) -> str:
     """Check and download panel if needed. Return the version."""
@@ -31,25 +272,25 @@ async def async_download_panel_if_needed(hass: HomeAssistant) -> str:
         return await read_local_version(hass)
 
     hass.data["_miwifi_panel_updating"] = True
-    async with aiohttp.ClientSession() as session:
-        try:
-            remote_version = await read_remote_version(session)
-            local_version = await read_local_version(hass)
-
-            if remote_version != local_version:
-                _LOGGER.info(f"[MiWiFi] New panel version detected: {remote_version}, updating files...")
-                await download_panel_files(hass, session, remote_version)
-                await save_local_version(hass, remote_version)
-            else:
-                _LOGGER.info(f"[MiWiFi] Version {remote_version} detected, checking files...")
-                await download_panel_files(hass, session, remote_version)
-
-            return remote_version
-        except Exception as e:
-            _LOGGER.error(f"[MiWiFi] Error checking/downloading frontend panel: {e}")
-            return "0.0"
-        finally:
-            hass.data["_miwifi_panel_updating"] = False
+    session: aiohttp.ClientSession = async_get_clientsession(hass)
+    try:
+        remote_version = await read_remote_version(session)
+        local_version = await read_local_version(hass)
+
+        if remote_version != local_version:
+            _LOGGER.info(f"[MiWiFi] New panel version detected: {remote_version}, updating files...")
+            await download_panel_files(hass, session, remote_version)
+            await save_local_version(hass, remote_version)
+        else:
+            _LOGGER.info(f"[MiWiFi] Version {remote_version} detected, checking files...")
+            await download_panel_files(hass, session, remote_version)
+
+        return remote_version
+    except Exception as e:
+        _LOGGER.error(f"[MiWiFi] Error checking/downloading frontend panel: {e}")
+        return "0.0"
+    finally:
+        hass.data["_miwifi_panel_updating"] = False
 
 
 async def read_remote_version(session: aiohttp.ClientSession) -> str:
@@ -74,6 +315,7 @@ def _read_json_file(path: str) -> dict:
 
 
 def _write_json_file(path: str, data: dict) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
     with open(path, "w", encoding="utf-8") as f:
         json.dump(data, f)
 
@@ -90,23 +332,21 @@ def _write_binary_file(path: str, content: bytes) -> None:
 
 async def save_local_version(hass: HomeAssistant, version: str) -> None:
     path = hass.config.path(PANEL_STORAGE_FILE)
-    os.makedirs(os.path.dirname(path), exist_ok=True)
     await hass.async_add_executor_job(_write_json_file, path, {"version": version})
+    async_get_panel_version_service(hass).async_set_local_version(version)
 
 
 async def read_local_version(hass: HomeAssistant) -> str:
     path = hass.config.path(PANEL_STORAGE_FILE)
-    if not os.path.exists(path):
+    if not await hass.async_add_executor_job(os.path.exists, path):
         _LOGGER.info(f"[MiWiFi] First installation detected, downloading frontend panel version {DEFAULT_PANEL_VERSION}")
-        os.makedirs(os.path.dirname(path), exist_ok=True)
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                await download_panel_files(hass, session, DEFAULT_PANEL_VERSION)
-                await hass.async_add_executor_job(_write_json_file, path, {"version": DEFAULT_PANEL_VERSION})
-            except Exception as e:
-                _LOGGER.error(f"[MiWiFi] Error downloading panel on first installation: {e}")
-                return "0.0"
+        try:
+            await download_panel_files(hass, async_get_clientsession(hass), DEFAULT_PANEL_VERSION)
+            await hass.async_add_executor_job(_write_json_file, path, {"version": DEFAULT_PANEL_VERSION})
+        except Exception as e:
+            _LOGGER.error(f"[MiWiFi] Error downloading panel on first installation: {e}")
+            return "0.0"
 
         return DEFAULT_PANEL_VERSION
 
@@ -114,37 +354,233 @@ async def read_local_version(hass: HomeAssistant) -> str:
     return data.get("version", DEFAULT_PANEL_VERSION)
 
 
+def _parse_manifest(files: list) -> dict[str, dict]:
+    """Accept plain file names or {"path", "size", "sha256"} entries."""
+
+    manifest: dict[str, dict] = {}
+    for item in files:
+        if isinstance(item, str):
+            manifest[item] = {}
+        elif isinstance(item, dict) and (path := item.get("path")):
+            manifest[path] = {
+                key: item[key] for key in ("size", "sha256") if key in item
+            }
+
+    return manifest
+
+
+def _read_manifest(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+
+    try:
+        data = _read_json_file(path)
+    except (OSError, ValueError):
+        return {}
+
+    return data if isinstance(data, dict) else {}
+
+
+def _file_size(path: str) -> int | None:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return None
+
+
+def _hash_partial_file(path: str) -> tuple[object, int, str | None]:
+    """Hash an interrupted download so it can be resumed.
+
+    A partial file without the ETag it was started with cannot be validated
+    and is discarded.
+    """
+
+    digest = hashlib.sha256()
+    if not os.path.exists(path):
+        return digest, 0, None
+
+    try:
+        with open(f"{path}.etag", "r", encoding="utf-8") as f:
+            etag = f.read()
+    except OSError:
+        _remove_partial_file(path)
+        return digest, 0, None
+
+    size = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(PANEL_DOWNLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+            size += len(chunk)
+
+    return digest, size, etag
+
+
+def _open_partial_file(path: str, append: bool, etag: str | None):
+    """Open a download, remembering the ETag a new one is started with."""
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    if not append:
+        if etag:
+            _write_binary_file(f"{path}.etag", etag.encode("utf-8"))
+        else:
+            _remove_file(f"{path}.etag")
+
+    return open(path, "ab" if append else "wb")
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _remove_partial_file(path: str) -> None:
+    _remove_file(path)
+    _remove_file(f"{path}.etag")
+
+
+def _finalize_panel_file(part_path: str, local_path: str, version: str | None) -> int:
+    """Stamp the version into scripts and atomically replace the file."""
+
+    if version is not None:
+        content = _read_binary_file(part_path).decode("utf-8")
+        _write_binary_file(
+            part_path, content.replace("__MIWIFI_VERSION__", version).encode("utf-8")
+        )
+
+    os.replace(part_path, local_path)
+    _remove_file(f"{part_path}.etag")
+
+    return os.path.getsize(local_path)
+
+
+async def _async_download_panel_file(
+    hass: HomeAssistant,
+    session: aiohttp.ClientSession,
+    file: str,
+    remote: dict,
+    cached: dict,
+    remote_version: str,
+) -> dict | None:
+    """Download one panel file unless the local copy is current.
+
+    :return dict | None: New local manifest entry, None when unchanged
+    """
+
+    local_path = hass.config.path(PANEL_LOCAL_PATH, file)
+    part_path = f"{local_path}.part"
+    is_script = file.endswith(".js")
+
+    local_size = await hass.async_add_executor_job(_file_size, local_path)
+    is_current = (
+        local_size is not None
+        and local_size == cached.get("local_size")
+        and (not is_script or cached.get("version") == remote_version)
+    )
+
+    if is_current and "sha256" in remote:
+        if remote["sha256"] == cached.get("sha256"):
+            return None
+        is_current = False
+
+    headers: dict[str, str] = {}
+    digest, offset = hashlib.sha256(), 0
+
+    if is_current and cached.get("etag"):
+        headers[hdrs.IF_NONE_MATCH] = cached["etag"]
+    else:
+        digest, offset, part_etag = await hass.async_add_executor_job(
+            _hash_partial_file, part_path
+        )
+        if offset:
+            # The server sends the whole file if it changed since the part
+            headers[hdrs.RANGE] = f"bytes={offset}-"
+            headers[hdrs.IF_RANGE] = part_etag
+
+    async with session.get(f"{PANEL_REPO_BASE_URL}{file}", headers=headers) as resp:
+        if resp.status == 304:
+            return None
+
+        if resp.status == 200 and offset:
+            digest, offset = hashlib.sha256(), 0
+        elif resp.status not in (200, 206):
+            if resp.status == 416:
+                await hass.async_add_executor_job(_remove_partial_file, part_path)
+
+            _LOGGER.warning(f"[MiWiFi] Could not download {file} (status {resp.status})")
+            return None
+
+        etag: str | None = resp.headers.get(hdrs.ETAG)
+
+        f = await hass.async_add_executor_job(
+            _open_partial_file, part_path, offset > 0, etag
+        )
+        try:
+            async for chunk in resp.content.iter_chunked(PANEL_DOWNLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                await hass.async_add_executor_job(f.write, chunk)
+        finally:
+            await hass.async_add_executor_job(f.close)
+
+    sha256: str = digest.hexdigest()
+    if "sha256" in remote and remote["sha256"] != sha256:
+        await hass.async_add_executor_job(_remove_partial_file, part_path)
+        _LOGGER.warning(f"[MiWiFi] Checksum mismatch for {file}, discarded")
+        return None
+
+    local_size = await hass.async_add_executor_job(
+        _finalize_panel_file,
+        part_path,
+        local_path,
+        remote_version if is_script else None,
+    )
+    _LOGGER.debug(f"[MiWiFi] File updated: {file}")
+
+    return {
+        "sha256": sha256,
+        "etag": etag,
+        "local_size": local_size,
+        "version": remote_version,
+    }
+
+
 async def download_panel_files(hass: HomeAssistant, session: aiohttp.ClientSession, remote_version: str) -> None:
+    """Download changed panel files concurrently.
+
+    A local manifest remembers the hash, ETag and size of every file written,
+    so unchanged files are skipped without reading them back from disk.
+    """
+
     try:
         files = await read_remote_files(session)
     except Exception as e:
         _LOGGER.error(f"[MiWiFi] Error reading files.json: {e}")
         return
 
-    for file in files:
-        remote_url = f"{PANEL_REPO_BASE_URL}{file}"
-        local_path = hass.config.path(PANEL_LOCAL_PATH, file)
-
-        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+    manifest_path = hass.config.path(PANEL_MANIFEST_FILE)
+    local_manifest: dict = await hass.async_add_executor_job(_read_manifest, manifest_path)
+    semaphore = asyncio.Semaphore(PANEL_DOWNLOAD_CONCURRENCY)
 
-        async with session.get(remote_url) as resp:
-            if resp.status != 200:
-                _LOGGER.warning(f"[MiWiFi] Could not download {file} (status {resp.status})")
-                continue
-
-            remote_content = await resp.read()
+    async def _download(file: str, remote: dict) -> None:
+        async with semaphore:
+            try:
+                entry = await _async_download_panel_file(
+                    hass, session, file, remote, local_manifest.get(file, {}), remote_version
+                )
+            except Exception as e:
+                _LOGGER.warning(f"[MiWiFi] Could not download {file}: {e}")
+                return
 
-            if file.endswith(".js"):
-                content = remote_content.decode("utf-8").replace("__MIWIFI_VERSION__", remote_version)
-                remote_content = content.encode("utf-8")
+        if entry is not None:
+            local_manifest[file] = entry
 
-            if os.path.exists(local_path):
-                existing_content = await hass.async_add_executor_job(_read_binary_file, local_path)
-                if remote_content == existing_content:
-                    continue
+    await asyncio.gather(
+        *[_download(file, remote) for file, remote in _parse_manifest(files).items()]
+    )
 
-            await hass.async_add_executor_job(_write_binary_file, local_path, remote_content)
-            _LOGGER.debug(f"[MiWiFi] File updated: {file}")
+    await hass.async_add_executor_job(_write_json_file, manifest_path, local_manifest)
 
 
 async def async_register_panel(hass: HomeAssistant, version: str) -> None:
@@ -202,65 +638,147 @@ async def async_remove_miwifi_panel(hass: HomeAssistant) -> None:
         _LOGGER.debug(f"[MiWiFi] Error deleting panel: {e}")
         
 
-async def async_start_panel_monitor(hass):
-    """Start periodic panel version monitoring."""
+@callback
+def async_start_panel_monitor(hass: HomeAssistant) -> None:
+    """Start the shared panel monitor if it is not running yet.
 
-    async def _check_panel_version(now):
-        try:
-            local = await read_local_version(hass)
-            async with aiohttp.ClientSession() as session:
-                remote = await read_remote_version(session)
-            if local != remote:
-                _LOGGER.warning(f"[MiWiFi] New panel version available: {remote} (local: {local})")
-            else:
-                _LOGGER.debug(f"[MiWiFi] Panel up-to-date: {local}")
-        except Exception as e:
-            _LOGGER.warning(f"[MiWiFi] Panel monitor error: {e}")
+    :param hass: HomeAssistant: Home Assistant object
+    """
 
-        async_track_time_interval(hass, _check_panel_version, PANEL_MONITOR_INTERVAL)
+    async_get_panel_version_service(hass).async_start()
+
+
+@callback
+def async_stop_panel_monitor(hass: HomeAssistant) -> None:
+    """Stop the shared panel monitor.
+
+    :param hass: HomeAssistant: Home Assistant object
+    """
+
+    if (service := hass.data.get(DATA_PANEL_VERSION)) is not None:
+        service.async_stop()
 
 
 # ------- Persistence for Main Router Manual -------
 
+class MainRouterStore:
+    """Manually selected main router MAC, cached in memory.
+
+    Loaded once and persisted with delayed Store writes, so topology
+    refreshes never touch disk for it.
+    """
+
+    mac: str | None = None
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize store.
+
+        :param hass: HomeAssistant: Home Assistant object
+        """
+
+        self.hass = hass
+
+        self._store: Store = Store(hass, MAIN_ROUTER_STORE_VERSION, MAIN_ROUTER_STORE)
+        self._is_loaded: bool = False
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    async def async_load(self) -> str | None:
+        """Load the stored MAC once, migrating the legacy JSON file.
+
+        :return str | None: Manual main router MAC
+        """
+
+        if self._is_loaded:
+            return self.mac
+
+        async with self._lock:
+            if self._is_loaded:
+                return self.mac
+
+            try:
+                data = await self._store.async_load()
+
+                if data is None:
+                    data = await self._async_migrate()
+
+                if isinstance(data, dict):
+                    self.mac = data.get("manual_main_mac")
+            except Exception as e:
+                _LOGGER.error("[MiWiFi] ❌ Error reading manual MAC: %s", e)
+
+            self._is_loaded = True
+
+        _LOGGER.debug("[MiWiFi] ✅ Manual MAC loaded: %s", self.mac)
+
+        return self.mac
+
+    async def _async_migrate(self) -> dict | None:
+        """Move the legacy JSON file into the Store.
+
+        :return dict | None: Legacy data
+        """
+
+        path: str = self.hass.config.path(MAIN_ROUTER_STORE_FILE)
+
+        def _read_legacy() -> dict | None:
+            if not os.path.exists(path):
+                return None
+
+            data = _read_json_file(path)
+            os.remove(path)
+
+            return data
+
+        if not isinstance(data := await self.hass.async_add_executor_job(_read_legacy), dict):
+            return None
+
+        await self._store.async_save(data)
+        _LOGGER.info("[MiWiFi] Manual MAC migrated from %s", path)
+
+        return data
+
+    @callback
+    def async_set(self, mac: str | None) -> None:
+        """Update the cached MAC and schedule a write.
+
+        :param mac: str | None: Manual main router MAC, None to clear
+        """
+
+        self.mac = mac
+        self._is_loaded = True
+        self._store.async_delay_save(
+            lambda: {"manual_main_mac": self.mac}, MAIN_ROUTER_SAVE_DELAY
+        )
+
+
+@callback
+def async_get_main_router_store(hass: HomeAssistant) -> MainRouterStore:
+    """Return shared manual main router store.
+
+    :param hass: HomeAssistant: Home Assistant object
+    :return MainRouterStore
+    """
+
+    if DATA_MAIN_ROUTER not in hass.data:
+        hass.data[DATA_MAIN_ROUTER] = MainRouterStore(hass)
+
+    return hass.data[DATA_MAIN_ROUTER]
+
+
 async def async_save_manual_main_mac(hass: HomeAssistant, mac: str):
-    """Save manually selected MAC to a JSON file."""
-    path = hass.config.path(MAIN_ROUTER_STORE_FILE)
-    try:
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        await hass.async_add_executor_job(_write_json_file, path, {"manual_main_mac": mac})
-        _LOGGER.info("[MiWiFi] ✅ MAC Manual saved correctly in %s", path)
-    except Exception as e:
-        _LOGGER.error("[MiWiFi] ❌ Error saving file from manual MAC: %s", e)
+    """Save manually selected MAC."""
+    async_get_main_router_store(hass).async_set(mac)
+    _LOGGER.info("[MiWiFi] ✅ MAC Manual saved correctly: %s", mac)
 
 
 async def async_load_manual_main_mac(hass: HomeAssistant) -> str | None:
-    """Load manually selected MAC from file."""
-    path = hass.config.path(MAIN_ROUTER_STORE_FILE)
-    if not os.path.exists(path):
-        _LOGGER.debug("[MiWiFi] No manual MAC file found at %s", path)
-        return None
-    try:
-        data = await hass.async_add_executor_job(_read_json_file, path)
-        if isinstance(data, dict):
-            mac = data.get("manual_main_mac")
-            _LOGGER.debug("[MiWiFi] ✅ MAC loaded from file: %s", mac)
-            return mac
-        else:
-            _LOGGER.warning("[MiWiFi] ❌ Unexpected format in file: %s (expected: dict, received: %s)", path, type(data).__name__)
-            return None
-    except Exception as e:
-        _LOGGER.error("[MiWiFi] ❌ Error reading manual MAC: %s", e)
-        return None
+    """Load manually selected MAC."""
+    return await async_get_main_router_store(hass).async_load()
 
 
 async def async_clear_manual_main_mac(hass: HomeAssistant):
-    """Remove stored MAC file."""
-    path = hass.config.path(MAIN_ROUTER_STORE_FILE)
-    try:
-        if os.path.exists(path):
-            await hass.async_add_executor_job(os.remove, path)
-            _LOGGER.info("[MiWiFi] 🗑️Manual MAC file deleted: %s", path)
-    except Exception as e:
-        _LOGGER.error("[MiWiFi] ❌ Error deleting file from MAC manually: %s", e)
+    """Remove stored MAC."""
+    async_get_main_router_store(hass).async_set(None)
+    _LOGGER.info("[MiWiFi] 🗑️Manual MAC deleted")
 
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import math
-import time
-from datetime import datetime
+import os
+from bisect import bisect_left
+from functools import cache, lru_cache
 from typing import Any
 
 from homeassistant import config_entries
@@ -16,7 +17,8 @@ from httpx import codes
 from .const import (
     DEFAULT_TIMEOUT,
     DOMAIN,
-    MANUFACTURERS,
+    MANUFACTURERS_CACHE_SIZE,
+    MANUFACTURERS_FILE,
     STORAGE_VERSION,
     GLOBAL_LOG_STORE,
     CONF_LOG_LEVEL,
@@ -86,13 +88,6 @@ def get_store(hass: HomeAssistant, ip: str) -> Store:
     return Store(hass, STORAGE_VERSION, f"{DOMAIN}/{ip}.json", encoder=JSONEncoder)
 
 
-def parse_last_activity(last_activity: str) -> int:
-    """Convert last activity datetime string to timestamp."""
-    return int(
-        time.mktime(datetime.strptime(last_activity, "%Y-%m-%dT%H:%M:%S").timetuple())
-    )
-
-
 def pretty_size(speed: float) -> str:
     """Convert speed in bytes/s to human-readable form."""
     if speed == 0.0:
@@ -103,10 +98,49 @@ def pretty_size(speed: float) -> str:
     return f"{round(speed / _p, 2)} {_unit[_i]}"
 
 
+@cache
+def load_manufacturers() -> tuple[list[str], list[str]]:
+    """Load the sorted OUI table on first use (blocking).
+
+    :return tuple[list[str], list[str]]: prefixes and manufacturers
+    """
+
+    prefixes: list[str] = []
+    names: list[str] = []
+
+    with open(
+        os.path.join(os.path.dirname(__file__), MANUFACTURERS_FILE),
+        encoding="utf-8",
+    ) as file:
+        for line in file:
+            prefix, _, name = line.rstrip("\n").partition("\t")
+            prefixes.append(prefix)
+            names.append(name)
+
+    return prefixes, names
+
+
+async def async_load_manufacturers(hass: HomeAssistant) -> None:
+    """Load the OUI table in the executor."""
+    if load_manufacturers.cache_info().currsize == 0:
+        await hass.async_add_executor_job(load_manufacturers)
+
+
+@lru_cache(maxsize=MANUFACTURERS_CACHE_SIZE)
 def detect_manufacturer(mac: str) -> str | None:
-    """Get manufacturer based on MAC address prefix."""
-    identifier: str = mac.replace(":", "").upper()[:6]
-    return MANUFACTURERS[identifier] if identifier in MANUFACTURERS else None
+    """Get manufacturer based on MAC address prefix.
+
+    MA-S (9 digit) and MA-M (7 digit) prefixes win over MA-L (6 digit).
+    """
+    prefixes, names = load_manufacturers()
+    identifier: str = mac.replace(":", "").replace("-", "").upper()
+
+    for length in (9, 7, 6):
+        index: int = bisect_left(prefixes, identifier[:length])
+        if index < len(prefixes) and prefixes[index] == identifier[:length]:
+            return names[index]
+
+    return None
 
 
 # ────────────────────────────────────────────────────────────────────────────────
@@ -105,3 +105,4 @@ class MiWifiLight(MiWifiEntity, LightEntity):
         self._attr_is_on = turn_on
         self._updater.data[self.entity_description.key] = turn_on
         self.async_write_ha_state()
+        self._updater.async_request_stage_refresh("led")
@@ -1,33 +1,163 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
-from homeassistant.helpers import storage
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant
+
+# Carpeta de logs en /config/miwifi/logs, relativa al directorio de configuración
+LOG_DIR = os.path.join('miwifi', 'logs')
+
+LOG_MAX_BYTES = 2_000_000
+LOG_BACKUP_COUNT = 3
+LOG_MAX_AGE = 86400
+
+# Un fichero por nivel
+LOG_FILES = {
+    logging.DEBUG: "miwifi_debug.log",  # Se activa si el nivel global es DEBUG
+    logging.INFO: "miwifi_info.log",
+    logging.WARNING: "miwifi_warning.log",
+    logging.ERROR: "miwifi_error.log",
+    logging.CRITICAL: "miwifi_critical.log",
+}
+
+
+class SizeAndTimeRotatingFileHandler(RotatingFileHandler):
+    """Rotate when the file grows too large or gets too old."""
+
+    def __init__(self, filename: str, max_bytes: int, backup_count: int, max_age: int) -> None:
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, delay=True)
+        self._max_age = max_age
+        self._rollover_at = time.time() + max_age
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if time.time() >= self._rollover_at and os.path.exists(self.baseFilename):
+            return True
+
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        self._rollover_at = time.time() + self._max_age
+
+
+class LevelRoutingHandler(logging.Handler):
+    """Write each record to the file of its level.
+
+    Runs on the queue listener thread; files and the log directory are only
+    created when the first record for them arrives. Records are not written
+    to files until a directory is set.
+    """
+
+    def __init__(self, directory: str | None, files: dict[int, str]) -> None:
+        super().__init__(logging.NOTSET)
+        self._directory = directory
+        self._files = files
+        self._handlers: dict[int, logging.Handler] = {}
+        self._formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+    def set_directory(self, directory: str) -> None:
+        self.acquire()
+        try:
+            if directory != self._directory:
+                self._close_handlers()
+                self._directory = directory
+        finally:
+            self.release()
+
+    def _get_handler(self, level: int) -> logging.Handler | None:
+        if (handler := self._handlers.get(level)) is not None:
+            return handler
+
+        if self._directory is None or (filename := self._files.get(level)) is None:
+            return None
+
+        os.makedirs(self._directory, exist_ok=True)
+        handler = SizeAndTimeRotatingFileHandler(
+            os.path.join(self._directory, filename),
+            LOG_MAX_BYTES,
+            LOG_BACKUP_COUNT,
+            LOG_MAX_AGE,
+        )
+        handler.setFormatter(self._formatter)
+        self._handlers[level] = handler
+
+        return handler
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            handler = self._get_handler(record.levelno)
+        except OSError:
+            self.handleError(record)
+            return
+
+        if handler is not None:
+            handler.handle(record)
+
+    def _close_handlers(self) -> None:
+        for handler in self._handlers.values():
+            handler.close()
+
+        self._handlers.clear()
+
+    def close(self) -> None:
+        self._close_handlers()
+        super().close()
 
-# Carpeta de logs en /config/miwifi/logs
-log_dir = os.path.join(storage.STORAGE_DIR, '..', 'miwifi', 'logs')
-os.makedirs(log_dir, exist_ok=True)
 
 _LOGGER = logging.getLogger("miwifi")
 _LOGGER.setLevel(logging.NOTSET)
 
-# Handlers por nivel
-def add_level_handler(level, filename):
-    path = os.path.join(log_dir, filename)
-    handler = RotatingFileHandler(path, maxBytes=2_000_000, backupCount=3)
-    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-    handler.setFormatter(formatter)
-    handler.setLevel(logging.NOTSET)
-    handler.addFilter(lambda record: record.levelno == level)
-    _LOGGER.addHandler(handler)
-
-# Añadimos los logs siempre activos
-add_level_handler(logging.INFO, "miwifi_info.log")
-add_level_handler(logging.WARNING, "miwifi_warning.log")
-add_level_handler(logging.ERROR, "miwifi_error.log")
-add_level_handler(logging.CRITICAL, "miwifi_critical.log")
-add_level_handler(logging.DEBUG, "miwifi_debug.log")  # Se activa si el nivel global es DEBUG
-
-__all__ = ["_LOGGER"]
+# El bucle de eventos solo encola; el hilo del listener escribe y rota.
+# Lo registrado antes de arrancar el listener espera en la cola.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_routing_handler = LevelRoutingHandler(None, LOG_FILES)
+_listener = QueueListener(_log_queue, _routing_handler)
+_is_listening: bool = False
+
+_LOGGER.addHandler(QueueHandler(_log_queue))
+
+
+def _stop_listener() -> None:
+    """Write the queued records and stop the listener thread."""
+    global _is_listening
+
+    if not _is_listening:
+        return
+
+    _is_listening = False
+    _listener.stop()
+    _routing_handler.close()
+
+
+atexit.register(_stop_listener)
+
+
+def set_log_directory(hass: HomeAssistant) -> None:
+    """Write log files under the Home Assistant config directory.
+
+    Starts the listener, which first writes the records buffered since
+    import, and stops it when Home Assistant stops.
+    """
+    global _is_listening
+
+    _routing_handler.set_directory(hass.config.path(LOG_DIR))
+
+    if _is_listening:
+        return
+
+    _is_listening = True
+    _listener.start()
+
+    async def _async_stop_listener(event: Event) -> None:
+        await hass.async_add_executor_job(_stop_listener)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_listener)
+
+
+__all__ = ["_LOGGER", "set_log_directory"]
 
 # Mensaje de inicio
 if _LOGGER.isEnabledFor(logging.DEBUG):
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import hashlib
 import json
 from .logger import _LOGGER
@@ -9,30 +11,60 @@ import random
 import time
 import urllib.parse
 import uuid
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any
 
-from httpx import AsyncClient, ConnectError, HTTPError, Response, TransportError
+from httpx import (
+    AsyncClient,
+    ConnectError,
+    HTTPError,
+    Response,
+    TransportError,
+)
 
 from .const import (
     CLIENT_ADDRESS,
+    CLIENT_AUTH_ERROR_CODE,
     CLIENT_LOGIN_TYPE,
     CLIENT_NONCE_TYPE,
     CLIENT_PUBLIC_KEY,
+    CLIENT_TOKEN_MAX_AGE,
     CLIENT_URL,
     CLIENT_USERNAME,
     DEFAULT_TIMEOUT,
     DIAGNOSTIC_CONTENT,
     DIAGNOSTIC_DATE_TIME,
+    DIAGNOSTIC_MAX_PATHS,
+    DIAGNOSTIC_MAX_SIZE,
     DIAGNOSTIC_MESSAGE,
 )
 from .enum import EncryptionAlgorithm
 from .exceptions import LuciConnectionError, LuciError, LuciRequestError
+from .metrics import RequestMetrics, add_network_time
 
  
 
 
 # pylint: disable=too-many-public-methods,too-many-arguments
+def _diagnostic_content(content: bytes | str) -> Any:
+    """Decode a captured response body.
+
+    :param content: bytes | str: Captured content
+    :return Any: Parsed JSON, or text when not JSON
+    """
+
+    if not isinstance(content, bytes):
+        return content
+
+    text: str = content.decode(errors="replace")
+
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
 class LuciClient:
     """Luci API Client."""
 
@@ -44,8 +76,11 @@ class LuciClient:
     _timeout: int = DEFAULT_TIMEOUT
 
     _token: str | None = None
+    _token_time: float | None = None
     _url: str
 
+    is_diagnostics_enabled: bool = True
+
     def __init__(
         self,
         client: AsyncClient,
@@ -53,6 +88,7 @@ class LuciClient:
         password: str | None = None,
         encryption: str = EncryptionAlgorithm.SHA1,
         timeout: int = DEFAULT_TIMEOUT,
+        is_diagnostics_enabled: bool = True,
     ) -> None:
         """Initialize API client.
 
@@ -61,6 +97,7 @@ class LuciClient:
         :param password: str: device password
         :param encryption: str: password encryption algorithm
         :param timeout: int: Query execution timeout
+        :param is_diagnostics_enabled: bool: Keep the last response of each path
         """
 
         ip = ip.removesuffix("/")
@@ -73,11 +110,88 @@ class LuciClient:
 
         self._url = CLIENT_URL.format(ip=ip)
 
-        self.diagnostics: dict[str, Any] = {}
+        self.is_diagnostics_enabled = is_diagnostics_enabled
+        self._diagnostics: OrderedDict[str, tuple[float, str, bytes | str]] = OrderedDict()
+        self._diagnostics_size: int = 0
+        self.metrics: RequestMetrics = RequestMetrics()
+
+        self._login_lock: asyncio.Lock = asyncio.Lock()
+        self._requests: dict[tuple, list] = {}
+
+    @property
+    def diagnostics(self) -> dict[str, Any]:
+        """Last captured response of each path.
+
+        :return dict[str, Any]: Diagnostics by path
+        """
+
+        return {
+            path: {
+                DIAGNOSTIC_DATE_TIME: datetime.fromtimestamp(timestamp)
+                .replace(microsecond=0)
+                .isoformat(),
+                DIAGNOSTIC_MESSAGE: message,
+                DIAGNOSTIC_CONTENT: _diagnostic_content(content),
+            }
+            for path, (timestamp, message, content) in self._diagnostics.items()
+        }
+
+    @property
+    def token_age(self) -> float | None:
+        """Seconds since the current token was issued.
+
+        :return float | None: Age, None without a valid token
+        """
+
+        if self._token is None or self._token_time is None:
+            return None
+
+        return time.monotonic() - self._token_time
 
     async def login(self) -> dict:
         """Login method
 
+        Concurrent logins are serialised.
+
+        :return dict: dict with login data.
+        """
+
+        async with self._login_lock:
+            return await self._login()
+
+    def _is_token_stale(self, rejected_token: str | None = None) -> bool:
+        """Check whether the token must be refreshed.
+
+        :param rejected_token: str | None: Token the router refused
+        :return bool: is stale
+        """
+
+        age: float | None = self.token_age
+
+        return (
+            age is None
+            or age >= CLIENT_TOKEN_MAX_AGE
+            or (rejected_token is not None and self._token == rejected_token)
+        )
+
+    async def _async_ensure_token(self, rejected_token: str | None = None) -> None:
+        """Log in again before the token expires or after it was refused.
+
+        Callers waiting on the lock reuse the token obtained by the first one.
+
+        :param rejected_token: str | None: Token the router refused
+        """
+
+        if not self._is_token_stale(rejected_token):
+            return
+
+        async with self._login_lock:
+            if self._is_token_stale(rejected_token):
+                await self._login()
+
+    async def _login(self) -> dict:
+        """Login request
+
         :return dict: dict with login data.
         """
 
@@ -92,30 +206,40 @@ class LuciClient:
             "nonce": _nonce,
         }
 
+        _started: float = time.perf_counter()
+
         try:
-            self._debug("Start request", _url, json.dumps(_request_data), _method, True)
+            self._debug("Start request", _url, _request_data, _method, True)
 
-            async with self._client as client:
-                response: Response = await client.post(
-                    _url,
-                    data=_request_data,
-                    timeout=self._timeout,
-                )
+            response: Response = await self._client.post(
+                _url,
+                data=_request_data,
+                timeout=self._timeout,
+            )
 
-            self._debug("Successful request", _url, response.content, _method)
+            _elapsed: float = time.perf_counter() - _started
+            add_network_time(_elapsed)
 
             _data: dict = json.loads(response.content)
         except (HTTPError, ConnectError, TransportError, ValueError, TypeError) as _e:
+            self._record_error(_method, _started, _e)
             self._debug("Connection error", _url, _e, _method)
 
             raise LuciConnectionError("Connection error") from _e
 
+        self.metrics.record(
+            _method, _elapsed, len(response.content), response.status_code
+        )
+        self._debug("Successful request", _url, response.content, _method)
+
         if response.status_code != 200 or "token" not in _data:
-            self._debug("Failed to get token", _url, _data, _method)
+            self.metrics.record_error(_method, LuciRequestError.__name__)
+            self._debug("Failed to get token", _url, response.content, _method)
 
             raise LuciRequestError("Failed to get token")
 
         self._token = _data["token"]
+        self._token_time = time.monotonic()
 
         return _data
 
@@ -129,13 +253,14 @@ class LuciClient:
         _url: str = f"{self._url}/;stok={self._token}/web/{_method}"
 
         try:
-            async with self._client as client:
-                response: Response = await client.get(_url, timeout=self._timeout)
+            response: Response = await self._client.get(_url, timeout=self._timeout)
 
-                self._debug("Successful request", _url, response.content, _method)
+            self._debug("Successful request", _url, response.content, _method)
         except (HTTPError, ConnectError, TransportError, ValueError, TypeError) as _e:
             self._debug("Logout error", _url, _e, _method)
 
+        self._token_time = None
+
     async def get(
         self,
         path: str,
@@ -155,17 +280,90 @@ class LuciClient:
         if use_stok and self._token is None:
             raise LuciRequestError("Token not found")
 
+        _endpoint: str = path
+
         if query_params is not None and len(query_params) > 0:
             path += f"?{urllib.parse.urlencode(query_params, doseq=True)}"
 
-        _stok: str = f";stok={self._token}/" if use_stok else ""
+        # Identical concurrent GETs share one request to the router. Once a
+        # request is shared, every caller gets its own copy of the result.
+        _key: tuple = (
+            use_stok,
+            path,
+            tuple(sorted(errors.items())) if errors else None,
+        )
+
+        if (shared := self._requests.get(_key)) is not None and not shared[0].done():
+            shared[1] += 1
+
+            return copy.deepcopy(await asyncio.shield(shared[0]))
+
+        request: asyncio.Future = asyncio.ensure_future(
+            self._async_get_with_token(_endpoint, path, use_stok, errors)
+        )
+        shared = [request, 0]
+        self._requests[_key] = shared
+
+        def _release(_: asyncio.Future) -> None:
+            if self._requests.get(_key) is shared:
+                del self._requests[_key]
+
+        request.add_done_callback(_release)
+
+        result: dict = await asyncio.shield(request)
+
+        return copy.deepcopy(result) if shared[1] else result
+
+    async def _async_get_with_token(
+        self,
+        endpoint: str,
+        path: str,
+        use_stok: bool,
+        errors: dict[int, str] | None,
+    ) -> dict:
+        """Refresh the token if needed and run the GET request.
+
+        :param endpoint: str: api method without query
+        :param path: str: api method with query
+        :param use_stok: bool: is use stack
+        :param errors: dict[int, str] | None: errors list
+        :return dict: dict with api data.
+        """
+
+        if use_stok:
+            await self._async_ensure_token()
+
+        return await self._get(endpoint, path, use_stok, errors)
+
+    async def _get(
+        self,
+        endpoint: str,
+        path: str,
+        use_stok: bool,
+        errors: dict[int, str] | None,
+        is_retry: bool = False,
+    ) -> dict:
+        """GET request, retried once with a new token on auth failure.
+
+        :param endpoint: str: api method without query
+        :param path: str: api method with query
+        :param use_stok: bool: is use stack
+        :param errors: dict[int, str] | None: errors list
+        :param is_retry: bool: is retry after re-login
+        :return dict: dict with api data.
+        """
+
+        _token: str | None = self._token
+        _stok: str = f";stok={_token}/" if use_stok else ""
         _url: str = f"{self._url}/{_stok}api/{path}"
 
+        _started: float = time.perf_counter()
+
         try:
-            async with self._client as client:
-                response: Response = await client.get(_url, timeout=self._timeout)
+            response: Response = await self._client.get(_url, timeout=self._timeout)
 
-            self._debug("Successful request", _url, response.content, path)
+            _elapsed: float = time.perf_counter() - _started
+            add_network_time(_elapsed)
 
             _data: dict = json.loads(response.content)
         except (
@@ -176,18 +374,38 @@ class LuciClient:
             TypeError,
             json.JSONDecodeError,
         ) as _e:
+            self._record_error(endpoint, _started, _e)
             self._debug("Connection error", _url, _e, path)
 
             raise LuciConnectionError("Connection error") from _e
 
+        self.metrics.record(
+            endpoint, _elapsed, len(response.content), response.status_code
+        )
+        self._debug("Successful request", _url, response.content, path)
+
+        if (
+            use_stok
+            and not is_retry
+            and CLIENT_AUTH_ERROR_CODE in (response.status_code, _data.get("code"))
+        ):
+            self.metrics.record_error(endpoint, LuciRequestError.__name__)
+            await self._async_ensure_token(_token)
+
+            return await self._get(endpoint, path, use_stok, errors, True)
+
         if "code" not in _data or _data["code"] > 0:
             _code: int = -1 if "code" not in _data else int(_data["code"])
 
-            self._debug("Invalid error code received", _url, _data, path)
+            self._debug("Invalid error code received", _url, response.content, path)
 
             if "code" in _data and errors is not None and _data["code"] in errors:
+                self.metrics.record_error(endpoint, LuciError.__name__)
+
                 raise LuciError(errors[_data["code"]])
 
+            self.metrics.record_error(endpoint, LuciRequestError.__name__)
+
             raise LuciRequestError(
                 _data.get("msg", f"Invalid error code received: {_code}")
             )
@@ -488,11 +706,31 @@ class LuciClient:
 
         return self.sha(nonce + self.sha(password + CLIENT_PUBLIC_KEY))
 
+    def _record_error(self, endpoint: str, started: float, error: Exception) -> None:
+        """Record a failed request.
+
+        :param endpoint: str: Api path without query
+        :param started: float: perf_counter at request start
+        :param error: Exception: Error
+        """
+
+        elapsed: float = time.perf_counter() - started
+
+        if not isinstance(error, ValueError):
+            add_network_time(elapsed)
+
+        self.metrics.record(endpoint, elapsed, error=type(error).__name__)
+
     def _debug(
         self, message: str, url: str, content: Any, path: str, is_only_log: bool = False
     ) -> None:
         """Debug log
 
+        Response bodies are kept as the raw bytes, never as the parsed
+        objects handed to callers, and are only decoded when diagnostics are
+        read. The oldest paths are dropped beyond DIAGNOSTIC_MAX_PATHS paths
+        or DIAGNOSTIC_MAX_SIZE bytes in total; the latest one is always kept.
+
         :param message: str: Message
         :param url: str: URL
         :param content: Any: Content
@@ -502,18 +740,20 @@ class LuciClient:
 
         #_LOGGER.debug("%s (%s): %s", message, url, str(content))
 
-        if is_only_log:
+        if is_only_log or not self.is_diagnostics_enabled:
             return
 
-        _content: dict | str = {}
+        if not isinstance(content, bytes):
+            content = str(content)
 
-        try:
-            _content = json.loads(content)
-        except (ValueError, TypeError):
-            _content = str(content)
-
-        self.diagnostics[path] = {
-            DIAGNOSTIC_DATE_TIME: datetime.now().replace(microsecond=0).isoformat(),
-            DIAGNOSTIC_MESSAGE: message,
-            DIAGNOSTIC_CONTENT: _content,
-        }
\ No newline at end of file
+        if (previous := self._diagnostics.pop(path, None)) is not None:
+            self._diagnostics_size -= len(previous[2])
+
+        self._diagnostics[path] = (time.time(), message, content)
+        self._diagnostics_size += len(content)
+
+        while len(self._diagnostics) > 1 and (
+            len(self._diagnostics) > DIAGNOSTIC_MAX_PATHS
+            or self._diagnostics_size > DIAGNOSTIC_MAX_SIZE
+        ):
+            self._diagnostics_size -= len(self._diagnostics.popitem(last=False)[1][2])
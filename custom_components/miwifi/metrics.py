@@ -0,0 +1,380 @@
+"""Request and refresh stage timing metrics."""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    METRICS_LATENCY_BUCKETS,
+    METRICS_WINDOW,
+    PROFILE_BAR_WIDTH,
+    PROFILE_HISTORY,
+)
+
+
+class RollingStats:
+    """Bounded window of samples with percentiles."""
+
+    __slots__ = ("_samples",)
+
+    def __init__(self, size: int = METRICS_WINDOW) -> None:
+        """Initialize window.
+
+        :param size: int: Samples kept
+        """
+
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        """Samples in window.
+
+        :return int
+        """
+
+        return len(self._samples)
+
+    def add(self, value: float) -> None:
+        """Add sample.
+
+        :param value: float: Sample
+        """
+
+        self._samples.append(value)
+
+    def percentile(self, percent: float) -> float | None:
+        """Nearest-rank percentile of the window.
+
+        :param percent: float: Percentile, 0-100
+        :return float | None: Value, None without samples
+        """
+
+        if not self._samples:
+            return None
+
+        ordered: list[float] = sorted(self._samples)
+        index: int = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+
+        return ordered[index]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Window summary.
+
+        :return dict[str, Any]
+        """
+
+        if not self._samples:
+            return {"samples": 0}
+
+        return {
+            "samples": len(self._samples),
+            "p50": round(self.percentile(50), 4),  # type: ignore
+            "p95": round(self.percentile(95), 4),  # type: ignore
+            "max": round(max(self._samples), 4),
+        }
+
+
+class EndpointMetrics:
+    """Counters of one API endpoint."""
+
+    __slots__ = (
+        "count",
+        "errors",
+        "last_status",
+        "total_bytes",
+        "latency",
+        "size",
+        "histogram",
+    )
+
+    def __init__(self) -> None:
+        """Initialize counters."""
+
+        self.count: int = 0
+        self.errors: dict[str, int] = {}
+        self.last_status: int | None = None
+        self.total_bytes: int = 0
+        self.latency: RollingStats = RollingStats()
+        self.size: RollingStats = RollingStats()
+        self.histogram: list[int] = [0] * (len(METRICS_LATENCY_BUCKETS) + 1)
+
+    def record(self, elapsed: float, size: int | None, status: int | None) -> None:
+        """Record a completed request.
+
+        :param elapsed: float: Seconds
+        :param size: int | None: Response bytes
+        :param status: int | None: HTTP status
+        """
+
+        self.count += 1
+        self.latency.add(elapsed)
+        self.histogram[bisect_left(METRICS_LATENCY_BUCKETS, elapsed)] += 1
+
+        if size is not None:
+            self.total_bytes += size
+            self.size.add(size)
+
+        if status is not None:
+            self.last_status = status
+
+    def record_error(self, error: str) -> None:
+        """Count an error.
+
+        :param error: str: Exception class name
+        """
+
+        self.errors[error] = self.errors.get(error, 0) + 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Endpoint summary.
+
+        :return dict[str, Any]
+        """
+
+        return {
+            "count": self.count,
+            "errors": dict(self.errors),
+            "last_status": self.last_status,
+            "total_bytes": self.total_bytes,
+            "latency": self.latency.as_dict(),
+            "size": self.size.as_dict(),
+            "histogram": {
+                f"le_{bucket}": count
+                for bucket, count in zip(METRICS_LATENCY_BUCKETS, self.histogram)
+            }
+            | {"inf": self.histogram[-1]},
+        }
+
+
+class RequestMetrics:
+    """Per-endpoint request metrics of one Luci client."""
+
+    def __init__(self) -> None:
+        """Initialize metrics."""
+
+        self.endpoints: dict[str, EndpointMetrics] = {}
+        self.latency: RollingStats = RollingStats()
+
+    def _endpoint(self, endpoint: str) -> EndpointMetrics:
+        if (metrics := self.endpoints.get(endpoint)) is None:
+            metrics = self.endpoints[endpoint] = EndpointMetrics()
+
+        return metrics
+
+    def record(
+        self,
+        endpoint: str,
+        elapsed: float,
+        size: int | None = None,
+        status: int | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Record a request.
+
+        :param endpoint: str: Api path without query
+        :param elapsed: float: Seconds
+        :param size: int | None: Response bytes
+        :param status: int | None: HTTP status
+        :param error: str | None: Exception class name
+        """
+
+        metrics: EndpointMetrics = self._endpoint(endpoint)
+        metrics.record(elapsed, size, status)
+        self.latency.add(elapsed)
+
+        if error is not None:
+            metrics.record_error(error)
+
+    def record_error(self, endpoint: str, error: str) -> None:
+        """Count an error of an already recorded request.
+
+        :param endpoint: str: Api path without query
+        :param error: str: Exception class name
+        """
+
+        self._endpoint(endpoint).record_error(error)
+
+    @property
+    def count(self) -> int:
+        """Total requests.
+
+        :return int
+        """
+
+        return sum(metrics.count for metrics in self.endpoints.values())
+
+    @property
+    def error_count(self) -> int:
+        """Total errors.
+
+        :return int
+        """
+
+        return sum(
+            sum(metrics.errors.values()) for metrics in self.endpoints.values()
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Summary by endpoint.
+
+        :return dict[str, Any]
+        """
+
+        return {
+            endpoint: metrics.as_dict()
+            for endpoint, metrics in sorted(self.endpoints.items())
+        }
+
+
+class StageTimer:
+    """Network wait accumulated by the stage running in the current task."""
+
+    __slots__ = ("network",)
+
+    def __init__(self) -> None:
+        """Initialize timer."""
+
+        self.network: float = 0.0
+
+
+_STAGE_TIMER: ContextVar[StageTimer | None] = ContextVar(
+    "miwifi_stage_timer", default=None
+)
+
+
+def add_network_time(elapsed: float) -> None:
+    """Charge network wait to the stage running in the current task.
+
+    :param elapsed: float: Seconds
+    """
+
+    if (timer := _STAGE_TIMER.get()) is not None:
+        timer.network += elapsed
+
+
+class StageProfiler:
+    """Per-stage timings of the updater refresh pipeline."""
+
+    def __init__(self, history: int = PROFILE_HISTORY) -> None:
+        """Initialize profiler.
+
+        :param history: int: Refreshes kept for dumps
+        """
+
+        self.total: dict[str, RollingStats] = {}
+        self.network: dict[str, RollingStats] = {}
+        self.refreshes: deque[dict[str, Any]] = deque(maxlen=history)
+
+        self._current: dict[str, Any] | None = None
+        self._started: float = 0.0
+
+    def start_refresh(self, partial: bool = False) -> None:
+        """Start collecting a refresh.
+
+        :param partial: bool: Only some stages run, outside the regular poll
+        """
+
+        self._started = time.perf_counter()
+        self._current = {
+            "started": dt_util.utcnow().isoformat(),
+            "partial": partial,
+            "duration": 0.0,
+            "stages": {},
+        }
+
+    def finish_refresh(self) -> None:
+        """Store the collected refresh."""
+
+        if self._current is None:
+            return
+
+        self._current["duration"] = time.perf_counter() - self._started
+        self.refreshes.append(self._current)
+        self._current = None
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """Time a stage, splitting network wait from processing.
+
+        :param stage: str: Stage name
+        """
+
+        timer = StageTimer()
+        token = _STAGE_TIMER.set(timer)
+        started: float = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            total: float = time.perf_counter() - started
+            _STAGE_TIMER.reset(token)
+
+            # Stages may await several requests at once
+            network: float = min(timer.network, total)
+
+            self.total.setdefault(stage, RollingStats()).add(total)
+            self.network.setdefault(stage, RollingStats()).add(network)
+
+            if self._current is not None:
+                self._current["stages"][stage] = {
+                    "offset": started - self._started,
+                    "total": total,
+                    "network": network,
+                }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Rolling percentiles by stage.
+
+        :return dict[str, Any]
+        """
+
+        return {
+            stage: {
+                "total": stats.as_dict(),
+                "network": self.network[stage].as_dict(),
+            }
+            for stage, stats in sorted(self.total.items())
+        }
+
+    def dump(self, count: int) -> str:
+        """Flame-style text breakdown of the last refreshes.
+
+        :param count: int: Refreshes to include
+        :return str
+        """
+
+        lines: list[str] = []
+
+        for refresh in list(self.refreshes)[-count:]:
+            duration: float = refresh["duration"] or 1e-9
+            lines.append(
+                f"{refresh['started']} {'partial' if refresh['partial'] else 'full'} "
+                f"total {refresh['duration'] * 1000:.0f} ms"
+            )
+
+            for stage, timing in sorted(
+                refresh["stages"].items(), key=lambda item: item[1]["offset"]
+            ):
+                start: int = round(timing["offset"] / duration * PROFILE_BAR_WIDTH)
+                network: int = round(timing["network"] / duration * PROFILE_BAR_WIDTH)
+                processing: int = max(
+                    round(timing["total"] / duration * PROFILE_BAR_WIDTH) - network, 0
+                )
+
+                lines.append(
+                    f"  {stage:<12} "
+                    f"{' ' * start}{'#' * network}{'=' * processing}"
+                    f"{' ' * max(PROFILE_BAR_WIDTH - start - network - processing, 0)} "
+                    f"{timing['total'] * 1000:.0f} ms "
+                    f"(network {timing['network'] * 1000:.0f} ms, "
+                    f"processing {(timing['total'] - timing['network']) * 1000:.0f} ms)"
+                )
+
+        return "\n".join(lines)
@@ -269,4 +269,5 @@ class MiWifiSelect(MiWifiEntity, SelectEntity):
             self._updater.data[self.entity_description.key] = option
             self._attr_current_option = option
 
-            self.async_write_ha_state()
\ No newline at end of file
+            self.async_write_ha_state()
+            self._updater.async_request_stage_refresh("wifi")
\ No newline at end of file
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 
 from .logger import _LOGGER
 from enum import Enum
@@ -16,12 +17,22 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, UnitOfInformation, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    PERCENTAGE,
+    UnitOfInformation,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
+    ATTR_SENSOR_API_ERRORS,
+    ATTR_SENSOR_API_ERRORS_NAME,
+    ATTR_SENSOR_API_LATENCY,
+    ATTR_SENSOR_API_LATENCY_NAME,
     ATTR_SENSOR_AP_SIGNAL,
     ATTR_SENSOR_AP_SIGNAL_NAME,
     ATTR_SENSOR_DEVICES,
@@ -215,6 +226,24 @@ MIWIFI_SENSORS: tuple[SensorEntityDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=True,
     ),
+    SensorEntityDescription(
+        key=ATTR_SENSOR_API_LATENCY,
+        name=ATTR_SENSOR_API_LATENCY_NAME,
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    SensorEntityDescription(
+        key=ATTR_SENSOR_API_ERRORS,
+        name=ATTR_SENSOR_API_ERRORS_NAME,
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
 )
 
 
@@ -307,37 +336,52 @@ class MiWifiSensor(MiWifiEntity, SensorEntity):
 
         return self.entity_description.native_unit_of_measurement
     
-class MiWifiTopologyGraphSensor(SensorEntity):
+class MiWifiTopologyGraphSensor(CoordinatorEntity, SensorEntity):
     """Sensor to represent the network topology graph."""
 
     def __init__(self, updater: LuciUpdater) -> None:
+        super().__init__(updater)
         self._attr_unique_id = f"{updater.entry_id}_topology_graph"
         self._attr_name = "Topología MiWiFi"
         self._updater = updater
         self._attr_icon = "mdi:network"
         self._attr_should_poll = False
+        self._topo_graph: dict | None = copy.deepcopy(
+            updater.data.get("topo_graph")
+        )
+        self._is_available: bool = updater.last_update_success
 
     @property
     def native_value(self) -> str:
         """Return the state of the topology sensor."""
-        return "ok" if self._updater.data.get("topo_graph") else "unavailable"
+        return "ok" if self._topo_graph else "unavailable"
 
     @property
     def extra_state_attributes(self) -> dict:
         """Return the topology graph as attributes."""
-        return self._updater.data.get("topo_graph", {})
+        return self._topo_graph or {}
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the topology graph changed."""
+        topo_graph: dict | None = self._updater.data.get("topo_graph")
+
+        if (
+            topo_graph == self._topo_graph
+            and self._is_available == self._updater.last_update_success
+        ):
+            return
 
+        self._topo_graph = copy.deepcopy(topo_graph)
+        self._is_available = self._updater.last_update_success
+        self.async_write_ha_state()
 
-    async def async_update(self) -> None:
-        """No polling, data is pushed from coordinator."""
-        pass
 
 from homeassistant.helpers.entity import Entity
 from .const import CONF_ENABLE_PANEL, CONF_WAN_SPEED_UNIT, CONF_LOG_LEVEL
 from .helper import get_global_log_level
 from .logger import _LOGGER
 from datetime import datetime
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 class MiWifiConfigSensor(CoordinatorEntity, SensorEntity):
     """Sensor que expone la configuración actual como atributos."""
@@ -371,10 +415,12 @@ class MiWifiConfigSensor(CoordinatorEntity, SensorEntity):
 
     async def _update_attrs(self) -> None:
         from .helper import get_global_log_level
-        from .frontend import read_local_version
+        from .frontend import async_get_panel_version_service
 
         log_level = await get_global_log_level(self._updater.hass)
-        panel_version = await read_local_version(self._updater.hass)
+        panel_version = await async_get_panel_version_service(
+            self._updater.hass
+        ).async_load_local_version()
         config = self._updater.config_entry.options
 
         self._extra_attrs = {
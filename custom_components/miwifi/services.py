@@ -24,7 +24,9 @@ from .const import (
     EVENT_LUCI,
     EVENT_TYPE_RESPONSE,
     NAME,
+    PROFILE_HISTORY,
     SERVICE_CALC_PASSWD,
+    SERVICE_DUMP_PROFILE,
     SERVICE_REQUEST,
     UPDATER,
 )
@@ -110,12 +112,27 @@ class MiWifiRequestServiceCall(MiWifiServiceCall):
             })
 
 
+class MiWifiDumpProfileServiceCall(MiWifiServiceCall):
+    """Dump refresh stage timings."""
+
+    schema = MiWifiServiceCall.schema.extend({
+        vol.Optional("count", default=5): vol.All(vol.Coerce(int), vol.Range(min=1, max=PROFILE_HISTORY))
+    })
+
+    async def async_call_service(self, service: ServiceCall) -> None:
+        updater: LuciUpdater = self.get_updater(service)
+        dump: str = updater.profiler.dump(service.data["count"])
+
+        _LOGGER.info("[MiWiFi] Refresh profile of %s:\n%s", updater.ip, dump)
+        pn.async_create(self.hass, f"<pre>{dump or 'No refreshes recorded yet.'}</pre>", f"{NAME} {updater.ip}")
+
+
 class MiWifiGetTopologyGraphServiceCall(MiWifiServiceCall):
     """Get Topology Graph."""
 
     async def async_call_service(self, service: ServiceCall) -> None:
         updater: LuciUpdater = self.get_updater(service)
-        await updater._async_prepare_topo()
+        await updater.async_refresh_stages("topo")
 
         if updater.data.get("topo_graph"):
             _LOGGER.info("[MiWiFi] Topology graph retrieved successfully.")
@@ -173,7 +190,7 @@ class MiWifiSelectMainNodeServiceCall(MiWifiServiceCall):
             _LOGGER.info("[MiWiFi] 🧹 Limpieza de selección manual de router principal.")
 
         for router in routers:
-            await router._async_prepare_topo()
+            await router.async_refresh_stages("topo")
             await async_update_panel_entity(self.hass, router)
 
 
@@ -227,9 +244,10 @@ class MiWifiBlockDeviceServiceCall:
         allow = service.data["allow"]
 
         try:
-            await main_updater.luci.login()
             await main_updater.luci.set_mac_filter(mac_address, not allow)
-            await main_updater._async_prepare_devices(main_updater.data)
+            main_updater.async_request_stage_refresh(
+                "mac_filter", "devices", "device_list"
+            )
 
             _LOGGER.info(f"[MiWiFi] MAC Filter applied: mac={mac_address}, WAN={'Blocked' if allow else 'Allowed'}")
         except LuciError as e:
@@ -256,6 +274,7 @@ class MiWifiBlockDeviceServiceCall:
 SERVICES: Final = (
     (SERVICE_CALC_PASSWD, MiWifiCalcPasswdServiceCall),
     (SERVICE_REQUEST, MiWifiRequestServiceCall),
+    (SERVICE_DUMP_PROFILE, MiWifiDumpProfileServiceCall),
     ("get_topology_graph", MiWifiGetTopologyGraphServiceCall),
     ("log_panel", MiWifiLogPanelServiceCall),
     ("select_main_router", MiWifiSelectMainNodeServiceCall),
@@ -230,6 +230,7 @@ class MiWifiSwitch(MiWifiEntity, SwitchEntity):
             self._attr_is_on = is_on
 
             self.async_write_ha_state()
+            self._updater.async_request_stage_refresh("wifi")
 
     def _additional_prepare(self) -> bool:
         is_available: bool = self._updater.data.get(ATTR_STATE, False)
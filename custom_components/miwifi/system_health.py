@@ -9,6 +9,7 @@ from homeassistant.core import HomeAssistant, callback
 
 from .const import ATTR_DEVICE_MODEL, ATTR_STATE, UPDATER
 from .helper import async_get_version
+from .metrics import RequestMetrics
 from .updater import LuciUpdater, async_get_integrations
 
 
@@ -46,4 +47,12 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, str]:
             "ok" if updater.data.get(ATTR_STATE, False) else "unreachable"
         )
 
+        metrics: RequestMetrics = updater.luci.metrics
+        if metrics.count > 0:
+            info[f"{updater.ip} requests"] = (
+                f"{metrics.count} requests, "
+                f"p95 {round(metrics.latency.percentile(95) * 1000)} ms, "  # type: ignore
+                f"{metrics.error_count} errors"
+            )
+
     return info
@@ -0,0 +1,180 @@
+"""Mesh topology model and structural deltas."""
+
+from __future__ import annotations
+
+from typing import Any, Final
+
+from .const import (
+    EVENT_TYPE_TOPOLOGY_BACKHAUL_CHANGED,
+    EVENT_TYPE_TOPOLOGY_NODE_JOINED,
+    EVENT_TYPE_TOPOLOGY_NODE_LEFT,
+    EVENT_TYPE_TOPOLOGY_PARENT_CHANGED,
+)
+
+# Raw fields describing how a node is linked to its parent
+BACKHAUL_KEYS: Final = ("backhaul", "backhauls", "is_wired", "wired")
+
+
+class TopologyNode:
+    """Normalised mesh node."""
+
+    __slots__ = ("key", "mac", "ip", "name", "hardware", "parent", "backhaul")
+
+    def __init__(
+        self,
+        key: str,
+        mac: str | None,
+        ip: str | None,
+        name: str | None,
+        hardware: str | None,
+        parent: str | None,
+        backhaul: Any,
+    ) -> None:
+        """Initialize node.
+
+        :param key: str: Stable identity, MAC or ip address
+        :param mac: str | None: MAC address
+        :param ip: str | None: Ip address
+        :param name: str | None: Node name
+        :param hardware: str | None: Hardware model
+        :param parent: str | None: Parent node key
+        :param backhaul: Any: Backhaul description reported by the router
+        """
+
+        self.key: str = key
+        self.mac: str | None = mac
+        self.ip: str | None = ip
+        self.name: str | None = name
+        self.hardware: str | None = hardware
+        self.parent: str | None = parent
+        self.backhaul: Any = backhaul
+
+    def as_dict(self) -> dict[str, Any]:
+        """Node summary.
+
+        :return dict[str, Any]
+        """
+
+        return {
+            "node": self.key,
+            "mac": self.mac,
+            "ip": self.ip,
+            "name": self.name,
+            "hardware": self.hardware,
+            "parent": self.parent,
+            "backhaul": self.backhaul,
+        }
+
+
+def _node_key(node: dict) -> str | None:
+    """Stable identity of a raw node.
+
+    :param node: dict: Raw node
+    :return str | None: MAC, ip address or None for nodes without identity
+    """
+
+    if mac := node.get("mac"):
+        return str(mac).upper()
+
+    return node.get("ip") or None
+
+
+def _backhaul(node: dict) -> Any:
+    """Backhaul description of a raw node.
+
+    :param node: dict: Raw node
+    :return Any
+    """
+
+    for key in BACKHAUL_KEYS:
+        if key in node:
+            return node[key]
+
+    return None
+
+
+def parse_topology(topo_data: dict | None) -> dict[str, TopologyNode]:
+    """Normalise a topo_graph response into nodes keyed by identity.
+
+    Walks nested "leafs" and the flat "nodes" list of the root. Nodes
+    without MAC and ip address cannot be tracked between polls and are skipped.
+
+    :param topo_data: dict | None: topo_graph response
+    :return dict[str, TopologyNode]
+    """
+
+    nodes: dict[str, TopologyNode] = {}
+
+    if not isinstance(topo_data, dict) or not isinstance(
+        graph := topo_data.get("graph"), dict
+    ):
+        return nodes
+
+    def _walk(node: dict, parent: str | None) -> None:
+        if (key := _node_key(node)) is not None and key not in nodes:
+            nodes[key] = TopologyNode(
+                key,
+                str(node["mac"]).upper() if node.get("mac") else None,
+                node.get("ip") or None,
+                node.get("name"),
+                node.get("hardware"),
+                parent,
+                _backhaul(node),
+            )
+
+        for child in node.get("leafs", []) or []:
+            if isinstance(child, dict):
+                _walk(child, key if key is not None else parent)
+
+    _walk(graph, None)
+
+    root: str | None = _node_key(graph)
+
+    for node in graph.get("nodes", []) or []:
+        if isinstance(node, dict) and _node_key(node) not in nodes:
+            _walk(node, root)
+
+    return nodes
+
+
+def diff_topology(
+    previous: dict[str, TopologyNode], current: dict[str, TopologyNode]
+) -> list[tuple[str, dict[str, Any]]]:
+    """Structural changes between two topologies.
+
+    :param previous: dict[str, TopologyNode]: Previous nodes
+    :param current: dict[str, TopologyNode]: Current nodes
+    :return list[tuple[str, dict[str, Any]]]: Event type and data pairs
+    """
+
+    deltas: list[tuple[str, dict[str, Any]]] = []
+
+    for key, node in current.items():
+        if (old := previous.get(key)) is None:
+            deltas.append((EVENT_TYPE_TOPOLOGY_NODE_JOINED, node.as_dict()))
+
+            continue
+
+        if old.parent != node.parent:
+            deltas.append(
+                (
+                    EVENT_TYPE_TOPOLOGY_PARENT_CHANGED,
+                    node.as_dict() | {"old_parent": old.parent},
+                )
+            )
+
+        if old.backhaul != node.backhaul:
+            deltas.append(
+                (
+                    EVENT_TYPE_TOPOLOGY_BACKHAUL_CHANGED,
+                    node.as_dict() | {"old_backhaul": old.backhaul},
+                )
+            )
+
+    deltas.extend(
+        (EVENT_TYPE_TOPOLOGY_NODE_LEFT, node.as_dict())
+        for key, node in previous.items()
+        if key not in current
+    )
+
+    return deltas
@@ -45,6 +45,7 @@ from .const import (
 )
 from .frontend import (
     async_download_panel_if_needed,
+    async_get_panel_version_service,
     async_remove_miwifi_panel,
     async_register_panel,
     read_local_version,
@@ -269,8 +270,13 @@ class MiWifiPanelUpdate(MiWifiEntity, UpdateEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
+        service = async_get_panel_version_service(self._updater.hass)
+
         return {
-            "last_checked": dt_util.now().isoformat(),
+            "last_checked": dt_util.as_local(service.last_check).isoformat()
+            if service.last_check is not None
+            else None,
+            "last_check_duration": service.last_check_duration,
         }
         
     @property
@@ -300,14 +306,14 @@ class MiWifiPanelUpdate(MiWifiEntity, UpdateEntity):
         )
 
     async def async_install(self, version: str | None, backup: bool, **kwargs: Any) -> None:
-        from .frontend import async_download_panel_if_needed, async_register_panel, read_local_version
+        from .frontend import async_download_panel_if_needed, async_register_panel, async_get_panel_version_service
 
         hass = self._updater.hass
 
         remote_version = await async_download_panel_if_needed(hass)
         await async_register_panel(hass, remote_version)
 
-        new_local_version = await read_local_version(hass)
+        new_local_version = await async_get_panel_version_service(hass).async_load_local_version()
 
         self._attr_installed_version = new_local_version
         self._attr_latest_version = remote_version
@@ -4,8 +4,9 @@
 from __future__ import annotations
 
 import asyncio
-import aiohttp
 import contextlib
+import time
+from collections.abc import Iterator, Mapping, MutableMapping
 from .logger import _LOGGER
 from .unsupported import UNSUPPORTED
 from datetime import datetime, timedelta
@@ -15,20 +16,25 @@ from homeassistant.util import dt as dt_util
 
 import os
 import homeassistant.components.persistent_notification as pn
-from homeassistant.const import CONF_IP_ADDRESS
+from homeassistant.const import CONF_DEVICE_ID, CONF_IP_ADDRESS, CONF_TYPE
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import event
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.httpx_client import create_async_httpx_client
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.httpx_client import get_async_client
 from homeassistant.helpers.storage import Store, STORAGE_DIR
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import utcnow
-from httpx import codes
+from httpx import AsyncHTTPTransport, Limits, codes
 
 from .const import (
+    CLIENT_KEEPALIVE_EXPIRY,
+    CLIENT_MAX_CONNECTIONS,
+    DATA_REGISTRY,
     ATTR_BINARY_SENSOR_WAN_LINK,
     ATTR_BINARY_SENSOR_WAN_LINK_NAME,
     ATTR_BINARY_SENSOR_DUAL_BAND,
@@ -42,6 +48,8 @@ from .const import (
     ATTR_DEVICE_SW_VERSION,
     ATTR_LIGHT_LED,
     ATTR_MODEL,
+    ATTR_SENSOR_API_ERRORS,
+    ATTR_SENSOR_API_LATENCY,
     ATTR_SENSOR_AP_SIGNAL,
     ATTR_SENSOR_DEVICES,
     ATTR_SENSOR_DEVICES_2_4,
@@ -91,17 +99,25 @@ from .const import (
     ATTR_WIFI_DATA_FIELDS,
     DEFAULT_ACTIVITY_DAYS,
     DEFAULT_CALL_DELAY,
+    DEFAULT_MEDIUM_SCAN_INTERVAL,
     DEFAULT_MANUFACTURER,
     DEFAULT_NAME,
     DEFAULT_RETRY,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SLOW_SCAN_INTERVAL,
+    DEFAULT_STAGE_CONCURRENCY,
+    DEFAULT_STAGE_REFRESH_COOLDOWN,
+    DEFAULT_DEVICE_ACTIVITY_RESOLUTION,
+    DEFAULT_DEVICE_SAVE_DELAY,
     DEFAULT_TIMEOUT,
     DOMAIN,
+    EVENT_LUCI,
     NAME,
     SIGNAL_NEW_DEVICE,
     UPDATER,
 )
 from .enum import (
+    Cadence,
     Connection,
     DeviceAction,
     EncryptionAlgorithm,
@@ -111,8 +127,11 @@ from .enum import (
     Wifi,
 )
 from .exceptions import LuciConnectionError, LuciError, LuciRequestError
+from .frontend import async_get_panel_version_service
 from .luci import LuciClient
+from .metrics import StageProfiler
 from .self_check import async_self_check
+from .topology import TopologyNode, diff_topology, parse_topology
 
 PREPARE_METHODS: Final = (
     "init",
@@ -124,13 +143,43 @@ PREPARE_METHODS: Final = (
     "led",
     "wifi",
     "channels",
+    "mac_filter",
     "devices",
     "device_list",
     "device_restore",
     "ap",
     "new_status",
+    "topo",
 )
 
+# Stages not listed here only wait for "init", which detects the model
+# used by the unsupported-methods check. A stage reading values another
+# stage writes to data must list it here.
+PREPARE_DEPENDENCIES: Final = {
+    "init": (),
+    "rom_update": ("status",),
+    "channels": ("wifi",),
+    "devices": ("status", "mode", "mac_filter"),
+    "device_list": ("devices",),
+    "device_restore": ("device_list",),
+    "ap": ("mode",),
+    "new_status": ("device_list",),
+    "topo": ("status",),
+}
+
+# Stages not listed here run on every poll. Slower stages reuse the values
+# already stored in data until their interval has elapsed. "wan" stays on
+# every poll so outages and recoveries are reported without delay.
+PREPARE_CADENCE: Final = {
+    "init": Cadence.SLOW,
+    "vpn": Cadence.MEDIUM,
+    "rom_update": Cadence.SLOW,
+    "led": Cadence.MEDIUM,
+    "wifi": Cadence.MEDIUM,
+    "channels": Cadence.SLOW,
+    "mac_filter": Cadence.MEDIUM,
+}
+
 NEW_STATUS_MAP: Final = {
     "2g": ATTR_SENSOR_DEVICES_2_4,
     "5g": ATTR_SENSOR_DEVICES_5_0,
@@ -146,6 +195,298 @@ REPEATER_SKIP_ATTRS: Final = (
     ATTR_TRACKER_OPTIONAL_MAC,
 )
 
+# Device fields compared between polls to build the change set
+DEVICE_DIFF_ATTRS: Final = (
+    ATTR_TRACKER_ENTRY_ID,
+    ATTR_TRACKER_NAME,
+    ATTR_TRACKER_IP,
+    ATTR_TRACKER_ONLINE,
+    ATTR_TRACKER_CONNECTION,
+    ATTR_TRACKER_ROUTER_MAC_ADDRESS,
+    ATTR_TRACKER_SIGNAL,
+    ATTR_TRACKER_DOWN_SPEED,
+    ATTR_TRACKER_UP_SPEED,
+    ATTR_TRACKER_OPTIONAL_MAC,
+    ATTR_TRACKER_INTERNET_BLOCKED,
+)
+
+ACTIVITY_FORMAT: Final = "%Y-%m-%dT%H:%M:%S"
+
+# Fields held in DeviceRecord slots, other keys go to a side dict
+DEVICE_RECORD_ATTRS: Final = (
+    ATTR_TRACKER_ENTRY_ID,
+    ATTR_TRACKER_UPDATER_ENTRY_ID,
+    ATTR_TRACKER_MAC,
+    ATTR_TRACKER_ROUTER_MAC_ADDRESS,
+    ATTR_TRACKER_SIGNAL,
+    ATTR_TRACKER_NAME,
+    ATTR_TRACKER_IP,
+    ATTR_TRACKER_CONNECTION,
+    ATTR_TRACKER_DOWN_SPEED,
+    ATTR_TRACKER_UP_SPEED,
+    ATTR_TRACKER_ONLINE,
+    ATTR_TRACKER_LAST_ACTIVITY,
+    ATTR_TRACKER_FIRST_SEEN,
+    ATTR_TRACKER_OPTIONAL_MAC,
+    ATTR_TRACKER_INTERNET_BLOCKED,
+    ATTR_TRACKER_TOTAL_USAGE,
+)
+
+# Device fields held as epoch seconds instead of ISO strings
+EPOCH_ATTRS: Final = (ATTR_TRACKER_LAST_ACTIVITY, ATTR_TRACKER_FIRST_SEEN)
+
+_UNSET: Final = object()
+
+
+def _to_epoch(value: Any) -> Any:
+    """Convert an activity timestamp to epoch seconds.
+
+    :param value: Any: ISO timestamp
+    :return Any: epoch seconds, or the value when it is not a timestamp
+    """
+
+    if not isinstance(value, str):
+        return value
+
+    try:
+        return int(datetime.strptime(value, ACTIVITY_FORMAT).timestamp())
+    except ValueError:
+        return value
+
+
+def _from_epoch(value: Any) -> Any:
+    """Convert epoch seconds to an activity timestamp.
+
+    :param value: Any: epoch seconds
+    :return Any: ISO timestamp, or the value when it is not epoch seconds
+    """
+
+    if not isinstance(value, int) or isinstance(value, bool):
+        return value
+
+    return datetime.fromtimestamp(value).isoformat()
+
+
+def _to_seconds(value: Any) -> Any:
+    """Convert a formatted online time to seconds.
+
+    :param value: Any: str(timedelta) value
+    :return Any: seconds, or the value when it is not an online time
+    """
+
+    if not isinstance(value, str):
+        return value
+
+    try:
+        days: int = 0
+
+        if ", " in value:
+            day_part, value = value.split(", ", 1)
+            days = int(day_part.split()[0])
+
+        hours, minutes, seconds = value.split(":")
+
+        return days * 86400 + int(hours) * 3600 + int(minutes) * 60 + int(float(seconds))
+    except ValueError:
+        return value
+
+
+def _from_seconds(value: Any) -> Any:
+    """Convert seconds to a formatted online time.
+
+    :param value: Any: seconds
+    :return Any: str(timedelta) value, or the value when it is not seconds
+    """
+
+    if not isinstance(value, int) or isinstance(value, bool):
+        return value
+
+    return str(timedelta(seconds=value))
+
+
+class DeviceRecord(MutableMapping):
+    """Tracked device with slotted fields and a dict interface.
+
+    Timestamps are held as epoch seconds and online time as seconds; they are
+    formatted only when read through the mapping interface, raw values are
+    available through raw() and snapshot().
+    """
+
+    __slots__ = DEVICE_RECORD_ATTRS + ("_extra",)
+
+    def __init__(self, data: Mapping[str, Any] | None = None) -> None:
+        """Initialize record.
+
+        :param data: Mapping[str, Any] | None: Device fields
+        """
+
+        for attr in DEVICE_RECORD_ATTRS:
+            setattr(self, attr, _UNSET)
+
+        self._extra: dict[str, Any] | None = None
+
+        if data:
+            self.update(data)
+
+    def raw(self, key: str, default: Any = None) -> Any:
+        """Unformatted value.
+
+        :param key: str: Field
+        :param default: Any: Value when the field is not set
+        :return Any
+        """
+
+        if key in _DEVICE_RECORD_SLOTS:
+            value: Any = getattr(self, key)
+
+            return default if value is _UNSET else value
+
+        return default if self._extra is None else self._extra.get(key, default)
+
+    def snapshot(self, keys: tuple[str, ...]) -> tuple:
+        """Unformatted values for comparison.
+
+        :param keys: tuple[str, ...]: Fields
+        :return tuple
+        """
+
+        return tuple(self.raw(key) for key in keys)
+
+    def raw_items(self) -> list[tuple[str, Any]]:
+        """Unformatted set fields.
+
+        :return list[tuple[str, Any]]
+        """
+
+        return [(key, self.raw(key)) for key in self]
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _DEVICE_RECORD_SLOTS:
+            if self._extra is None:
+                raise KeyError(key)
+
+            return self._extra[key]
+
+        if (value := getattr(self, key)) is _UNSET:
+            raise KeyError(key)
+
+        if key in EPOCH_ATTRS:
+            return _from_epoch(value)
+
+        if key == ATTR_TRACKER_ONLINE:
+            return _from_seconds(value)
+
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in _DEVICE_RECORD_SLOTS:
+            if self._extra is None:
+                self._extra = {}
+
+            self._extra[key] = value
+
+            return
+
+        if key in EPOCH_ATTRS:
+            value = _to_epoch(value)
+        elif key == ATTR_TRACKER_ONLINE:
+            value = _to_seconds(value)
+
+        setattr(self, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in _DEVICE_RECORD_SLOTS:
+            if self._extra is None:
+                raise KeyError(key)
+
+            del self._extra[key]
+
+            return
+
+        if getattr(self, key) is _UNSET:
+            raise KeyError(key)
+
+        setattr(self, key, _UNSET)
+
+    def __iter__(self) -> Iterator[str]:
+        for attr in DEVICE_RECORD_ATTRS:
+            if getattr(self, attr) is not _UNSET:
+                yield attr
+
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(
+            getattr(self, attr) is not _UNSET for attr in DEVICE_RECORD_ATTRS
+        ) + (len(self._extra) if self._extra is not None else 0)
+
+    def __ior__(self, other: Mapping[str, Any]) -> DeviceRecord:
+        self.update(other)
+
+        return self
+
+    def __or__(self, other: Mapping[str, Any]) -> dict[str, Any]:
+        return dict(self) | dict(other)
+
+    def __repr__(self) -> str:
+        return f"DeviceRecord({dict(self)!r})"
+
+
+_DEVICE_RECORD_SLOTS: Final = frozenset(DEVICE_RECORD_ATTRS)
+
+
+def as_device_record(device: Mapping[str, Any]) -> DeviceRecord:
+    """Device as a record, without copying records.
+
+    :param device: Mapping[str, Any]: Device
+    :return DeviceRecord
+    """
+
+    return device if isinstance(device, DeviceRecord) else DeviceRecord(device)
+
+
+class DeviceChanges:
+    """Devices changed between two polls."""
+
+    def __init__(
+        self,
+        new: set[str],
+        changed: dict[str, set[str]],
+        gone: set[str],
+        present: set[str],
+    ) -> None:
+        """Initialize change set.
+
+        :param new: set[str]: MACs seen now but not in the previous poll
+        :param changed: dict[str, set[str]]: Changed fields by MAC
+        :param gone: set[str]: MACs seen in the previous poll but not now
+        :param present: set[str]: MACs seen in this poll
+        """
+
+        self.new = new
+        self.changed = changed
+        self.gone = gone
+        self.present = present
+
+    def __contains__(self, mac: object) -> bool:
+        """Is device new, changed or gone
+
+        :param mac: object
+        :return bool
+        """
+
+        return mac in self.new or mac in self.changed or mac in self.gone
+
+    def __len__(self) -> int:
+        """Count of affected devices
+
+        :return int
+        """
+
+        return len(self.new) + len(self.changed) + len(self.gone)
+
+
 # pylint: disable=too-many-branches,too-many-lines,too-many-arguments
 class LuciUpdater(DataUpdateCoordinator):
     """Luci data updater for interaction with Luci API."""
@@ -161,6 +502,8 @@ class LuciUpdater(DataUpdateCoordinator):
 
     _entry_id: str | None = None
     _scan_interval: int
+    _medium_scan_interval: int
+    _slow_scan_interval: int
     _activity_days: int
     _is_only_login: bool = False
     _is_reauthorization: bool = True
@@ -178,6 +521,8 @@ class LuciUpdater(DataUpdateCoordinator):
         store: Store | None = None,
         is_only_login: bool = False,
         entry_id: str | None = None,
+        medium_scan_interval: int = DEFAULT_MEDIUM_SCAN_INTERVAL,
+        slow_scan_interval: int = DEFAULT_SLOW_SCAN_INTERVAL,
     ) -> None:
         """Initialize updater.
 
@@ -193,10 +538,26 @@ class LuciUpdater(DataUpdateCoordinator):
         :param store: Store | None: Device store
         :param is_only_login: bool: Only config flow
         :param entry_id: str | None: Entry ID
+        :param medium_scan_interval: int: Update interval of medium cadence stages
+        :param slow_scan_interval: int: Update interval of slow cadence stages
         """
 
+        # Each router gets its own keep-alive pool, closed in async_stop.
+        # Home Assistant clients cannot be closed by integrations, so the
+        # pool is held by a transport owned by the updater.
+        self._transport = AsyncHTTPTransport(
+            verify=False,
+            limits=Limits(
+                max_connections=CLIENT_MAX_CONNECTIONS,
+                max_keepalive_connections=CLIENT_MAX_CONNECTIONS,
+                keepalive_expiry=CLIENT_KEEPALIVE_EXPIRY,
+            ),
+        )
+
         self.luci = LuciClient(
-            get_async_client(hass, False),
+            create_async_httpx_client(
+                hass, verify_ssl=False, auto_cleanup=False, transport=self._transport
+            ),
             ip,
             password,
             EncryptionAlgorithm(encryption),
@@ -207,6 +568,8 @@ class LuciUpdater(DataUpdateCoordinator):
         self.is_force_load = is_force_load
         self._entry_id = entry_id
         self._scan_interval = scan_interval
+        self._medium_scan_interval = medium_scan_interval
+        self._slow_scan_interval = slow_scan_interval
         self._activity_days = activity_days
         self._is_only_login = is_only_login
 
@@ -225,10 +588,33 @@ class LuciUpdater(DataUpdateCoordinator):
             )
 
         self.data: dict[str, Any] = {}
-        self.devices: dict[str, dict[str, Any]] = {}
+        self.devices: dict[str, DeviceRecord] = {}
+        self.device_changes: DeviceChanges | None = None
+        self._device_snapshot: dict[str, tuple] = {}
+        self._stored_devices: dict[str, dict[str, Any]] = {}
+        self._dirty_devices: set[str] = set()
+        self._is_store_synced: bool = False
+        self._seen_devices: set[str] = set()
         self._signals: dict[str, int] = {}
+        self._blocked_macs: set[str] = set()
+        self.topology: dict[str, TopologyNode] | None = None
         self._moved_devices: list = []
         self._is_first_update: bool = True
+        self._stage_semaphore = asyncio.Semaphore(DEFAULT_STAGE_CONCURRENCY)
+        self._stage_updated: dict[str, float] = {}
+        self._stage_lock = asyncio.Lock()
+        self._dirty_stages: set[str] = set()
+        self._stage_debouncer: Debouncer | None = None
+        self.profiler: StageProfiler = StageProfiler()
+
+        if hass is not None and not is_only_login:
+            self._stage_debouncer = Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=DEFAULT_STAGE_REFRESH_COOLDOWN,
+                immediate=False,
+                function=self._async_refresh_dirty_stages,
+            )
 
     async def async_stop(self, clean_store: bool = False) -> None:
         """Stop updater
@@ -239,12 +625,23 @@ class LuciUpdater(DataUpdateCoordinator):
         if self.new_device_callback is not None:
             self.new_device_callback()  # pylint: disable=not-callable
 
+        await self.async_shutdown()
+
         if clean_store and self._store is not None:
             await self._store.async_remove()
         else:
             await self._async_save_devices()
 
         await self.luci.logout()
+        await self._transport.aclose()
+
+    async def async_shutdown(self) -> None:
+        """Cancel scheduled poll and stage refreshes, and ignore new runs."""
+
+        await super().async_shutdown()
+
+        if self._stage_debouncer is not None:
+            self._stage_debouncer.async_shutdown()
 
     @cached_property
     def _update_interval(self) -> timedelta:
@@ -275,12 +672,8 @@ class LuciUpdater(DataUpdateCoordinator):
 
                 await self.luci.login()
 
-            for method in PREPARE_METHODS:
-                if not self._is_only_login or method == "init":
-                    
-                    if method in ("devices", "device_list") and "new_status" in self.data and self.is_force_load:
-                        continue
-                    await self._async_prepare(method, self.data)
+            async with self._stage_lock:
+                await self._async_prepare_stages(self.data)
 
         except LuciConnectionError as _e:
             _err = _e
@@ -329,22 +722,15 @@ class LuciUpdater(DataUpdateCoordinator):
 
         if not self._is_only_login:
             self._clean_devices()
+            self._diff_devices()
 
         if "new_status" not in self.data:
             await self._async_prepare_new_status(self.data)
-            
-        await self._async_prepare_topo()
 
-        # Panel frontend version check (local + remote)
-        try:
-            from .frontend import read_local_version, read_remote_version
-            async with aiohttp.ClientSession() as session:
-                local = await read_local_version(self.hass)
-                remote = await read_remote_version(session)
-                self.data["panel_local_version"] = local
-                self.data["panel_remote_version"] = remote
-        except Exception as e:
-            _LOGGER.warning("[MiWiFi] No se pudo actualizar la versión del panel frontend: %s", e)
+        # Panel frontend versions are refreshed by the shared panel service
+        self.data.update(async_get_panel_version_service(self.hass).versions)
+
+        self._update_request_metrics()
 
         return self.data
 
@@ -424,6 +810,134 @@ class LuciUpdater(DataUpdateCoordinator):
             utcnow().replace(microsecond=0) + offset,
         )
 
+    @callback
+    def async_request_stage_refresh(self, *methods: str) -> None:
+        """Mark stages as dirty and refresh them after a short debounce.
+
+        Writes made within the cooldown are coalesced into a single run.
+
+        :param methods: str: Prepare stages changed by the caller
+        """
+
+        self._dirty_stages.update(methods)
+
+        if self._stage_debouncer is not None:
+            self._stage_debouncer.async_schedule_call()
+
+    async def async_refresh_stages(self, *methods: str) -> None:
+        """Run stages now, together with any pending dirty stages.
+
+        Same as async_request_stage_refresh, for callers that need the
+        result before returning.
+
+        :param methods: str: Prepare stages to refresh
+        """
+
+        self._dirty_stages.update(methods)
+
+        await self._async_refresh_dirty_stages()
+
+    async def _async_refresh_dirty_stages(self) -> None:
+        """Run the stages marked as dirty and notify listeners."""
+
+        if not self._dirty_stages:
+            return
+
+        methods: set[str] = self._dirty_stages
+        self._dirty_stages = set()
+
+        try:
+            async with self._stage_lock:
+                await self._async_prepare_stages(self.data, methods)
+        except LuciError as _e:
+            _LOGGER.debug("Stage refresh error %s: %r", sorted(methods), _e)
+
+            return
+
+        if methods & {"devices", "device_list"}:
+            self._diff_devices()
+
+        self.async_update_listeners()
+
+    async def _async_prepare_stages(
+        self, data: dict, only: set[str] | None = None
+    ) -> None:
+        """Run prepare stages, concurrently where dependencies allow.
+
+        :param data: dict
+        :param only: set[str] | None: Run only these stages, regardless of cadence
+        """
+
+        methods: list[str] = [
+            method
+            for method in PREPARE_METHODS
+            if (not self._is_only_login or method == "init")
+            and not (
+                method in ("devices", "device_list")
+                and "new_status" in data
+                and self.is_force_load
+            )
+            and (method in only if only is not None else self._is_stage_due(method))
+        ]
+
+        tasks: dict[str, asyncio.Task] = {}
+        self.profiler.start_refresh(partial=only is not None)
+
+        async def _async_run(method: str) -> None:
+            """Wait for dependencies and run stage.
+
+            :param method: str
+            """
+
+            if dependencies := [
+                tasks[dependency]
+                for dependency in PREPARE_DEPENDENCIES.get(method, ("init",))
+                if dependency in tasks
+            ]:
+                await asyncio.gather(*dependencies)
+
+            async with self._stage_semaphore:
+                with self.profiler.measure(method):
+                    await self._async_prepare(method, data)
+
+            self._stage_updated[method] = time.monotonic()
+
+        # PREPARE_METHODS lists dependencies before their dependents
+        for method in methods:
+            tasks[method] = asyncio.create_task(_async_run(method))
+
+        results: list = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        self.profiler.finish_refresh()
+
+        # Raise the first failure in stage order, like a sequential run would
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    def _is_stage_due(self, method: str) -> bool:
+        """Check whether the stage cadence interval has elapsed.
+
+        :param method: str
+        :return bool: is due
+        """
+
+        cadence: Cadence = PREPARE_CADENCE.get(method, Cadence.FAST)
+
+        if (
+            cadence == Cadence.FAST
+            or self._is_first_update
+            or method not in self._stage_updated
+        ):
+            return True
+
+        interval: int = (
+            self._medium_scan_interval
+            if cadence == Cadence.MEDIUM
+            else self._slow_scan_interval
+        )
+
+        return time.monotonic() - self._stage_updated[method] >= interval
+
     async def _async_prepare(self, method: str, data: dict) -> None:
         """Prepare data.
 
@@ -516,6 +1030,7 @@ class LuciUpdater(DataUpdateCoordinator):
         if "hardware" in response and isinstance(response["hardware"], dict):
             if "mac" in response["hardware"]:
                 data[ATTR_DEVICE_MAC_ADDRESS] = response["hardware"]["mac"]
+                async_get_registry(self.hass).async_index_router(self)
             if "sn" in response["hardware"]:
                 data[ATTR_DEVICE_HW_VERSION] = response["hardware"]["sn"]
             if "version" in response["hardware"]:
@@ -818,25 +1333,30 @@ class LuciUpdater(DataUpdateCoordinator):
                 if "c" in channel and int(channel["c"]) > 0
             ]
 
-    async def _async_prepare_devices(self, data: dict) -> None:
-        """Prepare devices."""
+    async def _async_prepare_mac_filter(self, data: dict) -> None:
+        """Prepare MAC filter.
 
-        self.reset_counter()
+        Indexes the MACs with WAN access blocked, shared by the device stages.
 
-        response: dict = await self.luci.wifi_connect_devices()
+        :param data: dict
+        """
 
-        macfilter_info: dict = await self.luci.macfilter_info()
+        response: dict = await self.luci.macfilter_info()
         filter_macs: dict[str, int] = {}
 
-        for entry in macfilter_info.get("flist", []):
-            mac = entry.get("mac", "").upper()
-            wan = entry.get("authority", {}).get("wan", 1)
-            filter_macs[mac] = wan
+        for entry in response.get("flist", []) + response.get("list", []):
+            filter_macs[entry.get("mac", "").upper()] = entry.get(
+                "authority", {}
+            ).get("wan", 1)
+
+        self._blocked_macs = {mac for mac, wan in filter_macs.items() if wan == 0}
 
-        for entry in macfilter_info.get("list", []):
-            mac = entry.get("mac", "").upper()
-            wan = entry.get("authority", {}).get("wan", 1)
-            filter_macs[mac] = wan
+    async def _async_prepare_devices(self, data: dict) -> None:
+        """Prepare devices."""
+
+        self.reset_counter()
+
+        response: dict = await self.luci.wifi_connect_devices()
 
         if "list" in response:
             integrations: dict[str, dict] = {}
@@ -850,12 +1370,10 @@ class LuciUpdater(DataUpdateCoordinator):
                 self._signals[mac] = device["signal"] if "signal" in device else 0
 
                 if mac in self.devices:
-                    self.devices[mac][ATTR_TRACKER_LAST_ACTIVITY] = datetime.now().replace(microsecond=0).isoformat()
+                    self.devices[mac][ATTR_TRACKER_LAST_ACTIVITY] = int(time.time())
+                    self._seen_devices.add(mac)
 
-                if mac in filter_macs:
-                    device[ATTR_TRACKER_INTERNET_BLOCKED] = (filter_macs[mac] == 0)
-                else:
-                    device[ATTR_TRACKER_INTERNET_BLOCKED] = False
+                device[ATTR_TRACKER_INTERNET_BLOCKED] = mac in self._blocked_macs
 
                 if self.is_repeater and self.is_force_load:
                     device |= {
@@ -891,19 +1409,6 @@ class LuciUpdater(DataUpdateCoordinator):
                     await self._async_prepare_devices(data)
             return
 
-        macfilter_info: dict = await self.luci.macfilter_info()
-        filter_macs: dict[str, int] = {}
-
-        for entry in macfilter_info.get("flist", []):
-            mac = entry.get("mac", "").upper()
-            wan = entry.get("authority", {}).get("wan", 1)
-            filter_macs[mac] = wan
-
-        for entry in macfilter_info.get("list", []):
-            mac = entry.get("mac", "").upper()
-            wan = entry.get("authority", {}).get("wan", 1)
-            filter_macs[mac] = wan
-
         integrations: dict[str, dict] = async_get_integrations(self.hass)
 
         mac_to_ip: dict[str, str] = {
@@ -969,10 +1474,7 @@ class LuciUpdater(DataUpdateCoordinator):
                 device[ATTR_TRACKER_UPDATER_ENTRY_ID] = self._entry_id
                 mac = device.get("mac", "").upper()
 
-                if mac in filter_macs:
-                    device[ATTR_TRACKER_INTERNET_BLOCKED] = (filter_macs[mac] == 0)
-                else:
-                    device[ATTR_TRACKER_INTERNET_BLOCKED] = False
+                device[ATTR_TRACKER_INTERNET_BLOCKED] = mac in self._blocked_macs
 
                 self.add_device(device, action=action, integrations=integrations)
 
@@ -1053,6 +1555,9 @@ class LuciUpdater(DataUpdateCoordinator):
                         }
 
                         integration[UPDATER].devices[mac] = device
+                        async_get_registry(self.hass).async_add_client(
+                            mac, integration[UPDATER]
+                        )
 
                         self._moved_devices.append(mac)
 
@@ -1068,6 +1573,7 @@ class LuciUpdater(DataUpdateCoordinator):
                 }
 
             self.devices[mac] = device
+            async_get_registry(self.hass).async_add_client(mac, self)
 
             async_dispatcher_send(
                 self.hass, SIGNAL_NEW_DEVICE, device | {ATTR_TRACKER_IS_RESTORED: True}
@@ -1094,7 +1600,8 @@ class LuciUpdater(DataUpdateCoordinator):
 
         is_new: bool = device[ATTR_TRACKER_MAC] not in self.devices
 
-        _device: dict[str, Any] = self._build_device(device, integrations)
+        _device: DeviceRecord = self._build_device(device, integrations)
+        self._seen_devices.add(device[ATTR_TRACKER_MAC])
 
         if (
             self.is_repeater
@@ -1103,7 +1610,7 @@ class LuciUpdater(DataUpdateCoordinator):
         ):
             self.devices[device[ATTR_TRACKER_MAC]] |= {
                 key: value
-                for key, value in _device.items()
+                for key, value in _device.raw_items()
                 if (
                     (not is_from_parent and key not in REPEATER_SKIP_ATTRS)
                     or (is_from_parent and key in REPEATER_SKIP_ATTRS)
@@ -1113,6 +1620,9 @@ class LuciUpdater(DataUpdateCoordinator):
         else:
             self.devices[device[ATTR_TRACKER_MAC]] = _device
 
+        if is_new:
+            async_get_registry(self.hass).async_add_client(device[ATTR_TRACKER_MAC], self)
+
         if not is_from_parent and action == DeviceAction.MOVE:
             self._moved_devices.append(device[ATTR_TRACKER_MAC])
 
@@ -1148,7 +1658,7 @@ class LuciUpdater(DataUpdateCoordinator):
 
     def _build_device(
         self, device: dict, integrations: dict[str, Any] | None = None
-    ) -> dict[str, Any]:
+    ) -> DeviceRecord:
 
         ip_attr: dict | None = device["ip"][0] if "ip" in device and device["ip"] else None
 
@@ -1160,7 +1670,10 @@ class LuciUpdater(DataUpdateCoordinator):
         with contextlib.suppress(ValueError):
             connection = Connection(int(device["type"])) if "type" in device else None
 
-        return {
+        last_activity: int = int(time.time())
+        previous: DeviceRecord | None = self.devices.get(device[ATTR_TRACKER_MAC])
+
+        return DeviceRecord({
             ATTR_TRACKER_ENTRY_ID: device[ATTR_TRACKER_ENTRY_ID],
             ATTR_TRACKER_UPDATER_ENTRY_ID: device.get(
                 ATTR_TRACKER_UPDATER_ENTRY_ID, device[ATTR_TRACKER_ENTRY_ID]
@@ -1175,13 +1688,13 @@ class LuciUpdater(DataUpdateCoordinator):
             ATTR_TRACKER_CONNECTION: connection,
             ATTR_TRACKER_DOWN_SPEED: float(ip_attr["downspeed"]) if ip_attr and "downspeed" in ip_attr else 0.0,
             ATTR_TRACKER_UP_SPEED: float(ip_attr["upspeed"]) if ip_attr and "upspeed" in ip_attr else 0.0,
-            ATTR_TRACKER_ONLINE: str(timedelta(seconds=int(ip_attr["online"] if ip_attr else 0))),
-            ATTR_TRACKER_LAST_ACTIVITY: datetime.now().replace(microsecond=0).isoformat(),
-            ATTR_TRACKER_FIRST_SEEN: self.devices.get(device[ATTR_TRACKER_MAC], {}).get(ATTR_TRACKER_FIRST_SEEN, datetime.now().replace(microsecond=0).isoformat()),
+            ATTR_TRACKER_ONLINE: int(ip_attr["online"] if ip_attr else 0),
+            ATTR_TRACKER_LAST_ACTIVITY: last_activity,
+            ATTR_TRACKER_FIRST_SEEN: previous.raw(ATTR_TRACKER_FIRST_SEEN, last_activity) if previous is not None else last_activity,
             ATTR_TRACKER_OPTIONAL_MAC: integrations[ip_attr["ip"]][UPDATER].data.get(ATTR_DEVICE_MAC_ADDRESS, None)
                 if integrations and ip_attr and ip_attr["ip"] in integrations else None,
             ATTR_TRACKER_INTERNET_BLOCKED: device.get(ATTR_TRACKER_INTERNET_BLOCKED, False),
-        }
+        })
 
 
     def _mass_update_device(self, device: dict, integrations: dict) -> bool:
@@ -1192,25 +1705,31 @@ class LuciUpdater(DataUpdateCoordinator):
         :return bool: is found
         """
 
-        is_found: bool = False
+        mac: str = device[ATTR_TRACKER_MAC]
 
-        for _ip, integration in integrations.items():
-            if (
-                device[ATTR_TRACKER_MAC] not in integration[UPDATER].devices
-                or _ip == self.ip
-            ):
-                continue
+        updaters: list[LuciUpdater] = [
+            updater
+            for updater in async_get_registry(self.hass).get_client_updaters(mac)
+            if updater is not self and mac in updater.devices
+        ]
 
-            _device: dict[str, Any] = self._build_device(device, integrations)
-            if self.is_repeater and self.is_force_load:
-                for attr in REPEATER_SKIP_ATTRS:
-                    if attr in _device:
-                        del _device[attr]
+        if not updaters:
+            return False
+
+        _device: DeviceRecord = self._build_device(device, integrations)
+        is_skip: bool = self.is_repeater and self.is_force_load
 
-            integration[UPDATER].devices[device[ATTR_TRACKER_MAC]] |= _device
-            is_found = True
+        fields: dict[str, Any] = {
+            key: value
+            for key, value in _device.raw_items()
+            if not is_skip or key not in REPEATER_SKIP_ATTRS
+        }
+
+        for updater in updaters:
+            updater.devices[mac] |= fields
+            updater._seen_devices.add(mac)
 
-        return is_found
+        return True
 
     async def _async_prepare_ap(self, data: dict) -> None:
         """Prepare wifi ap.
@@ -1258,34 +1777,97 @@ class LuciUpdater(DataUpdateCoordinator):
             #_LOGGER.warning("📶 Calculated LAN devices: %s", data[ATTR_SENSOR_DEVICES_LAN])
 
 
+    def _update_request_metrics(self) -> None:
+        """Publish request metrics for the diagnostic sensors"""
+
+        latency: float | None = self.luci.metrics.latency.percentile(95)
+
+        self.data[ATTR_SENSOR_API_LATENCY] = (
+            round(latency * 1000) if latency is not None else None
+        )
+        self.data[ATTR_SENSOR_API_ERRORS] = self.luci.metrics.error_count
+
+    def _diff_devices(self) -> None:
+        """Compare devices with the previous poll and publish the change set."""
+
+        snapshot: dict[str, tuple] = {
+            mac: device.snapshot(DEVICE_DIFF_ATTRS)
+            for mac, device in self.devices.items()
+        }
+
+        present: set[str] = self._seen_devices
+        self._seen_devices = set()
+
+        previous: set[str] = (
+            self.device_changes.present if self.device_changes is not None else set()
+        )
+
+        changed: dict[str, set[str]] = {}
+
+        for mac, values in snapshot.items():
+            before: tuple | None = self._device_snapshot.get(mac)
+
+            if before is None or before == values:
+                continue
+
+            changed[mac] = {
+                attr
+                for attr, old, new in zip(DEVICE_DIFF_ATTRS, before, values)
+                if old != new
+            }
+
+        self.device_changes = DeviceChanges(
+            present - previous,
+            changed,
+            (previous - present) | (self._device_snapshot.keys() - snapshot.keys()),
+            present,
+        )
+
+        self._dirty_devices |= (
+            changed.keys()
+            | self.device_changes.gone
+            | (snapshot.keys() - self._device_snapshot.keys())
+        )
+        self._device_snapshot = snapshot
+
+        # Activity of online devices is persisted at a coarse resolution
+        now: int = int(time.time())
+
+        for mac in present:
+            stored: dict | None = self._stored_devices.get(mac)
+
+            if (
+                stored is None
+                or not isinstance(stored.get(ATTR_TRACKER_LAST_ACTIVITY), int)
+                or now - stored[ATTR_TRACKER_LAST_ACTIVITY]
+                >= DEFAULT_DEVICE_ACTIVITY_RESOLUTION
+            ):
+                self._dirty_devices.add(mac)
+
+        self._schedule_save_devices()
+
     def _clean_devices(self) -> None:
         """Clean devices."""
 
         if self._activity_days == 0 or len(self.devices) == 0:
             return
 
-        now = datetime.now().replace(microsecond=0)
-        devices: dict = self.devices.copy()
+        now: int = int(time.time())
+        devices: dict[str, DeviceRecord] = self.devices.copy()
 
         for mac, device in devices.items():
-            if ATTR_TRACKER_LAST_ACTIVITY not in device or not isinstance(
-                device[ATTR_TRACKER_LAST_ACTIVITY], str
+            if not isinstance(
+                last_activity := device.raw(ATTR_TRACKER_LAST_ACTIVITY), int
             ):
-                # fmt: off
-                self.devices[mac][ATTR_TRACKER_LAST_ACTIVITY] = \
-                    datetime.now().replace(microsecond=0).isoformat()
-                # fmt: on
+                device[ATTR_TRACKER_LAST_ACTIVITY] = now
 
                 continue
 
-            delta = now - datetime.strptime(
-                device[ATTR_TRACKER_LAST_ACTIVITY], "%Y-%m-%dT%H:%M:%S"
-            )
-
-            if int(delta.days) <= self._activity_days:
+            if (now - last_activity) // 86400 <= self._activity_days:
                 continue
 
             del self.devices[mac]
+            async_get_registry(self.hass).async_remove_client(mac, self)
 
     def reset_counter(self, is_force: bool = False, is_remove: bool = False) -> None:
         """Reset counter
@@ -1321,22 +1903,114 @@ class LuciUpdater(DataUpdateCoordinator):
         if devices is None or not isinstance(devices, dict) or len(devices) == 0:
             return None
 
-        return devices
+        return {
+            mac: self._expand_device(mac, device)
+            for mac, device in devices.items()
+            if isinstance(device, dict)
+        }
+
+    def _compact_device(self, device: DeviceRecord) -> dict[str, Any]:
+        """Stored form of a device.
+
+        The MAC is the key and entry ids equal to this updater are implied,
+        activity timestamps are stored as epoch seconds.
+
+        :param device: DeviceRecord: Device
+        :return dict[str, Any]
+        """
+
+        compact: dict[str, Any] = {
+            attr: value
+            for attr, value in device.raw_items()
+            if attr not in (ATTR_TRACKER_MAC, ATTR_TRACKER_UPDATER_ENTRY_ID)
+        }
+
+        if compact.get(ATTR_TRACKER_ENTRY_ID) == self._entry_id:
+            del compact[ATTR_TRACKER_ENTRY_ID]
+
+        return compact
+
+    def _expand_device(self, mac: str, device: dict[str, Any]) -> DeviceRecord:
+        """Device from its stored form, compact or legacy.
+
+        :param mac: str: Device MAC
+        :param device: dict[str, Any]: Stored device
+        :return DeviceRecord
+        """
+
+        expanded: DeviceRecord = DeviceRecord(device)
+
+        expanded.setdefault(ATTR_TRACKER_MAC, mac)
+        expanded.setdefault(ATTR_TRACKER_ENTRY_ID, self._entry_id)
+        expanded.setdefault(
+            ATTR_TRACKER_UPDATER_ENTRY_ID, expanded[ATTR_TRACKER_ENTRY_ID]
+        )
+
+        return expanded
+
+    def _devices_to_store(self) -> dict[str, dict[str, Any]]:
+        """Store data, rebuilding only the devices marked dirty.
+
+        Called by the Store at write time, so dirty records are compacted
+        from their current state. The Store serializes the result in the
+        executor, so it gets its own copy of every stored device.
+
+        :return dict[str, dict[str, Any]]
+        """
+
+        macs: set[str] = (
+            self._dirty_devices
+            if self._is_store_synced
+            else self._dirty_devices | self._stored_devices.keys() | self.devices.keys()
+        )
+
+        for mac in macs:
+            if (device := self.devices.get(mac)) is None:
+                self._stored_devices.pop(mac, None)
+            else:
+                self._stored_devices[mac] = self._compact_device(device)
+
+        self._dirty_devices = set()
+        self._is_store_synced = True
+
+        return {mac: dict(stored) for mac, stored in self._stored_devices.items()}
+
+    def _is_store_enabled(self) -> bool:
+        """Whether devices are persisted by this updater.
+
+        :return bool
+        """
+
+        return (
+            self._store is not None
+            and not (self.is_repeater and not self.is_force_load)
+            and len(self.devices) > 0
+        )
+
+    @callback
+    def _schedule_save_devices(self) -> None:
+        """Schedule a delayed Store write when devices changed."""
+
+        if not self._dirty_devices or not self._is_store_enabled():
+            return
+
+        self._store.async_delay_save(  # type: ignore
+            self._devices_to_store, DEFAULT_DEVICE_SAVE_DELAY
+        )
 
     async def _async_save_devices(self) -> None:
         """Async save devices to Store"""
 
-        if (
-            self._store is None
-            or (self.is_repeater and not self.is_force_load)
-            or len(self.devices) == 0
-        ):
+        if not self._is_store_enabled():
             return
 
-        await self._store.async_save(self.devices)
+        await self._store.async_save(self._devices_to_store())  # type: ignore
 
-    async def _async_prepare_topo(self) -> None:
-        """Prepare topology graph information."""
+    async def _async_prepare_topo(self, data: dict | None = None) -> None:
+        """Prepare topology graph information.
+
+        :param data: dict | None: unused, the graph is stored in self.data
+        """
         try:
             topo_data = await self.luci.topo_graph()
 
@@ -1392,25 +2066,9 @@ class LuciUpdater(DataUpdateCoordinator):
             self.data["topo_graph"] = topo_data
             _LOGGER.debug("[MiWiFi] Topology graph data received for router at %s: %s", self.ip, topo_data)
 
-            for entity in self.hass.states.async_all("sensor"):
-                if entity.entity_id.startswith("sensor.topologia_miwifi"):
-                    g = entity.attributes.get("graph", {})
-                    if g.get("mac") == graph.get("mac"):
-                        clean_attributes = {
-                            "graph": dict(graph),
-                            "code": entity.attributes.get("code", 0),
-                            "icon": entity.attributes.get("icon", "mdi:network"),
-                            "friendly_name": entity.attributes.get("friendly_name", "Topología MiWiFi"),
-                        }
-                        self.hass.states.async_set(entity.entity_id, entity.state, clean_attributes)
-                        #_LOGGER.debug("[MiWiFi] 🔄 Sensor %s actualizado con graph limpio", entity.entity_id)
+            self._update_topology(topo_data)
 
-            try:
-                self.async_set_updated_data(self.data)
-            except AttributeError:
-                #_LOGGER.debug("[MiWiFi] Coordinator no disponible para router %s", self.ip)
-                pass
-            
+            # The topology sensor picks the graph up from the coordinator data
             nodes = graph.get("nodes")
             if isinstance(nodes, list):
                 for node in nodes:
@@ -1430,11 +2088,177 @@ class LuciUpdater(DataUpdateCoordinator):
             self.data["topo_graph"] = None
 
 
+    def _update_topology(self, topo_data: dict) -> None:
+        """Fire structural topology changes as Luci events.
+
+        :param topo_data: dict: topo_graph response
+        """
+
+        topology: dict[str, TopologyNode] = parse_topology(topo_data)
+        previous: dict[str, TopologyNode] | None = self.topology
+        self.topology = topology
+
+        if previous is None or not (deltas := diff_topology(previous, topology)):
+            return
+
+        device: dr.DeviceEntry | None = dr.async_get(self.hass).async_get_device(
+            {(DOMAIN, self.data.get(ATTR_DEVICE_MAC_ADDRESS, self.ip))}
+        )
+
+        if device is None:
+            return
+
+        for event_type, event_data in deltas:
+            _LOGGER.debug("[MiWiFi] Topology %s at %s: %s", event_type, self.ip, event_data)
+
+            self.hass.bus.async_fire(
+                EVENT_LUCI,
+                {CONF_DEVICE_ID: device.id, CONF_TYPE: event_type} | event_data,
+            )
+
     @property
     def entry_id(self) -> str | None:
         """Return the config entry ID."""
         return self._entry_id
 
+
+class IntegrationRegistry:
+    """Index of loaded routers by IP, entry ID and MAC address."""
+
+    def __init__(self) -> None:
+        """Initialize registry."""
+
+        self.integrations: dict[str, dict] = {}
+        self._by_entry_id: dict[str, LuciUpdater] = {}
+        self._by_router_mac: dict[str, LuciUpdater] = {}
+        self._clients: dict[str, set[LuciUpdater]] = {}
+
+    @callback
+    def async_register(self, entry_id: str, ip: str, updater: LuciUpdater) -> None:
+        """Register a router.
+
+        :param entry_id: str: Entry ID
+        :param ip: str: Router ip address
+        :param updater: LuciUpdater: Luci updater object
+        """
+
+        self.integrations[ip] = {
+            UPDATER: updater,
+            ATTR_TRACKER_ENTRY_ID: entry_id,
+        }
+        self._by_entry_id[entry_id] = updater
+        self.async_index_router(updater)
+
+        for mac in updater.devices:
+            self.async_add_client(mac, updater)
+
+    @callback
+    def async_unregister(self, entry_id: str) -> None:
+        """Remove a router and its clients.
+
+        :param entry_id: str: Entry ID
+        """
+
+        if (updater := self._by_entry_id.pop(entry_id, None)) is None:
+            return
+
+        if self.integrations.get(updater.ip, {}).get(UPDATER) is updater:
+            del self.integrations[updater.ip]
+
+        for mac, router in list(self._by_router_mac.items()):
+            if router is updater:
+                del self._by_router_mac[mac]
+
+        for mac in list(self._clients):
+            self.async_remove_client(mac, updater)
+
+    @callback
+    def async_index_router(self, updater: LuciUpdater) -> None:
+        """Index the router by its own MAC address.
+
+        :param updater: LuciUpdater: Luci updater object
+        """
+
+        if mac := updater.data.get(ATTR_DEVICE_MAC_ADDRESS):
+            self._by_router_mac[mac.upper()] = updater
+
+    @callback
+    def async_add_client(self, mac: str, updater: LuciUpdater) -> None:
+        """Record that an updater tracks a client.
+
+        :param mac: str: Client MAC address
+        :param updater: LuciUpdater: Luci updater object
+        """
+
+        self._clients.setdefault(mac, set()).add(updater)
+
+    @callback
+    def async_remove_client(self, mac: str, updater: LuciUpdater) -> None:
+        """Forget that an updater tracks a client.
+
+        :param mac: str: Client MAC address
+        :param updater: LuciUpdater: Luci updater object
+        """
+
+        if (updaters := self._clients.get(mac)) is None:
+            return
+
+        updaters.discard(updater)
+
+        if not updaters:
+            del self._clients[mac]
+
+    def get_by_entry_id(self, entry_id: str) -> LuciUpdater | None:
+        """Return updater by entry ID.
+
+        :param entry_id: str: Entry ID
+        :return LuciUpdater | None
+        """
+
+        return self._by_entry_id.get(entry_id)
+
+    def get_by_ip(self, ip: str) -> LuciUpdater | None:
+        """Return updater by ip address.
+
+        :param ip: str: Router ip address
+        :return LuciUpdater | None
+        """
+
+        return self.integrations[ip][UPDATER] if ip in self.integrations else None
+
+    def get_by_router_mac(self, mac: str) -> LuciUpdater | None:
+        """Return updater by router MAC address.
+
+        :param mac: str: Router MAC address
+        :return LuciUpdater | None
+        """
+
+        return self._by_router_mac.get(mac.upper())
+
+    def get_client_updaters(self, mac: str) -> set[LuciUpdater]:
+        """Return updaters tracking a client.
+
+        :param mac: str: Client MAC address
+        :return set[LuciUpdater]
+        """
+
+        return self._clients.get(mac, set())
+
+
+@callback
+def async_get_registry(hass: HomeAssistant) -> IntegrationRegistry:
+    """Return integration registry.
+
+    :param hass: HomeAssistant
+    :return IntegrationRegistry
+    """
+
+    if DATA_REGISTRY not in hass.data:
+        hass.data[DATA_REGISTRY] = IntegrationRegistry()
+
+    return hass.data[DATA_REGISTRY]
+
+
 @callback
 def async_get_integrations(hass: HomeAssistant) -> dict[str, dict]:
     """Return integrations map.
@@ -1443,14 +2267,7 @@ def async_get_integrations(hass: HomeAssistant) -> dict[str, dict]:
     :return dict[str, dict]
     """
 
-    return {
-        integration[CONF_IP_ADDRESS]: {
-            UPDATER: integration[UPDATER],
-            ATTR_TRACKER_ENTRY_ID: entry_id,
-        }
-        for entry_id, integration in hass.data[DOMAIN].items()
-        if isinstance(integration, dict)
-    }
+    return async_get_registry(hass).integrations
 
 
 @callback
@@ -1462,22 +2279,14 @@ def async_get_updater(hass: HomeAssistant, identifier: str) -> LuciUpdater:
     :return LuciUpdater
     """
 
-    _error: str = f"Integration with identifier: {identifier} not found."
-
-    if DOMAIN not in hass.data:
-        raise ValueError(_error)
-
-    if identifier in hass.data[DOMAIN] and UPDATER in hass.data[DOMAIN][identifier]:
-        return hass.data[DOMAIN][identifier][UPDATER]
+    registry: IntegrationRegistry = async_get_registry(hass)
 
-    if integrations := [
-        integration[UPDATER]
-        for integration in hass.data[DOMAIN].values()
-        if isinstance(integration, dict) and integration[CONF_IP_ADDRESS] == identifier
-    ]:
-        return integrations[0]
+    if updater := registry.get_by_entry_id(identifier) or registry.get_by_ip(
+        identifier
+    ):
+        return updater
 
-    raise ValueError(_error)
+    raise ValueError(f"Integration with identifier: {identifier} not found.")
 
 
 async def async_update_panel_entity(hass: HomeAssistant, updater: LuciUpdater, async_add_entities=None):
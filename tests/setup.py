@@ -34,7 +34,8 @@ from custom_components.miwifi.const import (
 )
 from custom_components.miwifi.enum import EncryptionAlgorithm
 from custom_components.miwifi.helper import get_config_value, get_store
-from custom_components.miwifi.updater import LuciUpdater
+from custom_components.miwifi.metrics import RequestMetrics
+from custom_components.miwifi.updater import LuciUpdater, async_get_registry
 
 MOCK_IP_ADDRESS: Final = "192.168.31.1"
 MOCK_PASSWORD: Final = "**REDACTED**"
@@ -111,14 +112,26 @@ async def async_setup(
         CONF_IP_ADDRESS: _ip,
         UPDATER: updater,
     }
+    async_get_registry(hass).async_register(config_entry.entry_id, _ip, updater)
 
     return [updater, config_entry]
 
 
+async def async_mock_updater_luci_client(mock_luci_client) -> None:
+    """Mock, with the QoS, MAC filter and raw GET calls of a full refresh"""
+
+    await async_mock_luci_client(mock_luci_client)
+
+    mock_luci_client.return_value.get = AsyncMock(return_value={})
+    mock_luci_client.return_value.qos_info = AsyncMock(return_value={})
+    mock_luci_client.return_value.macfilter_info = AsyncMock(return_value={})
+
+
 async def async_mock_luci_client(mock_luci_client) -> None:
     """Mock"""
 
     mock_luci_client.return_value.logout = AsyncMock(return_value=None)
+    mock_luci_client.return_value.metrics = RequestMetrics()
     mock_luci_client.return_value.login = AsyncMock(
         return_value=json.loads(load_fixture("login_data.json"))
     )
@@ -64,12 +64,11 @@ async def test_init(hass: HomeAssistant) -> None:
     ), patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket, patch(
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ), patch(
         "custom_components.miwifi.updater.asyncio.sleep", return_value=None
     ):
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
         await async_mock_luci_client(mock_luci_client)
 
         setup_data: list = await async_setup(hass)
@@ -120,14 +119,13 @@ async def test_update_state(hass: HomeAssistant) -> None:
     ) as mock_luci_client, patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket, patch(
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ), patch(
         "custom_components.miwifi.updater.asyncio.sleep", return_value=None
     ):
         await async_mock_luci_client(mock_luci_client)
 
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
         def success() -> dict:
             return json.loads(load_fixture("status_data.json"))
 
@@ -192,14 +190,13 @@ async def test_update_wan_state(hass: HomeAssistant) -> None:
     ) as mock_luci_client, patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket, patch(
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ), patch(
         "custom_components.miwifi.updater.asyncio.sleep", return_value=None
     ):
         await async_mock_luci_client(mock_luci_client)
 
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
         def success() -> dict:
             return json.loads(load_fixture("device_list_data.json"))
 
@@ -272,14 +269,13 @@ async def test_update_dual_band(hass: HomeAssistant) -> None:
     ) as mock_luci_client, patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket, patch(
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ), patch(
         "custom_components.miwifi.updater.asyncio.sleep", return_value=None
     ):
         await async_mock_luci_client(mock_luci_client)
 
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
         def success() -> dict:
             return json.loads(load_fixture("device_list_data.json"))
 
@@ -372,14 +368,13 @@ async def test_update_vpn_state(hass: HomeAssistant) -> None:
     ) as mock_luci_client, patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket, patch(
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ), patch(
         "custom_components.miwifi.updater.asyncio.sleep", return_value=None
     ):
         await async_mock_luci_client(mock_luci_client)
 
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
         def success() -> dict:
             return json.loads(load_fixture("device_list_data.json"))
 
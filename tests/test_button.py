@@ -61,12 +61,11 @@ async def test_init(hass: HomeAssistant) -> None:
     ), patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket, patch(
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ), patch(
         "custom_components.miwifi.updater.asyncio.sleep", return_value=None
     ):
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
         await async_mock_luci_client(mock_luci_client)
 
         setup_data: list = await async_setup(hass)
@@ -98,14 +97,13 @@ async def test_update_reboot(hass: HomeAssistant) -> None:
     ) as mock_luci_client, patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket, patch(
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ), patch(
         "custom_components.miwifi.updater.asyncio.sleep", return_value=None
     ):
         await async_mock_luci_client(mock_luci_client)
 
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
         def success() -> dict:
             return json.loads(load_fixture("device_list_data.json"))
 
@@ -165,6 +163,7 @@ async def test_update_reboot(hass: HomeAssistant) -> None:
         )
 
         assert len(mock_luci_client.mock_calls) == _prev_calls + 1
+        assert updater._dirty_stages == {"status"}
 
         assert await hass.services.async_call(
             BUTTON_DOMAIN,
@@ -4,10 +4,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from datetime import timedelta
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from homeassistant.components.device_tracker import (
@@ -33,9 +34,9 @@ from custom_components.miwifi.const import (
     ATTRIBUTION,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
-    MANUFACTURERS,
     UPDATER,
 )
+from custom_components.miwifi.device_tracker import PortProber, async_get_port_prober
 from custom_components.miwifi.enum import Connection
 from custom_components.miwifi.helper import generate_entity_id
 from custom_components.miwifi.updater import LuciUpdater
@@ -63,10 +64,9 @@ async def test_init(hass: HomeAssistant) -> None:
     ) as mock_luci_client, patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket:
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ):
         await async_mock_luci_client(mock_luci_client)
 
         setup_data: list = await async_setup(hass)
@@ -148,12 +148,11 @@ async def test_init_with_restore(hass: HomeAssistant) -> None:
     ) as mock_luci_client, patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket, patch(
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ), patch(
         "custom_components.miwifi.helper.Store"
     ) as mock_store:
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
         await async_mock_luci_client(mock_luci_client)
 
         mock_store.return_value.async_load = AsyncMock(
@@ -257,10 +256,9 @@ async def test_init_with_parent(hass: HomeAssistant) -> None:
     ) as mock_luci_client_first, patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket_first:
-        mock_socket_first.return_value.recv.return_value = AsyncMock(return_value=None)
-
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ):
         await async_mock_luci_client(mock_luci_client_first)
 
         mock_luci_client_first.return_value.device_list = AsyncMock(
@@ -355,10 +353,9 @@ async def test_init_with_parent(hass: HomeAssistant) -> None:
     ) as mock_luci_client_second, patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket_second:
-        mock_socket_second.return_value.recv.return_value = AsyncMock(return_value=None)
-
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ):
         await async_mock_luci_client(mock_luci_client_second)
 
         mock_luci_client_second.return_value.mode = AsyncMock(
@@ -473,10 +470,9 @@ async def test_init_with_parent_revert(hass: HomeAssistant) -> None:
     ) as mock_luci_client_first, patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket_first:
-        mock_socket_first.return_value.recv.return_value = AsyncMock(return_value=None)
-
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ):
         await async_mock_luci_client(mock_luci_client_first)
 
         def parent() -> dict:
@@ -579,10 +575,9 @@ async def test_init_with_parent_revert(hass: HomeAssistant) -> None:
     ) as mock_luci_client_second, patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket_second:
-        mock_socket_second.return_value.recv.return_value = AsyncMock(return_value=None)
-
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ):
         await async_mock_luci_client(mock_luci_client_second)
 
         mock_luci_client_second.return_value.mode = AsyncMock(
@@ -770,10 +765,9 @@ async def test_init_in_force_mode(hass: HomeAssistant) -> None:
     ) as mock_luci_client, patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket:
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ):
         await async_mock_luci_client(mock_luci_client)
 
         mock_luci_client.return_value.mode = AsyncMock(
@@ -845,10 +839,9 @@ async def test_init_with_force_and_parent(hass: HomeAssistant) -> None:
     ) as mock_luci_client_first, patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket_first:
-        mock_socket_first.return_value.recv.return_value = AsyncMock(return_value=None)
-
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ):
         await async_mock_luci_client(mock_luci_client_first)
 
         mock_luci_client_first.return_value.device_list = AsyncMock(
@@ -943,10 +936,9 @@ async def test_init_with_force_and_parent(hass: HomeAssistant) -> None:
     ) as mock_luci_client_second, patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket_second:
-        mock_socket_second.return_value.recv.return_value = AsyncMock(return_value=None)
-
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ):
         await async_mock_luci_client(mock_luci_client_second)
 
         mock_luci_client_second.return_value.mode = AsyncMock(
@@ -1061,12 +1053,11 @@ async def test_init_with_restore_without_connection(hass: HomeAssistant) -> None
     ) as mock_luci_client, patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket, patch(
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ), patch(
         "custom_components.miwifi.helper.Store"
     ) as mock_store:
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
         await async_mock_luci_client(mock_luci_client)
 
         mock_store.return_value.async_load = AsyncMock(
@@ -1172,10 +1163,9 @@ async def test_init_with_optional_parent(hass: HomeAssistant) -> None:
     ) as mock_luci_client_second, patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket_second:
-        mock_socket_second.return_value.recv.return_value = AsyncMock(return_value=None)
-
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ):
         await async_mock_luci_client(mock_luci_client_second)
 
         mock_luci_client_second.return_value.mode = AsyncMock(
@@ -1206,10 +1196,9 @@ async def test_init_with_optional_parent(hass: HomeAssistant) -> None:
     ) as mock_luci_client_first, patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket_first:
-        mock_socket_first.return_value.recv.return_value = AsyncMock(return_value=None)
-
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ):
         await async_mock_luci_client(mock_luci_client_first)
 
         mock_luci_client_first.return_value.device_list = AsyncMock(
@@ -1327,12 +1316,11 @@ async def test_init_with_restore_and_remove(hass: HomeAssistant) -> None:
     ) as mock_luci_client, patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket, patch(
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ), patch(
         "custom_components.miwifi.helper.Store"
     ) as mock_store:
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
         await async_mock_luci_client(mock_luci_client)
 
         mock_store.return_value.async_load = AsyncMock(
@@ -1428,10 +1416,9 @@ async def test_init_detect_manufacturer(hass: HomeAssistant) -> None:
     ) as mock_luci_client, patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket:
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ):
         await async_mock_luci_client(mock_luci_client)
 
         mock_luci_client.return_value.device_list = AsyncMock(
@@ -1488,7 +1475,7 @@ async def test_init_detect_manufacturer(hass: HomeAssistant) -> None:
             set(), {(dr.CONNECTION_NETWORK_MAC, "CC:50:E3:96:29:78")}
         )
 
-        assert device.manufacturer == MANUFACTURERS["CC50E3"]
+        assert device.manufacturer == "Espressif Inc."
 
 
 @pytest.mark.asyncio
@@ -1503,11 +1490,9 @@ async def test_init_detect_url(hass: HomeAssistant) -> None:
     ) as mock_luci_client, patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket:
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-        mock_socket.return_value.connect_ex = Mock(return_value=0)
-
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        AsyncMock(return_value=True),
+    ):
         await async_mock_luci_client(mock_luci_client)
 
         mock_luci_client.return_value.device_list = AsyncMock(
@@ -1557,6 +1542,43 @@ async def test_init_detect_url(hass: HomeAssistant) -> None:
         assert device.configuration_url == "http://192.168.31.2"
 
 
+@pytest.mark.asyncio
+async def test_port_prober(
+    hass: HomeAssistant, socket_enabled  # pylint: disable=unused-argument
+) -> None:
+    """Test port prober.
+
+    :param hass: HomeAssistant
+    :param socket_enabled: Allow local sockets
+    """
+
+    server = await asyncio.start_server(
+        lambda reader, writer: writer.close(), "127.0.0.1", 0
+    )
+    open_port: int = server.sockets[0].getsockname()[1]
+
+    closed = await asyncio.start_server(
+        lambda reader, writer: writer.close(), "127.0.0.1", 0
+    )
+    closed_port: int = closed.sockets[0].getsockname()[1]
+    closed.close()
+    await closed.wait_closed()
+
+    prober = PortProber(timeout=1)
+
+    assert await prober.async_probe("127.0.0.1", [closed_port, open_port]) == open_port
+
+    server.close()
+    await server.wait_closed()
+
+    assert await prober.async_probe("127.0.0.1", [closed_port, open_port]) == open_port
+    assert (
+        await PortProber(timeout=1).async_probe("127.0.0.1", [closed_port, open_port])
+        is None
+    )
+    assert async_get_port_prober(hass) is async_get_port_prober(hass)
+
+
 def _generate_id(mac: str) -> str:
     """Generate unique id
 
@@ -5,7 +5,7 @@
 from __future__ import annotations
 
 import logging
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 from homeassistant.components.diagnostics import async_redact_data
@@ -108,12 +108,11 @@ async def test_init(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
     with patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket, patch(
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ), patch(
         "custom_components.miwifi.updater.asyncio.sleep", return_value=None
     ):
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
         setup_data: list = await async_setup(hass)
 
         config_entry: MockConfigEntry = setup_data[1]
@@ -0,0 +1,320 @@
+"""Tests for the miwifi component."""
+
+# pylint: disable=no-member,too-many-statements,protected-access,too-many-lines
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from aiohttp import ClientError, hdrs
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+from homeassistant.util.dt import utcnow
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+)
+
+from custom_components.miwifi.const import (
+    MAIN_ROUTER_SAVE_DELAY,
+    MAIN_ROUTER_STORE,
+    MAIN_ROUTER_STORE_FILE,
+    MAIN_ROUTER_STORE_VERSION,
+    PANEL_LOCAL_PATH,
+    PANEL_MONITOR_RETRY_INTERVAL,
+    PANEL_REPO_BASE_URL,
+    PANEL_REPO_FILES_URL,
+    PANEL_REPO_VERSION_URL,
+    PANEL_VERSION_CHECK_INTERVAL,
+)
+from custom_components.miwifi.frontend import (
+    MainRouterStore,
+    PanelVersionService,
+    async_clear_manual_main_mac,
+    async_get_main_router_store,
+    async_get_panel_version_service,
+    async_load_manual_main_mac,
+    async_save_manual_main_mac,
+    async_start_panel_monitor,
+    download_panel_files,
+    async_stop_panel_monitor,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def test_panel_version_service(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Panel version service test"""
+
+    service: PanelVersionService = async_get_panel_version_service(hass)
+    assert async_get_panel_version_service(hass) is service
+    assert service.versions == {}
+
+    aioclient_mock.get(
+        PANEL_REPO_VERSION_URL,
+        text='{"version": "1.3.0"}',
+        headers={hdrs.ETAG: '"v1"'},
+    )
+
+    assert await service.async_check_remote_version() == "1.3.0"
+    assert aioclient_mock.mock_calls[0][3] == {}
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(PANEL_REPO_VERSION_URL, status=304)
+
+    assert await service.async_check_remote_version() == "1.3.0"
+    assert aioclient_mock.mock_calls[0][3] == {hdrs.IF_NONE_MATCH: '"v1"'}
+
+    service.async_set_local_version("1.2.3")
+    assert service.versions == {
+        "panel_local_version": "1.2.3",
+        "panel_remote_version": "1.3.0",
+    }
+
+
+@pytest.mark.asyncio
+async def test_panel_monitor(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Panel monitor test"""
+
+    aioclient_mock.get(PANEL_REPO_VERSION_URL, exc=ClientError)
+
+    service: PanelVersionService = async_get_panel_version_service(hass)
+
+    async_start_panel_monitor(hass)
+    async_start_panel_monitor(hass)
+    await hass.async_block_till_done()
+
+    assert aioclient_mock.call_count == 1
+    assert service.failures == 1
+    assert service.last_check is not None
+    assert service.last_check_duration is not None
+    assert service._unsub_check is not None
+
+    async_fire_time_changed(
+        hass, utcnow() + PANEL_MONITOR_RETRY_INTERVAL + timedelta(seconds=1)
+    )
+    await hass.async_block_till_done()
+
+    assert aioclient_mock.call_count == 2
+    assert service.failures == 2
+
+    async_stop_panel_monitor(hass)
+    async_stop_panel_monitor(hass)
+
+    assert service._unsub_check is None
+
+    async_fire_time_changed(
+        hass, utcnow() + PANEL_VERSION_CHECK_INTERVAL + timedelta(seconds=1)
+    )
+    await hass.async_block_till_done()
+
+    assert aioclient_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_panel_monitor_restart_during_check(hass: HomeAssistant) -> None:
+    """Panel monitor stop and start while a scheduled check is running"""
+
+    service: PanelVersionService = async_get_panel_version_service(hass)
+
+    calls: list[int] = []
+    release: asyncio.Event = asyncio.Event()
+
+    async def check_remote_version() -> str:
+        calls.append(len(calls) + 1)
+
+        if len(calls) == 2:
+            await release.wait()
+
+        return "1.3.0"
+
+    now = utcnow()
+
+    with patch.object(service, "async_check_remote_version", check_remote_version):
+        async_start_panel_monitor(hass)
+        await hass.async_block_till_done()
+
+        assert len(calls) == 1
+
+        async_fire_time_changed(
+            hass, now + PANEL_VERSION_CHECK_INTERVAL + timedelta(seconds=1)
+        )
+        await asyncio.sleep(0)
+
+        assert len(calls) == 2
+
+        async_stop_panel_monitor(hass)
+        async_start_panel_monitor(hass)
+        release.set()
+        await hass.async_block_till_done()
+
+        assert len(calls) == 3
+
+        async_fire_time_changed(
+            hass, now + PANEL_VERSION_CHECK_INTERVAL * 2 + timedelta(seconds=2)
+        )
+        await hass.async_block_till_done()
+
+        assert len(calls) == 4
+
+        async_stop_panel_monitor(hass)
+
+
+@pytest.mark.asyncio
+async def test_download_panel_files(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, tmp_path
+) -> None:
+    """Panel files download test"""
+
+    hass.config.config_dir = str(tmp_path)
+
+    style: bytes = b"body {}"
+    aioclient_mock.get(
+        PANEL_REPO_FILES_URL,
+        json={
+            "files": [
+                "panel-frontend.js",
+                {"path": "style.css", "sha256": hashlib.sha256(style).hexdigest()},
+            ]
+        },
+    )
+    aioclient_mock.get(
+        f"{PANEL_REPO_BASE_URL}panel-frontend.js",
+        text="const v = '__MIWIFI_VERSION__';",
+        headers={hdrs.ETAG: '"js1"'},
+    )
+    aioclient_mock.get(f"{PANEL_REPO_BASE_URL}style.css", content=style)
+
+    session = async_get_clientsession(hass)
+    await download_panel_files(hass, session, "1.3.0")
+
+    script = tmp_path / PANEL_LOCAL_PATH / "panel-frontend.js"
+    assert script.read_text() == "const v = '1.3.0';"
+    assert (tmp_path / PANEL_LOCAL_PATH / "style.css").read_bytes() == style
+    assert not list((tmp_path / PANEL_LOCAL_PATH).glob("*.part"))
+    assert aioclient_mock.call_count == 3
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(PANEL_REPO_FILES_URL, json={"files": ["panel-frontend.js"]})
+    aioclient_mock.get(f"{PANEL_REPO_BASE_URL}panel-frontend.js", status=304)
+
+    await download_panel_files(hass, session, "1.3.0")
+
+    assert aioclient_mock.call_count == 2
+    assert aioclient_mock.mock_calls[1][3] == {hdrs.IF_NONE_MATCH: '"js1"'}
+    assert script.read_text() == "const v = '1.3.0';"
+
+
+@pytest.mark.asyncio
+async def test_download_panel_files_resume(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, tmp_path
+) -> None:
+    """Panel files resume test"""
+
+    hass.config.config_dir = str(tmp_path)
+
+    content: bytes = b"0123456789"
+    part = tmp_path / PANEL_LOCAL_PATH / "icon.png.part"
+    part.parent.mkdir(parents=True)
+    part.write_bytes(content[:4])
+    part_etag = tmp_path / PANEL_LOCAL_PATH / "icon.png.part.etag"
+    part_etag.write_text('"icon1"')
+
+    files: dict = {
+        "files": [{"path": "icon.png", "sha256": hashlib.sha256(content).hexdigest()}]
+    }
+    aioclient_mock.get(PANEL_REPO_FILES_URL, json=files)
+    aioclient_mock.get(
+        f"{PANEL_REPO_BASE_URL}icon.png", status=206, content=content[4:]
+    )
+
+    await download_panel_files(hass, async_get_clientsession(hass), "1.3.0")
+
+    assert aioclient_mock.mock_calls[1][3] == {
+        hdrs.RANGE: "bytes=4-",
+        hdrs.IF_RANGE: '"icon1"',
+    }
+    assert (tmp_path / PANEL_LOCAL_PATH / "icon.png").read_bytes() == content
+    assert not part.exists()
+    assert not part_etag.exists()
+
+    # The remote file changed since the part was written
+    content = b"abcdefghij"
+    files["files"][0]["sha256"] = hashlib.sha256(content).hexdigest()
+    part.write_bytes(b"0123")
+    part_etag.write_text('"icon1"')
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(PANEL_REPO_FILES_URL, json=files)
+    aioclient_mock.get(f"{PANEL_REPO_BASE_URL}icon.png", content=content)
+
+    await download_panel_files(hass, async_get_clientsession(hass), "1.3.1")
+
+    assert (tmp_path / PANEL_LOCAL_PATH / "icon.png").read_bytes() == content
+    assert not part.exists()
+
+    # A part without the ETag it was started with is not resumed
+    content = b"ABCDEFGHIJ"
+    files["files"][0]["sha256"] = hashlib.sha256(content).hexdigest()
+    part.write_bytes(b"0123")
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(PANEL_REPO_FILES_URL, json=files)
+    aioclient_mock.get(f"{PANEL_REPO_BASE_URL}icon.png", content=content)
+
+    await download_panel_files(hass, async_get_clientsession(hass), "1.3.2")
+
+    assert aioclient_mock.mock_calls[1][3] == {}
+    assert (tmp_path / PANEL_LOCAL_PATH / "icon.png").read_bytes() == content
+
+
+@pytest.mark.asyncio
+async def test_main_router_store(hass: HomeAssistant, hass_storage, tmp_path) -> None:
+    """Manual main router store test"""
+
+    hass.config.config_dir = str(tmp_path)
+
+    legacy = tmp_path / MAIN_ROUTER_STORE_FILE
+    legacy.parent.mkdir(parents=True)
+    legacy.write_text(json.dumps({"manual_main_mac": "00:00:00:00:00:01"}))
+
+    store: MainRouterStore = async_get_main_router_store(hass)
+    assert async_get_main_router_store(hass) is store
+
+    assert await async_load_manual_main_mac(hass) == "00:00:00:00:00:01"
+    assert not legacy.exists()
+    assert hass_storage[MAIN_ROUTER_STORE]["data"] == {
+        "manual_main_mac": "00:00:00:00:00:01"
+    }
+
+    with patch.object(Store, "async_load") as mock_load:
+        assert await async_load_manual_main_mac(hass) == "00:00:00:00:00:01"
+        assert mock_load.call_count == 0
+
+    await async_save_manual_main_mac(hass, "00:00:00:00:00:02")
+    assert await async_load_manual_main_mac(hass) == "00:00:00:00:00:02"
+
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=MAIN_ROUTER_SAVE_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+
+    assert hass_storage[MAIN_ROUTER_STORE]["data"] == {
+        "manual_main_mac": "00:00:00:00:00:02"
+    }
+    assert hass_storage[MAIN_ROUTER_STORE]["version"] == MAIN_ROUTER_STORE_VERSION
+
+    await async_clear_manual_main_mac(hass)
+    assert await async_load_manual_main_mac(hass) is None
@@ -0,0 +1,93 @@
+"""Tests for the miwifi component."""
+
+# pylint: disable=no-member,too-many-statements,protected-access,too-many-lines
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant
+
+from custom_components.miwifi.logger import (
+    _LOGGER,
+    LOG_DIR,
+    LOG_FILES,
+    LevelRoutingHandler,
+    set_log_directory,
+)
+
+
+def test_level_routing_handler(tmp_path) -> None:
+    """Level routing handler test"""
+
+    directory = tmp_path / "logs"
+    handler = LevelRoutingHandler(str(directory), LOG_FILES)
+
+    assert not directory.exists()
+
+    logger = logging.getLogger("miwifi.test_level_routing_handler")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+
+    try:
+        logger.warning("Warning %s", 1)
+        logger.error("Error")
+        logger.log(logging.WARNING + 1, "Unrouted")
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+    assert sorted(path.name for path in directory.iterdir()) == [
+        "miwifi_error.log",
+        "miwifi_warning.log",
+    ]
+    assert "WARNING - Warning 1" in (directory / "miwifi_warning.log").read_text()
+    assert "Error" in (directory / "miwifi_error.log").read_text()
+    assert "Warning" not in (directory / "miwifi_error.log").read_text()
+
+
+def test_level_routing_handler_directory(tmp_path) -> None:
+    """Level routing handler without directory test"""
+
+    handler = LevelRoutingHandler(None, LOG_FILES)
+
+    logger = logging.getLogger("miwifi.test_level_routing_handler_directory")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+
+    try:
+        logger.error("Before")
+        handler.set_directory(str(tmp_path / "logs"))
+        logger.error("After")
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+    content: str = (tmp_path / "logs" / "miwifi_error.log").read_text()
+
+    assert "After" in content
+    assert "Before" not in content
+
+
+@pytest.mark.asyncio
+async def test_set_log_directory(hass: HomeAssistant, tmp_path) -> None:
+    """Records logged before the directory is set are written on start"""
+
+    hass.config.config_dir = str(tmp_path)
+
+    _LOGGER.error("Before directory")
+
+    set_log_directory(hass)
+    _LOGGER.error("After directory")
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    content: str = (tmp_path / LOG_DIR / "miwifi_error.log").read_text()
+
+    assert "Before directory" in content
+    assert "After directory" in content
@@ -4,16 +4,24 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 
 import pytest
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.httpx_client import get_async_client
 from httpx import HTTPError, Request
 from pytest_homeassistant_custom_component.common import get_fixture_path, load_fixture
 from pytest_httpx import HTTPXMock
 
+from custom_components.miwifi.const import (
+    CLIENT_TOKEN_MAX_AGE,
+    DIAGNOSTIC_MAX_PATHS,
+    DIAGNOSTIC_MAX_SIZE,
+)
+from custom_components.miwifi.diagnostics import TO_REDACT
 from custom_components.miwifi.enum import EncryptionAlgorithm
 from custom_components.miwifi.exceptions import (
     LuciConnectionError,
@@ -128,6 +136,213 @@ async def test_logout_error(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
     assert client.diagnostics["logout"]["message"] == "Logout error"
 
 
+@pytest.mark.asyncio
+async def test_diagnostics(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
+    """Diagnostics capture test"""
+
+    httpx_mock.add_response(text=load_fixture("login_data.json"), method="POST")
+    httpx_mock.add_response(text='{"code": 0, "list": []}', method="GET")
+
+    client: LuciClient = LuciClient(
+        get_async_client(hass, False), f"{MOCK_IP_ADDRESS}/", "test"
+    )
+
+    await client.login()
+    data: dict = await client.get("misystem/devicelist")
+
+    assert client.diagnostics["misystem/devicelist"]["content"] == data
+    assert client.diagnostics["misystem/devicelist"]["content"] is not data
+    assert client.diagnostics["misystem/devicelist"]["message"] == "Successful request"
+
+    for index in range(DIAGNOSTIC_MAX_PATHS):
+        client._debug("Test", "url", b"raw", f"p{index}")
+
+    assert len(client.diagnostics) == DIAGNOSTIC_MAX_PATHS
+    assert "xqsystem/login" not in client.diagnostics
+
+    size: int = DIAGNOSTIC_MAX_SIZE // 3
+
+    for index in range(4):
+        client._debug("Test", "url", b"x" * size, f"big{index}")
+
+    assert list(client.diagnostics) == ["big1", "big2", "big3"]
+    assert len(client.diagnostics["big3"]["content"]) == size
+
+    client.is_diagnostics_enabled = False
+    client._debug("Test", "url", {}, "disabled")
+
+    assert "disabled" not in client.diagnostics
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_redact_large_body(
+    hass: HomeAssistant, httpx_mock: HTTPXMock
+) -> None:
+    """Large captured bodies stay parseable and redactable test"""
+
+    body: dict = {
+        "code": 0,
+        "token": "secret",
+        "list": [
+            {"mac": f"00:00:00:00:{index // 256:02X}:{index % 256:02X}"}
+            for index in range(512)
+        ],
+    }
+
+    httpx_mock.add_response(text=load_fixture("login_data.json"), method="POST")
+    httpx_mock.add_response(text=json.dumps(body), method="GET")
+
+    client: LuciClient = LuciClient(
+        get_async_client(hass, False), f"{MOCK_IP_ADDRESS}/", "test"
+    )
+
+    await client.login()
+    await client.get("misystem/devicelist")
+
+    assert len(json.dumps(body)) > 4096
+
+    redacted: dict = async_redact_data(client.diagnostics, TO_REDACT)
+    content: dict = redacted["misystem/devicelist"]["content"]
+
+    assert content["token"] == REDACTED
+    assert content["list"] == body["list"]
+
+
+@pytest.mark.asyncio
+async def test_metrics(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
+    """Request metrics test"""
+
+    httpx_mock.add_response(text=load_fixture("login_data.json"), method="POST")
+    httpx_mock.add_response(text='{"code": 0}', method="GET")
+    httpx_mock.add_response(text='{"code": 1}', method="GET")
+    httpx_mock.add_exception(exception=HTTPError("Connection error"), method="GET")
+
+    client: LuciClient = LuciClient(
+        get_async_client(hass, False), f"{MOCK_IP_ADDRESS}/", "test"
+    )
+
+    await client.login()
+    await client.get("misystem/devicelist", {"mlo": 1})
+
+    with pytest.raises(LuciRequestError):
+        await client.get("misystem/devicelist")
+
+    with pytest.raises(LuciConnectionError):
+        await client.get("misystem/devicelist")
+
+    metrics: dict = client.metrics.as_dict()
+
+    assert list(metrics) == ["misystem/devicelist", "xqsystem/login"]
+    assert metrics["misystem/devicelist"]["count"] == 3
+    assert metrics["misystem/devicelist"]["errors"] == {
+        "LuciRequestError": 1,
+        "HTTPError": 1,
+    }
+    assert metrics["misystem/devicelist"]["last_status"] == 200
+    assert metrics["misystem/devicelist"]["total_bytes"] == 22
+    assert metrics["misystem/devicelist"]["latency"]["samples"] == 3
+    assert sum(metrics["misystem/devicelist"]["histogram"].values()) == 3
+    assert client.metrics.count == 4
+    assert client.metrics.error_count == 2
+    assert client.metrics.latency.percentile(95) is not None
+
+
+@pytest.mark.asyncio
+async def test_token_refresh(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
+    """Proactive re-login test"""
+
+    httpx_mock.add_response(
+        text=load_fixture("login_data.json"), method="POST", is_reusable=True
+    )
+    httpx_mock.add_response(text='{"code": 0}', method="GET", is_reusable=True)
+
+    client: LuciClient = LuciClient(
+        get_async_client(hass, False), f"{MOCK_IP_ADDRESS}/", "test"
+    )
+
+    await client.login()
+    await client.get("misystem/status")
+
+    assert len(httpx_mock.get_requests(method="POST")) == 1
+    assert client.token_age is not None
+
+    client._token_time -= CLIENT_TOKEN_MAX_AGE
+
+    await asyncio.gather(client.get("misystem/status"), client.get("misystem/led"))
+
+    assert len(httpx_mock.get_requests(method="POST")) == 2
+    assert client.token_age < CLIENT_TOKEN_MAX_AGE  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_token_retry(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
+    """Retry on auth failure test"""
+
+    httpx_mock.add_response(
+        text=load_fixture("login_data.json"), method="POST", is_reusable=True
+    )
+    httpx_mock.add_response(
+        text='{"code": 401, "msg": "Invalid token"}', status_code=401, method="GET"
+    )
+    httpx_mock.add_response(text='{"code": 0}', method="GET")
+
+    client: LuciClient = LuciClient(
+        get_async_client(hass, False), f"{MOCK_IP_ADDRESS}/", "test"
+    )
+
+    await client.login()
+
+    assert await client.get("misystem/status") == {"code": 0}
+    assert len(httpx_mock.get_requests(method="POST")) == 2
+    assert len(httpx_mock.get_requests(method="GET")) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_single_flight(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
+    """Concurrent identical requests test"""
+
+    httpx_mock.add_response(text=load_fixture("login_data.json"), method="POST")
+    httpx_mock.add_response(text='{"code": 0}', method="GET", is_reusable=True)
+
+    client: LuciClient = LuciClient(
+        get_async_client(hass, False), f"{MOCK_IP_ADDRESS}/", "test"
+    )
+
+    await client.login()
+
+    first, second = await asyncio.gather(
+        client.get("misystem/status"), client.get("misystem/status")
+    )
+
+    assert first == second == {"code": 0}
+    assert first is not second
+    assert len(httpx_mock.get_requests(method="GET")) == 1
+    assert not client._requests
+
+    await client.get("misystem/status")
+
+    assert len(httpx_mock.get_requests(method="GET")) == 2
+
+    async def _mutate() -> dict:
+        data: dict = await client.get("misystem/status")
+        data["code"] = 1
+
+        return data
+
+    mutated, copied = await asyncio.gather(_mutate(), client.get("misystem/status"))
+
+    assert mutated == {"code": 1}
+    assert copied == {"code": 0}
+    assert len(httpx_mock.get_requests(method="GET")) == 3
+
+    await asyncio.gather(
+        client.get("misystem/status"),
+        client.get("misystem/status", errors={1: "Error"}),
+    )
+
+    assert len(httpx_mock.get_requests(method="GET")) == 5
+
+
 @pytest.mark.asyncio
 async def test_get_without_token(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
     """get test"""
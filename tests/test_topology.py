@@ -0,0 +1,133 @@
+"""Tests for the miwifi component."""
+
+# pylint: disable=no-member,too-many-statements,protected-access,too-many-lines
+
+from __future__ import annotations
+
+import json
+import logging
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from homeassistant.const import CONF_DEVICE_ID, CONF_TYPE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from pytest_homeassistant_custom_component.common import (
+    async_capture_events,
+    load_fixture,
+)
+
+from custom_components.miwifi.const import (
+    ATTR_DEVICE_MAC_ADDRESS,
+    DOMAIN,
+    EVENT_LUCI,
+    EVENT_TYPE_TOPOLOGY_BACKHAUL_CHANGED,
+    EVENT_TYPE_TOPOLOGY_NODE_JOINED,
+    EVENT_TYPE_TOPOLOGY_NODE_LEFT,
+    EVENT_TYPE_TOPOLOGY_PARENT_CHANGED,
+)
+from custom_components.miwifi.topology import diff_topology, parse_topology
+from custom_components.miwifi.updater import LuciUpdater
+from tests.setup import async_mock_updater_luci_client, async_setup
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def test_parse_topology() -> None:
+    """Parse topology test"""
+
+    topo_data: dict = json.loads(load_fixture("topo_graph_sub_leaf_data.json"))
+    topo_data["graph"]["mac"] = "00:00:00:00:00:00"
+
+    nodes = parse_topology(topo_data)
+
+    assert list(nodes) == [
+        "00:00:00:00:00:00",
+        "192.168.31.62",
+        "192.168.31.162",
+        "192.168.31.199",
+    ]
+    assert nodes["00:00:00:00:00:00"].parent is None
+    assert nodes["192.168.31.62"].parent == "00:00:00:00:00:00"
+    assert nodes["192.168.31.162"].parent == "192.168.31.62"
+
+    assert not parse_topology(None)
+    assert not parse_topology({"graph": []})
+
+
+def test_diff_topology() -> None:
+    """Diff topology test"""
+
+    topo_data: dict = json.loads(load_fixture("topo_graph_sub_leaf_data.json"))
+    previous = parse_topology(topo_data)
+
+    assert not diff_topology(previous, parse_topology(topo_data))
+
+    leaf: dict = topo_data["graph"]["leafs"][0]
+    moved: dict = leaf["leafs"].pop(0)
+    moved["backhaul"] = "wired"
+    topo_data["graph"]["leafs"].append(moved)
+    leaf["leafs"].pop()
+    topo_data["graph"]["leafs"].append({"ip": "192.168.31.77", "name": "New"})
+
+    deltas = diff_topology(previous, parse_topology(topo_data))
+
+    assert [(event_type, data["node"]) for event_type, data in deltas] == [
+        (EVENT_TYPE_TOPOLOGY_PARENT_CHANGED, "192.168.31.162"),
+        (EVENT_TYPE_TOPOLOGY_BACKHAUL_CHANGED, "192.168.31.162"),
+        (EVENT_TYPE_TOPOLOGY_NODE_JOINED, "192.168.31.77"),
+        (EVENT_TYPE_TOPOLOGY_NODE_LEFT, "192.168.31.199"),
+    ]
+    assert deltas[0][1]["old_parent"] == "192.168.31.62"
+    assert deltas[0][1]["parent"] == "192.168.31.1"
+
+
+@pytest.mark.asyncio
+async def test_updater_topology_events(hass: HomeAssistant) -> None:
+    """Updater topology events test"""
+
+    with patch("custom_components.miwifi.updater.LuciClient") as mock_luci_client:
+        await async_mock_updater_luci_client(mock_luci_client)
+
+        setup_data: list = await async_setup(hass)
+
+        updater: LuciUpdater = setup_data[0]
+        events = async_capture_events(hass, EVENT_LUCI)
+
+        await updater.async_config_entry_first_refresh()
+        await hass.async_block_till_done()
+
+        device = dr.async_get(hass).async_get_or_create(
+            config_entry_id=setup_data[1].entry_id,
+            identifiers={(DOMAIN, updater.data[ATTR_DEVICE_MAC_ADDRESS])},
+        )
+
+        luci = mock_luci_client.return_value
+
+        assert luci.topo_graph.call_count == 1
+        assert updater.topology is not None
+        assert not events
+
+        await updater.async_refresh()
+
+        assert luci.topo_graph.call_count == 2
+        assert not events
+
+        luci.topo_graph.return_value = json.loads(
+            load_fixture("topo_graph_sub_leaf_data.json")
+        )
+
+        await updater.async_refresh()
+        await hass.async_block_till_done()
+
+        assert luci.topo_graph.call_count == 3
+        assert {event.data[CONF_TYPE] for event in events} == {
+            EVENT_TYPE_TOPOLOGY_NODE_JOINED
+        }
+        assert {event.data["node"] for event in events} == {
+            "192.168.31.162",
+            "192.168.31.199",
+        }
+        assert all(event.data[CONF_DEVICE_ID] == device.id for event in events)
+
+        await updater.async_stop()
@@ -72,10 +72,9 @@ async def test_init(hass: HomeAssistant) -> None:
     ), patch(
         "custom_components.miwifi.update.asyncio.sleep", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket:
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ):
         await async_mock_luci_client(mock_luci_client)
 
         setup_data: list = await async_setup(hass)
@@ -111,10 +110,9 @@ async def test_init_unsupported(hass: HomeAssistant) -> None:
     ), patch(
         "custom_components.miwifi.update.asyncio.sleep", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket:
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ):
         await async_mock_luci_client(mock_luci_client)
 
         mock_luci_client.return_value.rom_update = AsyncMock(
@@ -154,10 +152,9 @@ async def test_update(hass: HomeAssistant) -> None:
     ), patch(
         "custom_components.miwifi.update.asyncio.sleep", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket:
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ):
         await async_mock_luci_client(mock_luci_client)
 
         setup_data: list = await async_setup(hass)
@@ -210,10 +207,9 @@ async def test_need_update(hass: HomeAssistant) -> None:
     ), patch(
         "custom_components.miwifi.update.asyncio.sleep", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket:
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ):
         await async_mock_luci_client(mock_luci_client)
 
         def _off() -> dict:
@@ -285,10 +281,9 @@ async def test_release_notes(hass: HomeAssistant) -> None:
     ), patch(
         "custom_components.miwifi.update.asyncio.sleep", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket:
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ):
         await async_mock_luci_client(mock_luci_client)
 
         setup_data: list = await async_setup(hass)
@@ -327,10 +322,9 @@ async def test_install(hass: HomeAssistant) -> None:
     ), patch(
         "custom_components.miwifi.update.asyncio.sleep", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket:
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ):
         await async_mock_luci_client(mock_luci_client)
 
         def _off() -> dict:
@@ -407,10 +401,9 @@ async def test_install_flash_error(hass: HomeAssistant) -> None:
     ), patch(
         "custom_components.miwifi.update.asyncio.sleep", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket:
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ):
         await async_mock_luci_client(mock_luci_client)
 
         def _off() -> dict:
@@ -478,10 +471,9 @@ async def test_install_error(hass: HomeAssistant) -> None:
     ), patch(
         "custom_components.miwifi.update.asyncio.sleep", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket:
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ):
         await async_mock_luci_client(mock_luci_client)
 
         def _off() -> dict:
@@ -4,8 +4,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+from datetime import timedelta
 from typing import Final
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -15,11 +17,17 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
 from homeassistant.helpers.storage import Store
 from httpx import codes
-from pytest_homeassistant_custom_component.common import MockConfigEntry, load_fixture
+from homeassistant.util import utcnow
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+    load_fixture,
+)
 
 from custom_components.miwifi.const import (
     ATTR_BINARY_SENSOR_DUAL_BAND,
     ATTR_BINARY_SENSOR_WAN_STATE,
+    ATTR_DEVICE_MAC_ADDRESS,
     ATTR_LIGHT_LED,
     ATTR_SELECT_WIFI_2_4_CHANNEL,
     ATTR_SELECT_WIFI_2_4_CHANNELS,
@@ -35,6 +43,12 @@ from custom_components.miwifi.const import (
     ATTR_SWITCH_WIFI_5_0,
     ATTR_SWITCH_WIFI_5_0_GAME,
     ATTR_SWITCH_WIFI_GUEST,
+    ATTR_TRACKER_ENTRY_ID,
+    ATTR_TRACKER_INTERNET_BLOCKED,
+    ATTR_TRACKER_LAST_ACTIVITY,
+    ATTR_TRACKER_MAC,
+    ATTR_TRACKER_NAME,
+    ATTR_TRACKER_ONLINE,
     ATTR_UPDATE_CURRENT_VERSION,
     ATTR_UPDATE_DOWNLOAD_URL,
     ATTR_UPDATE_FILE_HASH,
@@ -47,16 +61,35 @@ from custom_components.miwifi.const import (
     ATTR_WIFI_5_0_DATA,
     ATTR_WIFI_5_0_GAME_DATA,
     ATTR_WIFI_GUEST_DATA,
+    DEFAULT_DEVICE_SAVE_DELAY,
     DEFAULT_MANUFACTURER,
+    DEFAULT_MEDIUM_SCAN_INTERVAL,
     DEFAULT_NAME,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SLOW_SCAN_INTERVAL,
+    DEFAULT_STAGE_CONCURRENCY,
+    DEFAULT_STAGE_REFRESH_COOLDOWN,
     DOMAIN,
+    UPDATER,
 )
 from custom_components.miwifi.enum import Mode
 from custom_components.miwifi.exceptions import LuciError, LuciRequestError
 from custom_components.miwifi.luci import LuciClient
-from custom_components.miwifi.updater import LuciUpdater, async_get_updater
-from tests.setup import MultipleSideEffect, async_mock_luci_client, async_setup
+from custom_components.miwifi.metrics import add_network_time
+from custom_components.miwifi.updater import (
+    DeviceRecord,
+    IntegrationRegistry,
+    LuciUpdater,
+    async_get_integrations,
+    async_get_registry,
+    async_get_updater,
+)
+from tests.setup import (
+    MultipleSideEffect,
+    async_mock_luci_client,
+    async_mock_updater_luci_client,
+    async_setup,
+)
 
 MOCK_IP_ADDRESS: Final = "192.168.31.1"
 MOCK_PASSWORD: Final = "**REDACTED**"
@@ -885,12 +918,11 @@ async def test_get_updater_by_ip_error(hass: HomeAssistant) -> None:
     ) as mock_luci_client, patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.device_tracker.socket.socket"
-    ) as mock_socket, patch(
+        "custom_components.miwifi.device_tracker.PortProber._async_is_open",
+        return_value=False,
+    ), patch(
         "custom_components.miwifi.updater.asyncio.sleep", return_value=None
     ):
-        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
-
         await async_mock_luci_client(mock_luci_client)
 
         setup_data: list = await async_setup(hass)
@@ -904,3 +936,541 @@ async def test_get_updater_by_ip_error(hass: HomeAssistant) -> None:
             async_get_updater(hass, "test")
 
         assert str(error.value) == "Integration with identifier: test not found."
+
+
+@pytest.mark.asyncio
+async def test_updater_concurrent_stages(hass: HomeAssistant) -> None:
+    """Test updater runs independent stages concurrently.
+
+    :param hass: HomeAssistant
+    """
+
+    calls: list[str] = []
+    in_flight: list[int] = [0, 0]
+
+    def record(name: str, mock: AsyncMock) -> None:
+        """Record start and end of a luci call.
+
+        :param name: str
+        :param mock: AsyncMock
+        """
+
+        return_value = mock.return_value
+        side_effect = mock.side_effect
+
+        async def _call(*args, **kwargs):
+            calls.append(f"start:{name}")
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+
+            await asyncio.sleep(0)
+
+            in_flight[0] -= 1
+            calls.append(f"end:{name}")
+
+            return await side_effect(*args) if side_effect else return_value
+
+        mock.side_effect = _call
+
+    with patch("custom_components.miwifi.updater.LuciClient") as mock_luci_client:
+        await async_mock_updater_luci_client(mock_luci_client)
+
+        for name in (
+            "status",
+            "vpn_status",
+            "rom_update",
+            "wan_info",
+            "led",
+            "wifi_detail_all",
+            "avaliable_channels",
+        ):
+            record(name, getattr(mock_luci_client.return_value, name))
+
+        setup_data: list = await async_setup(hass)
+
+        updater: LuciUpdater = setup_data[0]
+
+        await updater.async_config_entry_first_refresh()
+        await hass.async_block_till_done()
+
+    assert updater.last_update_success
+    assert 1 < in_flight[1] <= DEFAULT_STAGE_CONCURRENCY
+    assert calls.index("end:status") < calls.index("start:rom_update")
+    assert calls.index("end:wifi_detail_all") < calls.index(
+        "start:avaliable_channels"
+    )
+
+
+@pytest.mark.asyncio
+async def test_updater_topo_waits_for_status(hass: HomeAssistant) -> None:
+    """Test topology stage reads the router mac written by the status stage.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.miwifi.updater.LuciClient") as mock_luci_client:
+        await async_mock_updater_luci_client(mock_luci_client)
+
+        status: dict = await mock_luci_client.return_value.status()
+
+        async def slow_status() -> dict:
+            await asyncio.sleep(0.05)
+
+            return status
+
+        mock_luci_client.return_value.status = AsyncMock(side_effect=slow_status)
+
+        setup_data: list = await async_setup(hass)
+
+        updater: LuciUpdater = setup_data[0]
+
+        await updater.async_config_entry_first_refresh()
+        await hass.async_block_till_done()
+
+    assert updater.last_update_success
+    assert updater.data["topo_graph"]["graph"]["mac"] == updater.data[
+        ATTR_DEVICE_MAC_ADDRESS
+    ]
+
+
+@pytest.mark.asyncio
+async def test_updater_stage_cadence(hass: HomeAssistant) -> None:
+    """Test updater reuses slow stage data between refreshes.
+
+    :param hass: HomeAssistant
+    """
+
+    def age_stages(updater: LuciUpdater, seconds: int) -> None:
+        """Move stage update times into the past.
+
+        :param updater: LuciUpdater
+        :param seconds: int
+        """
+
+        for method in updater._stage_updated:
+            updater._stage_updated[method] -= seconds
+
+    with patch("custom_components.miwifi.updater.LuciClient") as mock_luci_client:
+        await async_mock_updater_luci_client(mock_luci_client)
+
+        setup_data: list = await async_setup(hass)
+
+        updater: LuciUpdater = setup_data[0]
+
+        await updater.async_config_entry_first_refresh()
+        await hass.async_block_till_done()
+
+        luci = mock_luci_client.return_value
+
+        assert luci.status.call_count == 1
+        assert luci.led.call_count == 1
+        assert luci.rom_update.call_count == 1
+
+        age_stages(updater, DEFAULT_SCAN_INTERVAL)
+        await updater.async_refresh()
+
+        assert luci.status.call_count == 2
+        assert luci.wan_info.call_count == 2
+        assert luci.led.call_count == 1
+        assert luci.wifi_detail_all.call_count == 1
+        assert luci.rom_update.call_count == 1
+        assert updater.data[ATTR_LIGHT_LED]
+
+        age_stages(updater, DEFAULT_MEDIUM_SCAN_INTERVAL)
+        await updater.async_refresh()
+
+        assert luci.led.call_count == 2
+        assert luci.wifi_detail_all.call_count == 2
+        assert luci.rom_update.call_count == 1
+
+        age_stages(updater, DEFAULT_SLOW_SCAN_INTERVAL)
+        await updater.async_refresh()
+
+        assert luci.rom_update.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_updater_coalesced_stage_refresh(hass: HomeAssistant) -> None:
+    """Test updater coalesces stage refresh requests.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.miwifi.updater.LuciClient") as mock_luci_client:
+        await async_mock_updater_luci_client(mock_luci_client)
+
+        setup_data: list = await async_setup(hass)
+
+        updater: LuciUpdater = setup_data[0]
+
+        await updater.async_config_entry_first_refresh()
+        await hass.async_block_till_done()
+
+        luci = mock_luci_client.return_value
+
+        for _ in range(10):
+            updater.async_request_stage_refresh("wifi")
+
+        updater.async_request_stage_refresh("led")
+
+        assert luci.wifi_detail_all.call_count == 1
+        assert luci.led.call_count == 1
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=DEFAULT_STAGE_REFRESH_COOLDOWN + 1)
+        )
+        await hass.async_block_till_done()
+
+        assert luci.wifi_detail_all.call_count == 2
+        assert luci.led.call_count == 2
+        assert luci.status.call_count == 1
+        assert luci.rom_update.call_count == 1
+
+        updater.async_request_stage_refresh("led")
+        await updater.async_refresh_stages("topo")
+
+        assert luci.topo_graph.call_count == 2
+        assert luci.led.call_count == 3
+        assert luci.status.call_count == 1
+
+        await updater.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_updater_mac_filter(hass: HomeAssistant) -> None:
+    """Test updater fetches the MAC filter once and refreshes it on demand.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.miwifi.updater.LuciClient") as mock_luci_client:
+        await async_mock_updater_luci_client(mock_luci_client)
+
+        mock_luci_client.return_value.macfilter_info = AsyncMock(
+            return_value={
+                "flist": [
+                    {"mac": "00:00:00:00:00:01", "authority": {"wan": 0}},
+                    {"mac": "00:00:00:00:00:02", "authority": {"wan": 1}},
+                ]
+            }
+        )
+
+        setup_data: list = await async_setup(hass)
+
+        updater: LuciUpdater = setup_data[0]
+
+        await updater.async_config_entry_first_refresh()
+        await hass.async_block_till_done()
+
+        luci = mock_luci_client.return_value
+
+        assert luci.macfilter_info.call_count == 1
+        assert updater.devices["00:00:00:00:00:01"][ATTR_TRACKER_INTERNET_BLOCKED]
+        assert not updater.devices["00:00:00:00:00:02"][
+            ATTR_TRACKER_INTERNET_BLOCKED
+        ]
+
+        await updater.async_refresh()
+
+        assert luci.macfilter_info.call_count == 1
+
+        luci.macfilter_info.return_value = {}
+        updater.async_request_stage_refresh("mac_filter", "devices", "device_list")
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=DEFAULT_STAGE_REFRESH_COOLDOWN + 1)
+        )
+        await hass.async_block_till_done()
+
+        assert luci.macfilter_info.call_count == 2
+        assert not updater.devices["00:00:00:00:00:01"][
+            ATTR_TRACKER_INTERNET_BLOCKED
+        ]
+
+        await updater.async_stop()
+
+
+def test_device_record() -> None:
+    """Test device record keeps raw values and formats on read."""
+
+    record = DeviceRecord(
+        {
+            ATTR_TRACKER_MAC: "00:00:00:00:00:01",
+            ATTR_TRACKER_ONLINE: "1 day, 8:05:01",
+            ATTR_TRACKER_LAST_ACTIVITY: "2022-04-25T22:33:39",
+            "custom": 1,
+        }
+    )
+
+    assert not hasattr(record, "__dict__")
+    assert record.raw(ATTR_TRACKER_ONLINE) == 86400 + 8 * 3600 + 5 * 60 + 1
+    assert isinstance(record.raw(ATTR_TRACKER_LAST_ACTIVITY), int)
+    assert record == {
+        ATTR_TRACKER_MAC: "00:00:00:00:00:01",
+        ATTR_TRACKER_ONLINE: "1 day, 8:05:01",
+        ATTR_TRACKER_LAST_ACTIVITY: "2022-04-25T22:33:39",
+        "custom": 1,
+    }
+    assert ATTR_TRACKER_NAME not in record
+    assert record.get(ATTR_TRACKER_NAME) is None
+
+    record |= {ATTR_TRACKER_NAME: "Device", ATTR_TRACKER_ONLINE: 5}
+
+    assert record[ATTR_TRACKER_NAME] == "Device"
+    assert record[ATTR_TRACKER_ONLINE] == "0:00:05"
+    assert record.snapshot((ATTR_TRACKER_NAME, ATTR_TRACKER_ONLINE)) == ("Device", 5)
+    assert len(record) == 5
+
+    del record["custom"]
+    del record[ATTR_TRACKER_NAME]
+
+    assert list(record) == [
+        ATTR_TRACKER_MAC,
+        ATTR_TRACKER_ONLINE,
+        ATTR_TRACKER_LAST_ACTIVITY,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_updater_device_store(hass: HomeAssistant, hass_storage) -> None:
+    """Test updater saves changed devices with a delay in compact form.
+
+    :param hass: HomeAssistant
+    :param hass_storage: dict
+    """
+
+    with patch("custom_components.miwifi.updater.LuciClient") as mock_luci_client:
+        await async_mock_updater_luci_client(mock_luci_client)
+
+        setup_data: list = await async_setup(hass)
+
+        updater: LuciUpdater = setup_data[0]
+        key: str = f"{DOMAIN}/{MOCK_IP_ADDRESS}.json"
+
+        await updater.async_config_entry_first_refresh()
+        await hass.async_block_till_done()
+
+        assert key not in hass_storage
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=DEFAULT_DEVICE_SAVE_DELAY + 1)
+        )
+        await hass.async_block_till_done()
+
+        stored: dict = hass_storage[key]["data"]
+
+        assert stored.keys() == updater.devices.keys()
+
+        device: dict = stored["00:00:00:00:00:01"]
+
+        assert ATTR_TRACKER_MAC not in device
+        assert ATTR_TRACKER_ENTRY_ID not in device
+        assert isinstance(device[ATTR_TRACKER_LAST_ACTIVITY], int)
+        assert (
+            updater._expand_device("00:00:00:00:00:01", device)
+            == updater.devices["00:00:00:00:00:01"]
+        )
+
+        with patch.object(
+            updater, "_compact_device", wraps=updater._compact_device
+        ) as mock_compact:
+            updater.devices["00:00:00:00:00:01"][ATTR_TRACKER_NAME] = "Renamed"
+            updater._seen_devices = set(updater.device_changes.present)
+            updater._diff_devices()
+            await updater._async_save_devices()
+
+            assert mock_compact.call_count == 1
+
+        assert hass_storage[key]["data"]["00:00:00:00:00:01"][ATTR_TRACKER_NAME] == (
+            "Renamed"
+        )
+
+        written: dict = updater._devices_to_store()
+
+        assert (
+            written["00:00:00:00:00:01"]
+            is not updater._stored_devices["00:00:00:00:00:01"]
+        )
+
+        await updater.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_updater_device_changes(hass: HomeAssistant) -> None:
+    """Test updater publishes only changed devices.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.miwifi.updater.LuciClient") as mock_luci_client:
+        await async_mock_updater_luci_client(mock_luci_client)
+
+        setup_data: list = await async_setup(hass)
+
+        updater: LuciUpdater = setup_data[0]
+
+        await updater.async_config_entry_first_refresh()
+        await hass.async_block_till_done()
+
+        changes = updater.device_changes
+
+        assert changes is not None
+        assert len(updater.devices) > 0
+        assert changes.new == changes.present
+        assert not changes.changed and not changes.gone
+
+        present: set[str] = changes.present
+
+        await updater.async_refresh()
+
+        changes = updater.device_changes
+        mac: str = next(iter(present))
+
+        assert len(changes) == 0
+        assert changes.present == present
+        assert mac not in changes
+
+        device_list: dict = json.loads(load_fixture("device_list_data.json"))
+        device_list["list"] = [
+            device | {"name": "Renamed"} if device["mac"] == mac else device
+            for device in device_list["list"]
+            if device["mac"] == mac
+        ]
+        mock_luci_client.return_value.device_list = AsyncMock(
+            return_value=device_list
+        )
+        mock_luci_client.return_value.wifi_connect_devices = AsyncMock(
+            return_value={"list": []}
+        )
+
+        await updater.async_refresh()
+
+        changes = updater.device_changes
+
+        assert changes.changed == {mac: {"name"}}
+        assert changes.gone == present - {mac}
+        assert not changes.new
+
+
+@pytest.mark.asyncio
+async def test_updater_registry(hass: HomeAssistant) -> None:
+    """Test integration registry indices.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.miwifi.updater.LuciClient") as mock_luci_client:
+        await async_mock_updater_luci_client(mock_luci_client)
+
+        setup_data: list = await async_setup(hass)
+
+        updater: LuciUpdater = setup_data[0]
+        config_entry: MockConfigEntry = setup_data[1]
+
+        await updater.async_config_entry_first_refresh()
+        await hass.async_block_till_done()
+
+    registry: IntegrationRegistry = async_get_registry(hass)
+    mac: str = next(iter(updater.devices))
+
+    assert async_get_integrations(hass) == {
+        MOCK_IP_ADDRESS: {UPDATER: updater, ATTR_TRACKER_ENTRY_ID: config_entry.entry_id}
+    }
+    assert async_get_updater(hass, MOCK_IP_ADDRESS) == updater
+    assert async_get_updater(hass, config_entry.entry_id) == updater
+    assert registry.get_by_router_mac(updater.data[ATTR_DEVICE_MAC_ADDRESS]) == updater
+    assert registry.get_client_updaters(mac) == {updater}
+
+    registry.async_unregister(config_entry.entry_id)
+
+    assert not async_get_integrations(hass)
+    assert registry.get_by_router_mac(updater.data[ATTR_DEVICE_MAC_ADDRESS]) is None
+    assert not registry.get_client_updaters(mac)
+
+    with pytest.raises(ValueError):
+        async_get_updater(hass, MOCK_IP_ADDRESS)
+
+
+@pytest.mark.asyncio
+async def test_updater_mass_update_device(hass: HomeAssistant) -> None:
+    """Test mass update touches only updaters tracking the device.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.miwifi.updater.LuciClient") as mock_luci_client:
+        await async_mock_luci_client(mock_luci_client)
+
+        first: LuciUpdater = (await async_setup(hass, "192.168.31.1"))[0]
+        second: LuciUpdater = (await async_setup(hass, "192.168.31.2"))[0]
+        third: LuciUpdater = (await async_setup(hass, "192.168.31.3"))[0]
+
+    mac: str = "00:00:00:00:00:AA"
+    device: dict = {ATTR_TRACKER_MAC: mac, ATTR_TRACKER_ENTRY_ID: "entry"}
+
+    second.devices[mac] = DeviceRecord(
+        {ATTR_TRACKER_MAC: mac, ATTR_TRACKER_NAME: "Old"}
+    )
+    async_get_registry(hass).async_add_client(mac, second)
+
+    assert first._mass_update_device(
+        device | {"name": "New"}, async_get_integrations(hass)
+    )
+    assert second.devices[mac][ATTR_TRACKER_NAME] == "New"
+    assert isinstance(second.devices[mac].raw(ATTR_TRACKER_LAST_ACTIVITY), int)
+    assert mac not in third.devices
+    assert mac not in first.devices
+
+    assert not first._mass_update_device(
+        {ATTR_TRACKER_MAC: "00:00:00:00:00:BB", ATTR_TRACKER_ENTRY_ID: "entry"},
+        async_get_integrations(hass),
+    )
+
+
+@pytest.mark.asyncio
+async def test_updater_stage_profiler(hass: HomeAssistant) -> None:
+    """Test updater records network wait and processing per stage.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.miwifi.updater.LuciClient") as mock_luci_client:
+        await async_mock_updater_luci_client(mock_luci_client)
+
+        status: dict = mock_luci_client.return_value.status.return_value
+
+        async def _status() -> dict:
+            await asyncio.sleep(0.02)
+            add_network_time(0.02)
+
+            return status
+
+        mock_luci_client.return_value.status.side_effect = _status
+
+        setup_data: list = await async_setup(hass)
+
+        updater: LuciUpdater = setup_data[0]
+
+        await updater.async_config_entry_first_refresh()
+        await hass.async_block_till_done()
+
+        await updater.async_refresh_stages("led")
+
+    assert updater.last_update_success
+
+    profile: dict = updater.profiler.as_dict()
+
+    assert profile["status"]["total"]["samples"] == 1
+    assert profile["status"]["network"]["p50"] == 0.02
+    assert profile["status"]["total"]["p50"] >= 0.02
+    assert profile["wan"]["network"]["p50"] == 0
+
+    assert [refresh["partial"] for refresh in updater.profiler.refreshes] == [
+        False,
+        True,
+    ]
+    assert list(updater.profiler.refreshes[1]["stages"]) == ["led"]
+    assert " full total " in updater.profiler.dump(5)
+    assert " partial total " in updater.profiler.dump(1)
+    assert "status" in updater.profiler.dump(5)
+    assert "network 20 ms" in updater.profiler.dump(5)